@@ -0,0 +1,91 @@
+"""Connect-to-first-sample time: sequential vs concurrent subscription
+
+Connects to the simulated glove, runs DeviceManager.start_services with the
+real presenters (views replaced by no-op stand-ins) and measures how long it
+takes until the first IMU1 sample reaches the ring buffer, in both
+AppConfig.SUBSCRIBE_MODE settings. Every simulated GATT operation takes
+AppConfig.SIM_GATT_LATENCY seconds and operations of one link are serialized
+like ATT requests, so the difference measured is the settle delays, not
+parallel requests on the air.
+
+Run from the repository root:
+    python -m benchmarks.connect_time
+"""
+import asyncio
+import statistics
+import time
+
+from src.config.app_config import AppConfig
+from src.model.ble_service import BLEDeviceInfo
+from src.model.device_manager import DeviceManager
+from src.model.esp32_service import ESP32BLEService
+from src.model.simulator import SimulatedDevice
+from src.presenter.gamepad_presenter import GamepadPresenter
+from src.presenter.imu_presenter import IMUPresenter
+from src.presenter.overall_status_presenter import OverallStatusPresenter
+from src.presenter.sensor_presenter import SensorPresenter
+from src.presenter.timestamp_presenter import TimestampPresenter
+
+RUNS = 3
+MODES = ("sequential", "concurrent")
+
+
+class NullView:
+    """View stand-in accepting every call"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def build_presenters(service, loop):
+    return {
+        'overall_status': OverallStatusPresenter(NullView(), service),
+        'timestamp': TimestampPresenter(NullView(), service, service.TIMESTAMP_CHAR_UUID),
+        'connection': NullView(),
+        'imu1': IMUPresenter(NullView(), service, service.IMU1_CHAR_UUID, loop),
+        'imu2': IMUPresenter(NullView(), service, service.IMU2_CHAR_UUID, loop),
+        'sensor': SensorPresenter(NullView(), service, loop),
+        'gamepad': GamepadPresenter(NullView(), service, loop),
+    }
+
+
+async def run_once(manager, service):
+    """Connect, start services and wait for the first IMU1 sample
+
+    Returns:
+        (connect, start_services, connect-to-first-sample) in seconds
+    """
+    device = SimulatedDevice.advertised()[0]
+    reader = service.buffers[service.IMU1_CHAR_UUID].reader()
+    start = time.perf_counter()
+    if not await service.connect(BLEDeviceInfo(device.address, device.name)):
+        raise RuntimeError("could not connect to the simulated glove")
+    connected = time.perf_counter()
+    if not await manager.start_services():
+        raise RuntimeError("start_services failed")
+    started = time.perf_counter()
+    while not len(reader.read()):
+        await asyncio.sleep(0.001)
+    first_sample = time.perf_counter()
+    await manager.cleanup()
+    await service.disconnect()
+    return connected - start, started - connected, first_sample - start
+
+
+async def main():
+    config = AppConfig()
+    config.BLE_BACKEND = "simulated"
+    service = ESP32BLEService()
+    manager = DeviceManager(service, build_presenters(service, asyncio.get_running_loop()))
+
+    print(f"Simulated GATT latency {config.SIM_GATT_LATENCY * 1000:.0f} ms, {RUNS} runs per mode")
+    for mode in MODES:
+        config.SUBSCRIBE_MODE = mode
+        results = [await run_once(manager, service) for _ in range(RUNS)]
+        connect, subscribe, first = (statistics.fmean(column) for column in zip(*results))
+        print(f"{mode:>10}  connect {connect:5.2f} s  start_services {subscribe:5.2f} s  "
+              f"connect-to-first-sample {first:5.2f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
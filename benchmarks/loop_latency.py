@@ -0,0 +1,119 @@
+"""Notification-to-handler latency: Tk-pumped asyncio loop vs asyncio thread
+
+A producer thread stands in for the BLE backend and delivers notifications to
+the loop with call_soon_threadsafe. The handler records when it ran on the
+loop and when its result reached the UI thread through EventLoopBridge. A
+small after() scheduler replaces the Tk main loop so the script runs headless.
+
+Run from the repository root:
+    python -m benchmarks.loop_latency
+"""
+import asyncio
+import heapq
+import itertools
+import statistics
+import threading
+import time
+
+from src.presenter.event_loop_bridge import EventLoopBridge
+
+RATE_HZ = 200
+DURATION = 3.0
+IDLE_DURATION = 2.0
+
+
+class AfterScheduler:
+    """Minimal stand-in for the Tk main loop: after(), after_cancel(), mainloop()"""
+
+    def __init__(self):
+        self._timers = []
+        self._ids = itertools.count()
+        self._cancelled = set()
+
+    def after(self, ms, callback):
+        timer_id = next(self._ids)
+        heapq.heappush(self._timers, (time.perf_counter() + ms / 1000, timer_id, callback))
+        return timer_id
+
+    def after_cancel(self, timer_id):
+        self._cancelled.add(timer_id)
+
+    def mainloop(self, duration):
+        end = time.perf_counter() + duration
+        while self._timers:
+            deadline, timer_id, callback = self._timers[0]
+            if deadline > end:
+                break
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+            heapq.heappop(self._timers)
+            if timer_id not in self._cancelled:
+                callback()
+        time.sleep(max(0.0, end - time.perf_counter()))
+
+
+def run_mode(mode, rate_hz):
+    """Measure latencies for one mode
+
+    Returns:
+        (loop latencies, ui latencies, process CPU seconds) with latencies in ms
+    """
+    loop = asyncio.new_event_loop()
+    window = AfterScheduler()
+    bridge = EventLoopBridge(loop, window, mode)
+    loop_latency = []
+    ui_latency = []
+
+    def on_ui(sent):
+        ui_latency.append((time.perf_counter() - sent) * 1000)
+
+    def handler(sent):
+        loop_latency.append((time.perf_counter() - sent) * 1000)
+        bridge.call_in_ui(on_ui, sent)
+
+    stop = threading.Event()
+
+    def produce():
+        interval = 1 / rate_hz
+        while not stop.wait(interval):
+            loop.call_soon_threadsafe(handler, time.perf_counter())
+
+    producer = threading.Thread(target=produce, daemon=True) if rate_hz else None
+    bridge.start()
+    if producer:
+        producer.start()
+    cpu = time.process_time()
+    window.mainloop(DURATION if rate_hz else IDLE_DURATION)
+    cpu = time.process_time() - cpu
+    stop.set()
+    if producer:
+        producer.join()
+    bridge.stop()
+    loop.close()
+    return loop_latency, ui_latency, cpu
+
+
+def describe(latencies):
+    if not latencies:
+        return "no samples"
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (f"mean {statistics.fmean(ordered):6.2f}  p50 {statistics.median(ordered):6.2f}  "
+            f"p99 {p99:6.2f}  max {ordered[-1]:6.2f} ms")
+
+
+def main():
+    print(f"{RATE_HZ} notifications/s for {DURATION:.0f} s")
+    for mode in (EventLoopBridge.PUMP, EventLoopBridge.THREAD):
+        loop_latency, ui_latency, cpu = run_mode(mode, RATE_HZ)
+        print(f"{mode:>6}  handler  {describe(loop_latency)}  ({len(loop_latency)} samples)")
+        print(f"{'':>6}  UI       {describe(ui_latency)}")
+        print(f"{'':>6}  CPU      {cpu / DURATION * 100:5.1f} % of one core")
+
+    print(f"\nIdle for {IDLE_DURATION:.0f} s")
+    for mode in (EventLoopBridge.PUMP, EventLoopBridge.THREAD):
+        _, _, cpu = run_mode(mode, 0)
+        print(f"{mode:>6}  CPU      {cpu / IDLE_DURATION * 100:5.1f} % of one core")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Multi-glove scaling against the simulated gloves
+
+Connects 1 to 4 simulated gloves through ConnectionPool, each with its own
+ESP32BLEService and SessionRecorder writing to a temporary folder, and
+measures the recorded samples per second and the process CPU time as the
+number of devices grows.
+
+Run from the repository root:
+    python -m benchmarks.pool_scaling
+"""
+import asyncio
+import tempfile
+import time
+
+from src.config.app_config import AppConfig
+from src.model.connection_pool import ConnectionPool
+from src.model.simulator import SimulatedDevice
+
+DEVICE_COUNTS = (1, 2, 3, 4)
+RATE_HZ = 500
+DURATION = 5.0
+
+
+def recorded(pool):
+    """Records written so far by all session recorders"""
+    return sum(
+        sum(session.recorder.get_stats()['records'].values())
+        for session in pool.sessions.values()
+    )
+
+
+async def run_case(count, out_dir):
+    """Stream count gloves at RATE_HZ per stream for DURATION seconds
+
+    Returns:
+        (connected devices, records per second, process CPU seconds per second)
+    """
+    config = AppConfig()
+    config.SIM_DEVICE_COUNT = count
+    pool = ConnectionPool(max_devices=count)
+    addresses = [device.address for device in SimulatedDevice.advertised()]
+    await pool.add_all(addresses, out_dir)
+    try:
+        await asyncio.sleep(1.0)  # Let every stream reach its rate
+        records = recorded(pool)
+        cpu = time.process_time()
+        start = time.monotonic()
+        await asyncio.sleep(DURATION)
+        elapsed = time.monotonic() - start
+        cpu = time.process_time() - cpu
+        return len(pool), (recorded(pool) - records) / elapsed, cpu / elapsed
+    finally:
+        await pool.close()
+
+
+async def main():
+    config = AppConfig()
+    config.BLE_BACKEND = "simulated"
+    config.SIM_RATE_HZ = RATE_HZ
+    config.DEVICE_CACHE_FILE = ""
+    config.CONNECTION_LOG_FILE = ""
+    print(f"{RATE_HZ} Hz per stream, {DURATION:.0f} s per case")
+    baseline = None
+    with tempfile.TemporaryDirectory() as out_dir:
+        for count in DEVICE_COUNTS:
+            connected, rate, cpu = await run_case(count, out_dir)
+            baseline = baseline or rate
+            print(f"{connected} device(s)  {rate:8.0f} records/s  ({rate / baseline:4.2f}x)  "
+                  f"CPU {cpu * 100:5.1f} % of one core")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
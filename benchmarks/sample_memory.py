@@ -0,0 +1,80 @@
+"""Memory cost per decoded sample: legacy dict-based models vs compact Sample types
+
+Run from the repository root:
+    python -m benchmarks.sample_memory
+"""
+import random
+import struct
+import tracemalloc
+
+from src.model.imu import IMUData, IMUEulerData
+
+SAMPLES = 20000
+
+# Two IMUs streaming raw + Euler notifications at 416 Hz for 10 minutes
+SESSION_SAMPLES = 2 * 416 * 60 * 10
+
+
+class LegacyIMUData:
+    """Replica of the original dict-based IMUData layout"""
+
+    def __init__(self, values, raw_data):
+        self.accel = {'x': values[0], 'y': values[1], 'z': values[2]}
+        self.gyro = {'x': values[3], 'y': values[4], 'z': values[5]}
+        self.mag = {'x': values[6], 'y': values[7], 'z': values[8]}
+        self.raw_data = raw_data
+
+
+class LegacyIMUEulerData:
+    """Replica of the original dict-based IMUEulerData layout"""
+
+    def __init__(self, values, raw_data):
+        self.euler = {'yaw': values[0], 'pitch': values[1], 'roll': values[2]}
+        self.calib_status = values[3]
+        self.raw_data = raw_data
+
+
+def make_payloads():
+    """Build realistic raw payloads (bleak hands us bytearrays)"""
+    rng = random.Random(1)
+    imu = [bytearray(struct.pack('<9h', *(rng.randint(-4000, 4000) for _ in range(9))))
+           for _ in range(SAMPLES)]
+    euler = [bytearray(struct.pack('<3fB', *(rng.uniform(-180, 180) for _ in range(3)), 3))
+             for _ in range(SAMPLES)]
+    return imu, euler
+
+
+def measure(build):
+    """Return bytes allocated per sample while holding SAMPLES objects alive"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / SAMPLES
+
+
+def main():
+    imu, euler = make_payloads()
+    imu_struct = struct.Struct('<9h')
+    euler_struct = struct.Struct('<3fB')
+
+    results = {
+        "IMUData legacy": measure(lambda: [LegacyIMUData(imu_struct.unpack(p), p) for p in imu]),
+        "IMUData compact": measure(lambda: [IMUData.from_bytes(p) for p in imu]),
+        "IMUEulerData legacy": measure(lambda: [LegacyIMUEulerData(euler_struct.unpack(p), p) for p in euler]),
+        "IMUEulerData compact": measure(lambda: [IMUEulerData.from_bytes(p) for p in euler]),
+        # Columnar storage for long captures: one structured row per sample
+        "IMU_DTYPE array": measure(lambda: IMUData.from_bytes_batch(imu).copy()),
+        "IMU_EULER_DTYPE array": measure(lambda: IMUEulerData.from_bytes_batch(euler).copy()),
+    }
+
+    print(f"{'Sample type':<24}{'bytes/sample':>14}{'10 min session':>18}")
+    for name, per_sample in results.items():
+        session_mb = per_sample * SESSION_SAMPLES / 1e6
+        print(f"{name:<24}{per_sample:>14.0f}{session_mb:>15.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Ingest throughput against the simulated glove
+
+Connects ESP32BLEService to the in-process simulator, subscribes every data
+stream buffer-only and measures how many samples per second reach the ring
+buffers at increasing per-stream rates, with single-sample notifications and
+with multi-sample frames.
+
+Run from the repository root:
+    python -m benchmarks.sim_throughput
+"""
+import asyncio
+import time
+
+from src.config.app_config import AppConfig
+from src.model.ble_service import BLEDeviceInfo
+from src.model.esp32_service import ESP32BLEService
+from src.model.simulator import SimulatedClient, SimulatedDevice
+
+RATES_HZ = (250, 1000, 2000)
+FRAME_SIZES = (1, 10)
+DURATION = 3.0
+
+STREAMS = ("IMU1_CHAR_UUID", "IMU2_CHAR_UUID", "IMU1_EULER_UUID", "IMU2_EULER_UUID",
+           "FLEX_SENSOR_UUID", "FORCE_SENSOR_UUID", "JOYSTICK_UUID", "BUTTONS_UUID")
+
+
+async def run_case(rate_hz, frame_samples):
+    """Stream every data characteristic at rate_hz for DURATION seconds
+
+    Returns:
+        (samples per second per stream, lowest stream rate, process CPU seconds)
+    """
+    config = AppConfig()
+    config.SIM_RATE_HZ = rate_hz
+    config.SIM_FRAME_SAMPLES = frame_samples
+
+    service = ESP32BLEService()
+    service.set_loop(asyncio.get_running_loop())
+    device = SimulatedDevice.advertised()[0]
+    client = SimulatedClient(device.address)
+    await client.connect()
+    if not await service.attach_client(client, BLEDeviceInfo(device.address, device.name)):
+        raise RuntimeError("could not attach simulated client")
+
+    uuids = [getattr(service, name) for name in STREAMS]
+    readers = {uuid: service.buffers[uuid].reader() for uuid in uuids}
+    for uuid in uuids:
+        await service.start_stream_notify(uuid)
+    for reader in readers.values():
+        reader.read()
+
+    cpu = time.process_time()
+    start = time.monotonic()
+    received = dict.fromkeys(uuids, 0)
+    while time.monotonic() - start < DURATION:
+        await asyncio.sleep(config.SAMPLE_CONSUME_INTERVAL)
+        for uuid, reader in readers.items():
+            received[uuid] += len(reader.read())
+    elapsed = time.monotonic() - start
+    cpu = time.process_time() - cpu
+
+    for uuid in uuids:
+        await service.stop_stream_notify(uuid)
+    await service.disconnect()
+    rates = [count / elapsed for count in received.values()]
+    return sum(rates), min(rates), cpu / elapsed
+
+
+async def main():
+    config = AppConfig()
+    config.SIM_JITTER = 0.0
+    print(f"{len(STREAMS)} streams, {DURATION:.0f} s per case")
+    for frame_samples in FRAME_SIZES:
+        for rate_hz in RATES_HZ:
+            total, slowest, cpu = await run_case(rate_hz, frame_samples)
+            print(f"{rate_hz:5d} Hz/stream  {frame_samples:2d} samples/notification  "
+                  f"total {total:8.0f} samples/s  slowest stream {slowest:7.1f} Hz  "
+                  f"CPU {cpu * 100:5.1f} % of one core")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
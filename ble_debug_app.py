@@ -1,9 +1,12 @@
 import asyncio
 import customtkinter as ctk
-from bleak import BleakClient, BleakScanner
+import argparse
 from src.config.app_config import AppConfig
 from src.view.connection_dialog import ConnectionDialog
 from src.model.ble_service import BLEDeviceInfo
+from src.model.transport import client_class, scanner_class
+from src.model.imu import IMUData
+from src.presenter.event_loop_bridge import EventLoopBridge
 
 class BLEDebugService:
     """Simple BLE service for debugging purposes"""
@@ -16,7 +19,7 @@ class BLEDebugService:
     async def connect(self, device_info):
         """Connect to BLE device"""
         try:
-            self.client = BleakClient(device_info.address)
+            self.client = client_class()(device_info.address)
             await self.client.connect()
             self.connected = True
             return True
@@ -60,6 +63,37 @@ class BLEDebugService:
         except Exception as e:
             print(f"Read error: {e}")
             return None
+
+    def readable_characteristics(self):
+        """UUIDs of all characteristics with the read property"""
+        if not self.client:
+            return []
+        return [
+            str(char.uuid)
+            for service in self.client.services
+            for char in service.characteristics
+            if 'read' in char.properties
+        ]
+
+    async def read_characteristics(self, char_uuids):
+        """Read several characteristics at once
+
+        Returns:
+            dict: UUID -> value bytes, None for reads that failed
+        """
+        if not self.client:
+            return dict.fromkeys(char_uuids)
+        results = await asyncio.gather(
+            *(self.client.read_gatt_char(uuid) for uuid in char_uuids),
+            return_exceptions=True
+        )
+        values = {}
+        for uuid, result in zip(char_uuids, results):
+            if isinstance(result, Exception):
+                print(f"Read error {uuid}: {result}")
+                result = None
+            values[uuid] = result
+        return values
             
     async def write_characteristic(self, char_uuid, data):
         """Write to characteristic"""
@@ -135,6 +169,17 @@ class BLEDebugService:
             except Exception as e:
                 return f"IMU parse error: {e}"
 
+        # Frame nhiều mẫu IMU: header (magic, count, seq) + N x 18 byte
+        frame = IMUData.from_frame(data)
+        if frame:
+            sequence, samples = frame
+            text = f"IMU Frame: seq={sequence}, {len(samples)} samples\n"
+            for sample in samples:
+                text += f"  A=({sample.accel_x}, {sample.accel_y}, {sample.accel_z}) "
+                text += f"G=({sample.gyro_x}, {sample.gyro_y}, {sample.gyro_z}) "
+                text += f"M=({sample.mag_x}, {sample.mag_y}, {sample.mag_z})\n"
+            return text
+
         # Nếu là 8 byte: thử parse 2 số int32
         if len(data) == 8:
             import struct
@@ -232,6 +277,14 @@ class BLEDebugView(ctk.CTkFrame):
             command=self._on_read_clicked
         )
         self.read_button.pack(side="left", padx=5)
+
+        self.read_all_button = ctk.CTkButton(
+            button_frame,
+            text="Read All",
+            width=100,
+            command=self._on_read_all_clicked
+        )
+        self.read_all_button.pack(side="left", padx=5)
         
         self.notify_button = ctk.CTkButton(
             button_frame,
@@ -339,6 +392,11 @@ class BLEDebugView(ctk.CTkFrame):
             uuid = self.uuid_entry.get().strip()
             if uuid:
                 self.on_read(uuid)
+
+    def _on_read_all_clicked(self):
+        """Handle read all button click"""
+        if self.on_read_all:
+            self.on_read_all()
                 
     def _on_notify_clicked(self):
         """Handle notify button click"""
@@ -361,10 +419,11 @@ class BLEDebugView(ctk.CTkFrame):
             if uuid:
                 self.on_write(uuid)
                 
-    def set_handlers(self, loop=None, on_read=None, on_write=None, on_notify=None):
+    def set_handlers(self, loop=None, on_read=None, on_write=None, on_notify=None, on_read_all=None):
         """Set handlers for button operations"""
         self.loop = loop
         self.on_read = on_read
+        self.on_read_all = on_read_all
         self.on_write = on_write
         self.on_notify = on_notify
         
@@ -372,6 +431,7 @@ class BLEDebugView(ctk.CTkFrame):
         """Enable/disable buttons"""
         state = "normal" if enabled else "disabled"
         self.read_button.configure(state=state)
+        self.read_all_button.configure(state=state)
         self.write_button.configure(state=state)
         self.notify_button.configure(state=state)
 
@@ -396,6 +456,7 @@ class DebugApp:
         self.window.geometry("800x600")
         self.window.grid_columnconfigure(0, weight=1)
         self.window.grid_rowconfigure(0, weight=1)
+        self.loop = EventLoopBridge(self.loop, self.window)  # Stands in for the loop from here on
         
         # Create main content in grid for better resizing
         self.content = ctk.CTkFrame(self.window)
@@ -434,6 +495,7 @@ class DebugApp:
         self.debug_view.set_handlers(
             loop=self.loop,
             on_read=lambda uuid: self.loop.create_task(self._handle_read(uuid)),
+            on_read_all=lambda: self.loop.create_task(self._handle_read_all()),
             on_write=lambda uuid: self.loop.create_task(self._handle_write(uuid)),
             on_notify=lambda uuid, enabled: self.loop.create_task(self._handle_notify(uuid, enabled))
         )
@@ -449,11 +511,7 @@ class DebugApp:
         
     def _setup_asyncio_integration(self):
         """Setup asyncio integration with Tkinter"""
-        def handle_asyncio():
-            self.loop.stop()
-            self.loop.run_forever()
-            self.window.after(10, handle_asyncio)
-        self.window.after(10, handle_asyncio)
+        self.loop.start()
         
     def _show_connection_dialog(self):
         """Show connection dialog"""
@@ -461,7 +519,7 @@ class DebugApp:
         self.connection_dialog = ConnectionDialog(
             self.window,
             self.loop,
-            BleakScanner,  # Pass scanner class directly
+            scanner_class(),  # Pass scanner class directly
             self._handle_connection
         )
         
@@ -540,6 +598,26 @@ class DebugApp:
         except Exception as e:
             self.debug_view.update_parsed_data(f"Error: {e}")
             
+    async def _handle_read_all(self):
+        """Read every readable characteristic at once and list the results"""
+        try:
+            uuids = self.ble_service.readable_characteristics()
+            values = await self.ble_service.read_characteristics(uuids)
+            raw = ""
+            parsed = ""
+            for uuid, data in values.items():
+                raw += f"{uuid}: {' '.join(f'{b:02x}' for b in data) if data else 'Read failed'}\n"
+                parsed += f"{uuid}:\n  {self.ble_service.parse_imu_data(data) if data else 'Read failed'}\n"
+
+            def update():
+                self.debug_view.raw_text.delete("1.0", "end")
+                self.debug_view.raw_text.insert("1.0", raw or "No readable characteristics")
+                self.debug_view.update_parsed_data(parsed)
+
+            self.loop.call_in_ui(update)
+        except Exception as e:
+            self.debug_view.update_parsed_data(f"Error: {e}")
+            
     async def _handle_write(self, uuid):
         """Handle write operation"""
         # For testing, write a dummy IMU value
@@ -587,11 +665,21 @@ class DebugApp:
             self.debug_view.update_parsed_data(parsed)
             
         # Schedule UI update on main thread
-        self.window.after(0, update)
+        self.loop.call_in_ui(update)
 
     def run(self):
         self.window.mainloop()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BLE Debug Tool")
+    parser.add_argument("--simulate", action="store_true", help="use the simulated glove instead of BLE")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="simulated samples per second of every stream (default: follow device config)")
+    args = parser.parse_args()
+    if args.simulate:
+        config = AppConfig()
+        config.BLE_BACKEND = "simulated"
+        if args.rate is not None:
+            config.SIM_RATE_HZ = args.rate
     app = DebugApp()
     app.run()
@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import customtkinter as ctk
 from src.config.app_config import AppConfig
@@ -10,15 +11,27 @@ from src.presenter.timestamp_presenter import TimestampPresenter
 from src.presenter.overall_status_presenter import OverallStatusPresenter
 from src.presenter.sensor_presenter import SensorPresenter
 from src.presenter.gamepad_presenter import GamepadPresenter
+from src.presenter.diagnostics_presenter import DiagnosticsPresenter
+from src.model.metrics_server import MetricsServer
+from src.presenter.render_scheduler import RenderScheduler
+from src.presenter.event_loop_bridge import EventLoopBridge
+from src.model.replay import NotificationReplay
+from src.model.ble_service import BLEDeviceInfo
 class App:
     """Main application class handling BLE device monitoring and IMU data visualization"""
     
-    def __init__(self):
-        """Initialize the application with BLE service, views, and presenters"""
+    def __init__(self, replay=None, speed=1.0):
+        """Initialize the application with BLE service, views, and presenters
+
+        Args:
+            replay: Optional raw capture file replayed instead of connecting to a device
+            speed: Replay speed factor, 0 for as fast as possible
+        """
         # Initialize base components
         self.loop = self._setup_event_loop()
         self.ble_service = ESP32BLEService()  # Will return singleton instance
         self.window = self._setup_window()
+        self.loop = EventLoopBridge(self.loop, self.window)  # Stands in for the loop from here on
         
         # Setup views and presenters
         self.main_view = MainView(self.window)
@@ -30,6 +43,16 @@ class App:
         # Setup event handlers
         self._init_event_handlers()
 
+        # Opt-in Prometheus endpoint on the same loop as the BLE service
+        self.metrics_server = None
+        if AppConfig().METRICS_PORT:
+            self.metrics_server = MetricsServer()
+            self.loop.create_task(self.metrics_server.start())
+
+        # Replay a raw capture through the normal notification path
+        if replay:
+            self.loop.create_task(self._run_replay(replay, speed))
+
     def _setup_event_loop(self):
         """Setup asyncio event loop"""
         loop = asyncio.new_event_loop()
@@ -90,6 +113,10 @@ class App:
                 self.main_view.gamepad_view,
                 self.ble_service,
                 self.loop
+            ),
+            'diagnostics': DiagnosticsPresenter(
+                self.main_view.diagnostics_view,
+                self.loop
             )
         }
         
@@ -119,17 +146,16 @@ class App:
         
         # Setup asyncio integration
         self._setup_asyncio_integration()
+
+        # Render coalesced view updates at a fixed rate
+        RenderScheduler().start(self.window)
         
         # Setup window close handler
         self.window.protocol("WM_DELETE_WINDOW", self._on_closing)
     
     def _setup_asyncio_integration(self):
         """Setup asyncio integration with Tkinter event loop"""
-        def handle_asyncio():
-            self.loop.stop()
-            self.loop.run_forever()
-            self.window.after(10, handle_asyncio)
-        self.window.after(10, handle_asyncio)
+        self.loop.start()
     
     def _handle_connection(self, device_info):
         """Handle device connection request"""
@@ -139,6 +165,20 @@ class App:
         """Handle device disconnection request"""
         self.loop.create_task(self.device_manager.disconnect())
     
+    async def _run_replay(self, path, speed):
+        """Attach the replay client, start all presenters and replay the capture"""
+        replay = NotificationReplay(self.ble_service, path, speed)
+        device_monitor = self.main_view.device_monitor
+        device_info = BLEDeviceInfo(address=replay.reader.metadata.get('address', 'replay'), name="Replay")
+        device_info.view = device_monitor
+        if not await replay.attach(device_info):
+            device_monitor.update_connection_status(False, None, "Replay failed")
+            return
+        await self.ble_service.start_services()
+        device_monitor.update_connection_status(True, device_info)
+        stats = await replay.run()
+        print(f"Replay finished: {stats['delivered']} notifications in {stats['elapsed']:.1f} s")
+
     async def _handle_timestamp_sync(self):
         """Handle timestamp sync request"""
         if await self.presenters['timestamp'].write_current_time():
@@ -161,20 +201,44 @@ class App:
                 else:
                     # No device connected, just quit
                     dialog.yes_btn.configure(state="disabled")
+                if self.metrics_server:
+                    await self.metrics_server.stop()
                 
                 # Stop event loop and quit
-                self.loop.stop()
-                self.window.quit()
+                self.loop.call_in_ui(self._quit)
             except Exception as e:
                 print(f"Error during application shutdown: {e}")
-                self.window.quit()
+                self.loop.call_in_ui(self._quit)
                 
         dialog.set_on_yes_callback(lambda: self.loop.create_task(handle_exit()))
 
+    def _quit(self):
+        """Stop the event loop and quit the Tk main loop"""
+        RenderScheduler().stop()
+        self.loop.stop()
+        self.window.quit()
+
     def run(self):
         """Start the application"""
         self.window.mainloop()
 
 if __name__ == "__main__":
-    app = App()
+    parser = argparse.ArgumentParser(description="Device Monitor")
+    parser.add_argument("--replay", metavar="FILE", help="replay a raw notification capture instead of connecting")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed factor, 0 for as fast as possible (default: 1)")
+    parser.add_argument("--simulate", action="store_true", help="scan and connect to simulated gloves instead of BLE")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="simulated samples per second of every stream (default: follow device config)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve Prometheus metrics on this localhost port (default: AppConfig.METRICS_PORT)")
+    args = parser.parse_args()
+    config = AppConfig()
+    if args.simulate:
+        config.BLE_BACKEND = "simulated"
+        if args.rate is not None:
+            config.SIM_RATE_HZ = args.rate
+    if args.metrics_port is not None:
+        config.METRICS_PORT = args.metrics_port
+    app = App(args.replay, args.speed)
     app.run()
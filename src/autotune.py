@@ -0,0 +1,89 @@
+"""Find the highest IMU rate the BLE link sustains
+
+Connects to the device, steps the accel/gyro rate of both IMUs up with
+RateAutoTuner and leaves the device at the highest rate every measured stream
+still delivers at the target ratio. The result is stored per host and adapter
+in AppConfig.AUTOTUNE_RESULTS_FILE.
+
+Usage:
+    python -m src.autotune --address XX:XX:XX:XX:XX:XX --adapter hci0
+    python -m src.autotune --simulate --link-capacity 600
+    python -m src.autotune --list
+"""
+import argparse
+import asyncio
+from src.config.app_config import AppConfig
+from src.model.ble_service import BLEDeviceInfo
+from src.model.esp32_service import ESP32BLEService
+from src.model.rate_autotune import RateAutoTuner
+from src.model.simulator import SimulatedDevice
+
+
+async def tune(address, target, adapter):
+    """Connect, tune and disconnect
+
+    Returns:
+        bool: True if a rate holding the target was found
+    """
+    service = ESP32BLEService()  # Get singleton instance
+    service.set_loop(asyncio.get_running_loop())
+    print(f"Connecting to {address}...")
+    if not await service.connect(BLEDeviceInfo(address)):
+        print("❌ Could not connect to device")
+        return False
+    try:
+        result = await RateAutoTuner(service, target, adapter).run()
+        return bool(result and result['rate'])
+    finally:
+        await service.disconnect()
+
+
+def print_results():
+    """Print the stored result of every host and adapter"""
+    results = RateAutoTuner.load()
+    if not results:
+        print("No auto-tune results")
+    for host, adapters in results.items():
+        for adapter, result in adapters.items():
+            rate = f"{result['rate_hz']:.1f} Hz" if result['rate'] else "none"
+            print(f"{host} / {adapter}: {rate} at {result['target']:.0%} delivery "
+                  f"(device {result['device']}, {result['backend']})")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Find the highest IMU rate the BLE link sustains")
+    parser.add_argument("--address", help="BLE address of the device")
+    parser.add_argument("--adapter", help="label of the BLE adapter the result is stored under (default: default)")
+    parser.add_argument("--target", type=float, default=None,
+                        help="delivery ratio every stream must hold (default: AppConfig.AUTOTUNE_TARGET_RATIO)")
+    parser.add_argument("--simulate", action="store_true", help="tune against the simulated glove")
+    parser.add_argument("--link-capacity", type=float, default=None,
+                        help="notifications per second the simulated link carries (default: unlimited)")
+    parser.add_argument("--list", action="store_true", help="print the stored results and exit")
+    args = parser.parse_args(argv)
+    if not args.address and not args.simulate and not args.list:
+        parser.error("--address, --simulate or --list is required")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        print_results()
+        return 0
+    if args.simulate:
+        config = AppConfig()
+        config.BLE_BACKEND = "simulated"
+        if args.link_capacity is not None:
+            config.SIM_LINK_CAPACITY = args.link_capacity
+        args.address = args.address or SimulatedDevice.advertised()[0].address
+    try:
+        ok = asyncio.run(tune(args.address, args.target, args.adapter))
+    except KeyboardInterrupt:
+        print("Auto-tune interrupted")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,399 @@
+"""Headless IMU capture without the Tk user interface
+
+Connects to the device, streams both IMUs with their Euler angles into the
+ring buffers of ESP32BLEService and logs them with IMULogger, the same
+logging path the GUI uses (CSV or binary session logs).
+
+Usage:
+    python -m src.capture --address XX:XX:XX:XX:XX:XX --duration 600 --out captures
+    python -m src.capture --replay notifications.raw --speed 0 --out replayed
+    python -m src.capture --simulate --rate 1000 --duration 10 --out simulated
+    python -m src.capture --address XX:XX:XX:XX:XX:XX --preset "208 Hz capture" --out captures
+    python -m src.capture --simulate --duration 60 --metrics metrics.jsonl
+    python -m src.capture --address XX:XX:XX:XX:XX:XX --metrics-port 9464 --out captures
+    python -m src.capture --address AA:AA:AA:AA:AA:AA --address BB:BB:BB:BB:BB:BB --out captures
+    python -m src.capture --simulate --devices 2 --duration 10 --out simulated
+
+Several --address options (or --devices with --simulate) capture every glove
+at once through a ConnectionPool: each glove records all of its streams to
+<stream>.bin files in its own subfolder of the session folder.
+"""
+import argparse
+import asyncio
+import datetime
+import os
+import time
+from src.config.app_config import AppConfig
+from src.model.ble_service import BLEDeviceInfo
+from src.model.esp32_service import ESP32BLEService
+from src.model.imu_logger import IMULogger, IMURowPairer
+from src.model.session_recorder import SessionRecorder
+from src.model.raw_capture import RawCaptureWriter
+from src.model.replay import NotificationReplay
+from src.model.simulator import SimulatedDevice
+from src.model.connection_profiler import ConnectionProfiler
+from src.model.link_supervisor import LinkSupervisor
+from src.model.config_presets import ConfigPresetManager
+from src.model.metrics import MetricsRegistry
+from src.model.metrics_server import MetricsServer
+from src.model.connection_pool import ConnectionPool
+
+class HeadlessCapture:
+    """Record IMU data to CSV files without any GUI"""
+
+    STATUS_INTERVAL = 5.0  # Seconds between progress lines
+
+    RAW_CAPTURE_FILE = "notifications.raw"
+
+    def __init__(self, address, duration, out_dir, log_format=None, all_streams=False,
+                 raw=False, replay=None, speed=1.0, preset=None, metrics=None):
+        """Initialize capture
+
+        Args:
+            address: BLE address of the device
+            duration: Capture length in seconds, 0 to run until interrupted
+            out_dir: Directory in which the session folder is created
+            log_format: IMULogger.CSV or IMULogger.BINARY, defaults to AppConfig.LOG_FORMAT
+            all_streams: Also record every other characteristic with SessionRecorder
+            raw: Also record every notification payload to notifications.raw
+            replay: Raw capture file to replay instead of connecting to a device
+            speed: Replay speed factor, 0 for as fast as possible
+            preset: Name of a config preset to apply before logging
+            metrics: File a MetricsRegistry snapshot is appended to every STATUS_INTERVAL seconds
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.service = ESP32BLEService()  # Get singleton instance
+        self.address = address
+        self.duration = duration
+        self.out_dir = out_dir
+        self.log_format = log_format
+        self.all_streams = all_streams
+        self.raw = raw
+        self.recorder = None
+        self.raw_capture = None
+        self.replay = NotificationReplay(self.service, replay, speed) if replay else None
+        self.supervisor = None if replay else LinkSupervisor(self.service)
+        self.presets = ConfigPresetManager(self.service)
+        self.preset = preset
+        self.metrics = metrics
+        self.metrics_server = MetricsServer() if self.config.METRICS_PORT else None
+        self.logger = None
+        self.samples = {1: 0, 2: 0}
+        self._streams = {}
+
+    async def run(self):
+        """Connect, capture until the duration elapses, then disconnect
+
+        Returns:
+            bool: True if the capture ran
+        """
+        self.service.set_loop(asyncio.get_running_loop())
+        if self.metrics_server:
+            await self.metrics_server.start()
+        if self.replay:
+            print(f"Replaying {self.replay.reader.path} at speed {self.replay.speed or 'max'}...")
+            connected = await self.replay.attach() is not None
+        else:
+            print(f"Connecting to {self.address}...")
+            connected = await self.service.connect(BLEDeviceInfo(self.address))
+        if not connected:
+            print("❌ Could not connect to device")
+            return False
+
+        try:
+            if self.preset and not await self.presets.apply(self.preset):
+                return False
+            metadata = await self._read_metadata()
+            if not self._start_logging(metadata):
+                return False
+            if self.raw:
+                self.raw_capture = RawCaptureWriter(
+                    self.service, os.path.join(self.logger.path, self.RAW_CAPTURE_FILE), metadata)
+                if not self.raw_capture.start():
+                    return False
+            if not await self._start_notifications():
+                print("❌ Could not start IMU notifications")
+                ConnectionProfiler().finish(False)
+                return False
+            trace = ConnectionProfiler().finish(True)
+            if trace:
+                print(f"Connected and streaming after {trace.total:.2f} s")
+            if self.supervisor:
+                self.supervisor.start()
+            if self.all_streams:
+                # Started last so it only subscribes the streams not used for the IMU logs
+                self.recorder = SessionRecorder(self.service, self.logger.path, metadata)
+                if not await self.recorder.start():
+                    return False
+            await self._capture()
+            return True
+        finally:
+            if self.supervisor:
+                await self.supervisor.stop()
+                for gap in self.supervisor.gaps:
+                    duration = "not restored" if gap.duration is None else f"data gap {gap.duration:.2f} s"
+                    print(f"Link lost ({gap.reason}): {gap.attempts} reconnect attempt(s), {duration}")
+            await self._stop_notifications()
+            if self.logger:
+                # Samples that arrived while unsubscribing are in the raw capture too
+                self._drain()
+            if self.raw_capture:
+                self.raw_capture.stop()
+                print(f"Recorded {self.raw_capture.records} raw notifications")
+            if self.recorder:
+                await self.recorder.stop()
+                print(f"Recorded {self.recorder.get_stats()['records']}")
+            if self.logger:
+                self.logger.stop_logging()
+            await self.service.disconnect()
+            if self.metrics_server:
+                await self.metrics_server.stop()
+            print(f"Captured {self.samples[1]} IMU1 and {self.samples[2]} IMU2 samples")
+
+    async def _read_metadata(self):
+        """Device details stored in binary log headers"""
+        await self.service.get_config()  # The preset and config come from the shadow config
+        # Raw values of the read-only characteristics, served again on replay
+        reads = {}
+        for uuid in (self.service.CONFIG_UUID, self.service.FIRMWARE_UUID, self.service.MODEL_NUMBER_UUID,
+                     self.service.MANUFACTURER_UUID, self.service.HARDWARE_UUID):
+            value = await self.service.read_characteristic(uuid)
+            if value:
+                reads[uuid] = bytes(value).hex()
+        return dict(self.presets.session_metadata(),
+                    address=self.service.connected_device.address,
+                    reads=reads)
+
+    def _start_logging(self, metadata):
+        """Create the session folder and open the log files"""
+        subfolder_name = datetime.datetime.now().strftime("%d%m%Y_%H%M%S_vr_glove")
+        path = os.path.join(self.out_dir, subfolder_name)
+        os.makedirs(path, exist_ok=True)
+        self.logger = IMULogger(path, self.log_format, metadata)
+        if not self.logger.start_logging():
+            print(f"❌ Could not create log files in {path}")
+            self.logger = None
+            return False
+        print(f"Logging to {path}")
+        return True
+
+    async def _start_notifications(self):
+        """Subscribe to both IMUs and their Euler angles, samples land in the ring buffers"""
+        service = self.service
+        for imu_number, imu_uuid, euler_uuid in ((1, service.IMU1_CHAR_UUID, service.IMU1_EULER_UUID),
+                                                 (2, service.IMU2_CHAR_UUID, service.IMU2_EULER_UUID)):
+            self._streams[imu_number] = (service.buffers[imu_uuid].reader(),
+                                         service.buffers[euler_uuid].reader(),
+                                         IMURowPairer())
+        results = [
+            await service.start_imu1_notify(),
+            await service.start_imu1_euler_notify(),
+            await service.start_imu2_notify(),
+            await service.start_imu2_euler_notify(),
+        ]
+        return all(results)
+
+    async def _stop_notifications(self):
+        """Unsubscribe from all IMU notifications"""
+        if not self.service.is_connected():
+            return
+        await self.service.stop_imu1_notify()
+        await self.service.stop_imu1_euler_notify()
+        await self.service.stop_imu2_notify()
+        await self.service.stop_imu2_euler_notify()
+
+    async def _capture(self):
+        """Drain the ring buffers into the log files until done"""
+        start = time.monotonic()
+        next_status = start + self.STATUS_INTERVAL
+        replay_task = asyncio.get_running_loop().create_task(self.replay.run()) if self.replay else None
+        while self.service.is_connected() or (self.supervisor and self.supervisor.recovering()):
+            await asyncio.sleep(self.config.SAMPLE_CONSUME_INTERVAL)
+            self._drain()
+
+            now = time.monotonic()
+            if now >= next_status:
+                self._print_status(now - start)
+                if self.metrics:
+                    MetricsRegistry().export(self.metrics)
+                next_status += self.STATUS_INTERVAL
+            if self.duration and now - start >= self.duration:
+                break
+            if replay_task and replay_task.done():
+                print(f"Replay finished: {replay_task.result()}")
+                break
+        else:
+            print("❌ Device disconnected")
+        if replay_task and not replay_task.done():
+            replay_task.cancel()
+        self._drain()
+        if self.metrics:
+            MetricsRegistry().export(self.metrics)
+
+    def _drain(self):
+        """Log every IMU row read since the last drain"""
+        for imu_number, (imu_reader, euler_reader, pairer) in self._streams.items():
+            imu_rows, euler_rows, timestamps = pairer.pair(imu_reader.read(), euler_reader.read())
+            if len(imu_rows):
+                self.logger.log_imu_batch(imu_number, imu_rows, euler_rows, timestamps)
+                self.samples[imu_number] += len(imu_rows)
+
+    def _print_status(self, elapsed):
+        """Print sample rates and loss counters"""
+        dropped = sum(reader.dropped for streams in self._streams.values() for reader in streams[:2])
+        lost = sum(self.service.lost_samples.values())
+        stats = self.logger.get_stats()
+        print(f"[{elapsed:7.1f} s] IMU1 {self.samples[1] / elapsed:6.1f} Hz  "
+              f"IMU2 {self.samples[2] / elapsed:6.1f} Hz  "
+              f"lost {lost}  dropped {dropped}  "
+              f"log queue {stats['queued']}  log dropped {stats['dropped']}")
+
+
+class PoolCapture:
+    """Record several gloves at once through a ConnectionPool"""
+
+    STATUS_INTERVAL = HeadlessCapture.STATUS_INTERVAL
+
+    def __init__(self, addresses, duration, out_dir, preset=None, metrics=None):
+        """Initialize capture
+
+        Args:
+            addresses: BLE addresses of the devices
+            duration: Capture length in seconds, 0 to run until interrupted
+            out_dir: Directory in which the session folder is created
+            preset: Name of a config preset applied to every device
+            metrics: File a MetricsRegistry snapshot is appended to every STATUS_INTERVAL seconds
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.addresses = addresses
+        self.duration = duration
+        self.out_dir = out_dir
+        self.preset = preset
+        self.metrics = metrics
+        self.metrics_server = MetricsServer() if self.config.METRICS_PORT else None
+        self.pool = ConnectionPool(max(len(addresses), self.config.POOL_MAX_DEVICES))
+        self._last_records = {}  # Device name -> recorder records at the previous status line
+
+    async def run(self):
+        """Connect every device, capture until the duration elapses, then disconnect
+
+        Returns:
+            bool: True if every device was captured
+        """
+        if self.metrics_server:
+            await self.metrics_server.start()
+        path = os.path.join(self.out_dir, datetime.datetime.now().strftime("%d%m%Y_%H%M%S_vr_glove"))
+        print(f"Connecting to {len(self.addresses)} devices...")
+        try:
+            sessions = await self.pool.add_all(self.addresses, path, self.preset)
+            if not all(sessions):
+                return False
+            print(f"Logging to {path}")
+            await self._capture()
+            return True
+        finally:
+            recorders = {session.name: session.recorder for session in self.pool.sessions.values()}
+            # Stats are read after close so they include the final drain
+            await self.pool.close()
+            for name, recorder in recorders.items():
+                if recorder:
+                    print(f"{name}: recorded {recorder.get_stats()['records']}")
+            if self.metrics_server:
+                await self.metrics_server.stop()
+
+    async def _capture(self):
+        """Wait until done while the recorders log every stream"""
+        self._last_records = {session.name: session.recorder.get_stats()['records']
+                              for session in self.pool.sessions.values() if session.recorder}
+        start = time.monotonic()
+        next_status = start + self.STATUS_INTERVAL
+        while any(session.is_connected() for session in self.pool.sessions.values()):
+            await asyncio.sleep(self.config.SAMPLE_CONSUME_INTERVAL)
+            now = time.monotonic()
+            if now >= next_status:
+                self._print_status(now - start, self.STATUS_INTERVAL)
+                if self.metrics:
+                    MetricsRegistry().export(self.metrics)
+                next_status += self.STATUS_INTERVAL
+            if self.duration and now - start >= self.duration:
+                break
+        else:
+            print("❌ All devices disconnected")
+        if self.metrics:
+            MetricsRegistry().export(self.metrics)
+
+    def _print_status(self, elapsed, interval):
+        """Print the IMU sample rates of every device over the last interval"""
+        for session in self.pool.sessions.values():
+            records = session.recorder.get_stats()['records'] if session.recorder else {}
+            last = self._last_records.get(session.name, {})
+            self._last_records[session.name] = records
+            rates = [(records.get(stream, 0) - last.get(stream, 0)) / interval
+                     for stream in ('imu1_char', 'imu2_char')]
+            state = "connected" if session.service.is_connected() else "reconnecting"
+            print(f"[{elapsed:7.1f} s] {session.name}  IMU1 {rates[0]:6.1f} Hz  IMU2 {rates[1]:6.1f} Hz  "
+                  f"lost {sum(session.service.lost_samples.values())}  {state}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Capture IMU data without the GUI")
+    parser.add_argument("--address", action="append",
+                        help="BLE address of the device, repeat to capture several devices at once")
+    parser.add_argument("--duration", type=float, default=0,
+                        help="capture length in seconds (default: until Ctrl+C)")
+    parser.add_argument("--out", default=".", help="directory for the session folder (default: .)")
+    parser.add_argument("--format", choices=(IMULogger.CSV, IMULogger.BINARY), default=None,
+                        help="log file format (default: AppConfig.LOG_FORMAT)")
+    parser.add_argument("--all-streams", action="store_true",
+                        help="also record flex, force, gamepad, status and battery streams to .bin files")
+    parser.add_argument("--raw", action="store_true",
+                        help="also record every notification payload for replay")
+    parser.add_argument("--replay", metavar="FILE", help="replay a raw capture instead of connecting")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed factor, 0 for as fast as possible (default: 1)")
+    parser.add_argument("--preset", choices=[preset.name for preset in ConfigPresetManager.PRESETS],
+                        help="apply a config preset before logging")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="append a JSON line of pipeline metrics to FILE every status interval")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve Prometheus metrics on this localhost port during the capture")
+    parser.add_argument("--simulate", action="store_true", help="capture from the simulated glove")
+    parser.add_argument("--devices", type=int, default=1,
+                        help="number of simulated gloves, captured at once when more than one (default: 1)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="simulated samples per second of every stream (default: follow device config)")
+    args = parser.parse_args(argv)
+    if not args.address and not args.replay and not args.simulate:
+        parser.error("--address, --replay or --simulate is required")
+    if args.replay and args.address and len(args.address) > 1:
+        parser.error("--replay takes a single device")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = AppConfig()
+    if args.metrics_port is not None:
+        config.METRICS_PORT = args.metrics_port
+    if args.simulate:
+        config.BLE_BACKEND = "simulated"
+        if args.rate is not None:
+            config.SIM_RATE_HZ = args.rate
+        config.SIM_DEVICE_COUNT = max(config.SIM_DEVICE_COUNT, args.devices)
+        args.address = args.address or [device.address for device in SimulatedDevice.advertised()[:args.devices]]
+    addresses = args.address or [None]
+    if len(addresses) > 1:
+        capture = PoolCapture(addresses, args.duration, args.out, args.preset, args.metrics)
+    else:
+        capture = HeadlessCapture(addresses[0], args.duration, args.out, args.format, args.all_streams,
+                                  args.raw, args.replay, args.speed, args.preset, args.metrics)
+    try:
+        ok = asyncio.run(capture.run())
+    except KeyboardInterrupt:
+        print("Capture interrupted")
+        ok = True
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -71,6 +71,86 @@ class AppConfig:
         self.BUTTON_WIDTH = 112
         self.BUTTON_HEIGHT = 38
 
+        # Data pipeline
+        self.SAMPLE_CONSUME_INTERVAL = 0.02  # Seconds between ring buffer reads by presenters
+        self.RENDER_RATE_HZ = 30  # View refreshes per second, newer samples replace older ones
+
+        # Asyncio integration: "pump" runs the loop from Tk after() callbacks,
+        # "thread" runs it on its own thread and hands results to Tk through a queue
+        self.ASYNCIO_MODE = "pump"
+        self.ASYNCIO_PUMP_INTERVAL_MS = 10
+        self.UI_QUEUE_INTERVAL_MS = 10
+
+        # IMU logging: rows are written by a background thread; at most
+        # LOG_FLUSH_INTERVAL seconds or LOG_FLUSH_ROWS rows are lost on a crash
+        self.LOG_FLUSH_INTERVAL = 1.0
+        self.LOG_FLUSH_ROWS = 2000
+        self.LOG_QUEUE_MAX_ROWS = 100000  # Rows beyond this are dropped and counted
+        self.LOG_FORMAT = "csv"  # "csv" or "binary" (memory-mappable session logs, see session_log.py)
+        self.RECORD_ALL_STREAMS = False  # Also record every characteristic to <stream>.bin while logging
+        self.RECORD_RAW_NOTIFICATIONS = False  # Also record raw payloads to notifications.raw for replay
+
+        # Notification subscription after connecting: "concurrent" starts all presenters at once with at
+        # most SUBSCRIBE_CONCURRENCY start_notify calls in flight, "sequential" starts them one by one
+        # with settle delays in between
+        self.SUBSCRIBE_MODE = "sequential"  # "concurrent" is not yet measured on hardware
+        self.SUBSCRIBE_CONCURRENCY = 4
+        self.SUBSCRIBE_RETRIES = 5  # start_notify attempts per characteristic
+        self.SUBSCRIBE_RETRY_DELAY = 0.2  # Seconds between attempts
+
+        # Phase timings of every connection attempt, one JSON object per line ("" to disable)
+        self.CONNECTION_LOG_FILE = "connection_log.jsonl"
+
+        # Services and profile strings of known devices, reused on reconnect ("" to disable)
+        self.DEVICE_CACHE_FILE = "device_cache.json"
+        self.DEVICE_CACHE_REVALIDATE_DELAY = 5.0  # Seconds after connecting before cached values are re-read
+
+        # Link supervision (see link_supervisor.py): reconnect with exponential backoff after the
+        # device disconnects or every subscribed stream stays silent for LINK_STALE_TIMEOUT seconds
+        self.AUTO_RECONNECT = True
+        self.LINK_CHECK_INTERVAL = 0.5  # Seconds between stream liveness checks
+        self.LINK_STALE_TIMEOUT = 3.0
+        self.RECONNECT_ATTEMPTS = 10  # 0 retries forever
+        self.RECONNECT_BASE_DELAY = 0.5  # Seconds before the first attempt, doubled after each failure
+        self.RECONNECT_MAX_DELAY = 10.0
+
+        # Pipeline metrics (see metrics.py): per characteristic counters fed by the notification
+        # handlers, shown in the diagnostics panel every DIAGNOSTICS_INTERVAL seconds
+        self.METRICS_ENABLED = True
+        self.DIAGNOSTICS_INTERVAL = 1.0
+        # Prometheus/OpenMetrics endpoint (see metrics_server.py) on http://METRICS_HOST:METRICS_PORT/metrics,
+        # served from the asyncio loop; 0 disables it
+        self.METRICS_PORT = 0
+        self.METRICS_HOST = "127.0.0.1"
+
+        # Config presets (see config_presets.py)
+        self.PRESET_VERIFY_TIMEOUT = 2.0  # Seconds to wait for the config notification confirming a preset
+
+        # IMU rate auto-tune (see rate_autotune.py): steps the accel/gyro rate up while every
+        # stream delivers at least AUTOTUNE_TARGET_RATIO of its expected samples
+        self.AUTOTUNE_TARGET_RATIO = 0.98
+        self.AUTOTUNE_SETTLE_TIME = 1.0  # Seconds after a rate change before measuring
+        self.AUTOTUNE_WINDOW = 3.0  # Seconds measured per rate
+        self.AUTOTUNE_RESULTS_FILE = "autotune_results.json"  # Results per host and adapter ("" to disable)
+
+        # Devices held at once by ConnectionPool (see connection_pool.py)
+        self.POOL_MAX_DEVICES = 4
+
+        # BLE backend: "bleak" for real devices, "simulated" for the in-process glove model
+        # (see simulator.py). The SIM_ settings only apply to the simulator.
+        self.BLE_BACKEND = "bleak"
+        self.SIM_DEVICE_COUNT = 1  # Devices reported by the simulated scanner
+        self.SIM_RATE_HZ = 0  # Samples per second of every data stream, 0 follows the device config
+        self.SIM_RATES = {}  # Per characteristic overrides, e.g. {"FLEX_SENSOR_UUID": 50}
+        self.SIM_FRAME_SAMPLES = 1  # Samples per notification, above 1 sends multi-sample frames
+        self.SIM_JITTER = 0.002  # Standard deviation of extra notification delay, seconds
+        self.SIM_LOSS = 0.0  # Probability that a notification is dropped
+        self.SIM_TICK = 0.005  # Seconds between notification rounds of a stream
+        self.SIM_GATT_LATENCY = 0.015  # Seconds per read, write or subscribe, about one connection interval
+        self.SIM_LINK_DROP_INTERVAL = 0  # Seconds after connecting until the link drops, 0 never drops it
+        self.SIM_LINK_DOWN_TIME = 2.0  # Seconds after a link drop during which reconnects fail
+        self.SIM_LINK_CAPACITY = 0  # Notifications per second the link carries, excess is dropped, 0 unlimited
+
         # Footer settings
         self.FOOTER_HEIGHT = 50
         self.FOOTER_COLOR = "#181818"
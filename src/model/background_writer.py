@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import deque
+from src.config.app_config import AppConfig
+from src.model.metrics import MetricsRegistry
+
+class BackgroundWriter:
+    """Write queued rows on a dedicated thread
+
+    Producers only queue rows; the writer thread builds and writes them in
+    batches and flushes every LOG_FLUSH_INTERVAL seconds or LOG_FLUSH_ROWS
+    rows, whichever comes first. That bounds what a crash can lose. stop()
+    writes everything still queued. Rows beyond LOG_QUEUE_MAX_ROWS are dropped
+    and counted instead of blocking the producer, unless the writer is
+    unbounded. While running, the queue depth and dropped rows are reported
+    as MetricsRegistry gauges.
+    """
+
+    def __init__(self, write, flush, name="writer", bounded=True):
+        """Initialize writer
+
+        Args:
+            write: Callable (key, rows) run on the writer thread
+            flush: Callable run on the writer thread to flush all outputs
+            name: Thread name
+            bounded: Drop rows beyond LOG_QUEUE_MAX_ROWS; False queues every row
+                for outputs that must not lose any
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self._write = write
+        self._flush = flush
+        self.name = name
+        self.bounded = bounded
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopping = False
+
+        # Counters, in rows
+        self.queue_depth = 0  # Queued or being written, not yet flushed
+        self.written_rows = 0
+        self.dropped_rows = 0
+
+    def start(self):
+        """Start the writer thread"""
+        self._stopping = False
+        self._thread = threading.Thread(target=self._write_loop, name=self.name, daemon=True)
+        self._thread.start()
+        metrics = MetricsRegistry()
+        metrics.register_gauge(f"{self.name} queue", self._read_queue_depth)
+        metrics.register_gauge(f"{self.name} dropped", self._read_dropped_rows)
+
+    def stop(self):
+        """Write and flush all queued rows, then stop the writer thread"""
+        if self._thread:
+            with self._condition:
+                self._stopping = True
+                self._condition.notify()
+            self._thread.join()
+            self._thread = None
+            metrics = MetricsRegistry()
+            metrics.unregister_gauge(f"{self.name} queue", self._read_queue_depth)
+            metrics.unregister_gauge(f"{self.name} dropped", self._read_dropped_rows)
+
+    def _read_queue_depth(self):
+        return self.queue_depth
+
+    def _read_dropped_rows(self):
+        return self.dropped_rows
+
+    def enqueue(self, key, count, make_rows):
+        """Hand rows to the writer thread, dropping them if a bounded queue is full
+
+        Args:
+            key: Passed to write(), e.g. the output the rows belong to
+            count: Number of rows
+            make_rows: Callable returning the rows, run on the writer thread
+        """
+        with self._condition:
+            if self.bounded and self.queue_depth + count > self.config.LOG_QUEUE_MAX_ROWS:
+                self.dropped_rows += count
+                return
+            self._queue.append((key, count, make_rows))
+            self.queue_depth += count
+            if self.queue_depth >= self.config.LOG_FLUSH_ROWS:
+                self._condition.notify()
+
+    def get_stats(self):
+        """Writer counters
+
+        Returns:
+            dict with queued, written and dropped row counts
+        """
+        return {
+            'queued': self.queue_depth,
+            'written': self.written_rows,
+            'dropped': self.dropped_rows,
+        }
+
+    def _write_loop(self):
+        """Writer thread: write queued rows and flush on time or size threshold"""
+        unflushed = 0
+        next_flush = time.monotonic() + self.config.LOG_FLUSH_INTERVAL
+        while True:
+            with self._condition:
+                timeout = max(0.0, next_flush - time.monotonic())
+                self._condition.wait_for(
+                    lambda: self._stopping or self.queue_depth >= self.config.LOG_FLUSH_ROWS, timeout)
+                items = list(self._queue)
+                self._queue.clear()
+                stopping = self._stopping
+
+            for key, count, make_rows in items:
+                try:
+                    self._write(key, make_rows())
+                    self.written_rows += count
+                except Exception as e:
+                    print(f"Error writing {self.name} rows for {key}: {e}")
+                    with self._condition:
+                        self.dropped_rows += count
+            unflushed += sum(count for _, count, _ in items)
+
+            if stopping or unflushed >= self.config.LOG_FLUSH_ROWS or time.monotonic() >= next_flush:
+                try:
+                    self._flush()
+                except Exception as e:
+                    print(f"Error flushing {self.name} files: {e}")
+                with self._condition:
+                    self.queue_depth -= unflushed
+                unflushed = 0
+                next_flush = time.monotonic() + self.config.LOG_FLUSH_INTERVAL
+
+            if stopping:
+                return
@@ -1,9 +1,17 @@
-class BatteryLevelData:
+import struct
+from src.model.sample import Sample, field
+
+class BatteryLevelData(Sample):
     """Model class for battery level data"""
+
+    __slots__ = ()
+    FIELDS = ('level',)
+    STRUCT = struct.Struct('<B')  # 1 uint8 value
     
-    def __init__(self, level=0, raw_data=None):
-        self.level = level  # 0-100
-        self.raw_data = raw_data
+    def __new__(cls, level=0, raw_data=None):
+        return tuple.__new__(cls, (level,))
+
+    level = field(0)  # 0-100
 
     @classmethod
     def from_bytes(cls, data):
@@ -12,21 +20,26 @@ class BatteryLevelData:
             return None
         try:
             level = int(data[0])  # Get first byte as integer (0-100)
-            return cls(level, data)
+            return cls._make((level,))
         except Exception as e:
             print(f"Error parsing battery level data: {e}")
             return None
 
 
-class BatteryStateData:
+class BatteryStateData(Sample):
     """Model class for battery charging state data"""
     
     STATES = ["Not Charging", "Charging", "Fully Charged"]
+
+    __slots__ = ()
+    FIELDS = ('state',)
+    STRUCT = struct.Struct('<B')  # 1 uint8 value
     
-    def __init__(self, state=0, raw_data=None):
-        # state: 0=Not Charging, 1=Charging, 2=Fully Charged
-        self.state = state
-        self.raw_data = raw_data
+    def __new__(cls, state=0, raw_data=None):
+        return tuple.__new__(cls, (state,))
+
+    # state: 0=Not Charging, 1=Charging, 2=Fully Charged
+    state = field(0)
         
     @property
     def state_text(self):
@@ -40,7 +53,7 @@ class BatteryStateData:
             return None
         try:
             state = int(data[0])
-            return cls(state, data)
+            return cls._make((state,))
         except Exception as e:
             print(f"Error parsing battery state data: {e}")
             return None
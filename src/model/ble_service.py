@@ -1,5 +1,7 @@
-from bleak import BleakScanner, BleakClient
 import asyncio
+from src.model.transport import client_class, scanner_class
+from src.model.connection_profiler import ConnectionProfiler
+from src.model.metrics import MetricsRegistry
 from src.model.imu import IMUData
 from src.model.timestamp import TimestampData
 
@@ -55,38 +57,68 @@ class BLEService(BLEProfileChecker):
             cls._instance = super().__new__(cls)
         return cls._instance
     
+    @classmethod
+    def create_session(cls):
+        """Create an independent instance instead of returning the shared one
+
+        Used by ConnectionPool to talk to several devices at once; every
+        session has its own client and connection state.
+        """
+        session = super().__new__(cls)
+        session.__init__()
+        return session
+
     def __init__(self):
         if not hasattr(self, 'initialized'):
             self.client = None
             self._connected = False
             self.connected_device = None
+            self.on_link_lost = None  # Called when the device drops the connection, see LinkSupervisor
             self.initialized = True
         
     async def scan_devices(self):
         """Scan for available BLE devices"""
         try:
-            devices = await BleakScanner.discover()
+            with ConnectionProfiler().phase("scan") as phase:
+                devices = await scanner_class().discover()
+                phase.details['devices'] = len(devices)
             return [BLEDeviceInfo.from_discovered_device(device) for device in devices]
         except Exception as e:
             print(f"Error scanning for devices: {e}")
             return []
         
-    async def connect(self, device_info):
-        """Connect to a BLE device"""
+    async def connect(self, device_info, services=None):
+        """Connect to a BLE device
+
+        Args:
+            device_info: BLEDeviceInfo of the device
+            services: Optional service UUIDs; only these are resolved during discovery
+        """
+        profiler = ConnectionProfiler()  # Get singleton instance
+        metrics = MetricsRegistry()  # Get singleton instance
+        address = device_info.address
+        metrics.count("connect attempts", device=address)
+        connected = False
         try:
-            self.client = BleakClient(device_info.address)
-            await self.client.connect()
+            options = {'disconnected_callback': self._handle_disconnected}
+            if services:
+                options['services'] = services
+            self.client = client_class()(device_info.address, **options)
+            with profiler.phase("client.connect"):
+                await self.client.connect()
             if not self.client.is_connected:
                 return False
                 
             # Wait for service discovery
             max_retries = 5
-            for attempt in range(max_retries):
-                await asyncio.sleep(0.2)
-                if self.client.services:
-                    break
-                if attempt < max_retries - 1:
-                    print("Waiting for services...")
+            with profiler.phase("service discovery wait") as phase:
+                for attempt in range(max_retries):
+                    phase.details['polls'] = attempt + 1
+                    await asyncio.sleep(0.2)
+                    if self.client.services:
+                        break
+                    if attempt < max_retries - 1:
+                        print("Waiting for services...")
                     
             if not self.client.services:
                 print("No services discovered")
@@ -94,18 +126,54 @@ class BLEService(BLEProfileChecker):
                     
             self._connected = True
             self.connected_device = device_info
+            connected = True
             return True
         except Exception as e:
             self._connected = False
             print(f"Connection error: {e}")
             return False
+        finally:
+            if not connected:
+                metrics.count("connect failures", device=address)
+            else:
+                # Every connect after the first to the same device is a reconnect
+                if metrics.counter("connects", device=address):
+                    metrics.count("reconnects", device=address)
+                metrics.count("connects", device=address)
             
+    async def attach_client(self, client, device_info):
+        """Use an already connected client instead of connecting over BLE
+
+        Args:
+            client: Object with the BleakClient interface, e.g. a replay client
+            device_info: BLEDeviceInfo describing the device behind the client
+        """
+        if not client.is_connected:
+            return False
+        self.client = client
+        self._connected = True
+        self.connected_device = device_info
+        return True
+
+    def _handle_disconnected(self, client):
+        """Disconnected callback of the client, called for deliberate and unexpected disconnects"""
+        if client is not self.client or not self._connected:
+            return  # Deliberate disconnect or a client replaced by a reconnect
+        self._connected = False
+        print("❌ Device disconnected")
+        if self.on_link_lost:
+            self.on_link_lost()
+
     async def disconnect(self):
         """Disconnect from the device"""
         if not self.is_connected():
+            # Forget a client whose link dropped
+            self.client = None
+            self.connected_device = None
             return True
             
         try:
+            self._connected = False  # Deliberate, the disconnected callback ignores it
             await self.client.disconnect()
             return True
         except Exception as e:
@@ -131,6 +199,32 @@ class BLEService(BLEProfileChecker):
         except Exception as e:
             print(f"Error reading characteristic {uuid}: {e}")
             return None
+
+    async def read_characteristics(self, uuids):
+        """Read several characteristics at once
+
+        The reads are awaited together instead of one after the other, which
+        saves Python/await round trips; ATT still serializes them on the link.
+
+        Args:
+            uuids: Characteristic UUIDs to read
+        Returns:
+            dict: UUID -> value bytes, None for reads that failed
+        """
+        uuids = list(uuids)
+        if not self.is_connected():
+            return dict.fromkeys(uuids)
+        results = await asyncio.gather(
+            *(self.client.read_gatt_char(uuid) for uuid in uuids),
+            return_exceptions=True
+        )
+        values = {}
+        for uuid, result in zip(uuids, results):
+            if isinstance(result, Exception):
+                print(f"Error reading characteristic {uuid}: {result}")
+                result = None
+            values[uuid] = result
+        return values
             
     async def write_characteristic(self, uuid, data):
         """Write characteristic value"""
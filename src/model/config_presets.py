@@ -0,0 +1,149 @@
+import asyncio
+from src.config.app_config import AppConfig
+from src.model.device_config import DeviceConfig
+
+class ConfigPreset:
+    """Named full device configuration"""
+
+    __slots__ = ('name', 'description', 'fields')
+
+    def __init__(self, name, description, **fields):
+        """Initialize preset
+
+        Args:
+            name: Name shown to the user and stored in session headers
+            description: One line summary
+            **fields: Value of every DeviceConfig field except reserved
+        """
+        self.name = name
+        self.description = description
+        self.fields = fields
+
+    def config(self, base=None):
+        """DeviceConfig of this preset, keeping the reserved bytes of base"""
+        return (base or DeviceConfig()).replace(**self.fields)
+
+    def matches(self, config):
+        """True if config has every value of this preset"""
+        return config is not None and all(getattr(config, name) == value for name, value in self.fields.items())
+
+
+class ConfigPresetManager:
+    """Switch the glove between complete configurations
+
+    A preset replaces the whole config characteristic in a single write,
+    without reading it first. The write is verified through the config
+    notification the device sends back, or by reading the config when it
+    does not notify. The active preset is not stored anywhere: it is the
+    preset matching the service's shadow config, so a change made through a
+    config dialog is reflected right away.
+    """
+
+    PRESETS = (
+        ConfigPreset(
+            "low-power idle", "IMUs idle at 12.5 Hz, sensors every second",
+            cmd=DeviceConfig.CMD_IDLE,
+            imu1_accel_gyro_freq=1, imu1_mag_freq=0, imu2_accel_gyro_freq=1, imu2_mag_freq=0,
+            imu1_accel_range=1, imu1_gyro_range=2, imu1_mag_range=0,
+            imu2_accel_range=1, imu2_gyro_range=2, imu2_mag_range=0,
+            sensor_interval=1000),
+        ConfigPreset(
+            "208 Hz capture", "IMUs at 208 Hz, magnetometers at 40 Hz, sensors every 20 ms",
+            cmd=DeviceConfig.CMD_RUN,
+            imu1_accel_gyro_freq=5, imu1_mag_freq=6, imu2_accel_gyro_freq=5, imu2_mag_freq=6,
+            imu1_accel_range=1, imu1_gyro_range=2, imu1_mag_range=0,
+            imu2_accel_range=1, imu2_gyro_range=2, imu2_mag_range=0,
+            sensor_interval=20),
+        ConfigPreset(
+            "416 Hz high-fidelity", "IMUs at 416 Hz, magnetometers at 80 Hz, sensors every 10 ms",
+            cmd=DeviceConfig.CMD_RUN,
+            imu1_accel_gyro_freq=6, imu1_mag_freq=7, imu2_accel_gyro_freq=6, imu2_mag_freq=7,
+            imu1_accel_range=2, imu1_gyro_range=3, imu1_mag_range=0,
+            imu2_accel_range=2, imu2_gyro_range=3, imu2_mag_range=0,
+            sensor_interval=10),
+    )
+
+    def __init__(self, service, presets=None):
+        """Initialize manager
+
+        Args:
+            service: Connected ESP32BLEService
+            presets: Optional ConfigPresets replacing the built-in ones
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.service = service
+        self.presets = {preset.name: preset for preset in (presets or self.PRESETS)}
+
+    def names(self):
+        return list(self.presets)
+
+    def match(self, config):
+        """Name of the preset config matches, or None"""
+        for preset in self.presets.values():
+            if preset.matches(config):
+                return preset.name
+        return None
+
+    def active(self):
+        """Name of the preset the device runs, or None for a custom configuration"""
+        return self.match(self.service.device_config)
+
+    async def apply(self, name):
+        """Write a preset in one write and wait until the device confirms it
+
+        Raises:
+            KeyError: for an unknown preset name
+        Returns:
+            bool: True if the device runs the preset
+        """
+        preset = self.presets[name]
+        current = await self.service.get_config()
+        if current is None:
+            print(f"❌ Cannot apply preset {name}: device config unknown")
+            return False
+        target = preset.config(current)
+        if not current.diff(target):
+            print(f"✓ Preset {name} already active")
+            return True
+
+        # Register before writing so the confirming notification cannot be missed
+        waiter = self.service.expect_config_notify() if self.service.CONFIG_UUID in self.service.notifying else None
+        if not await self.service.write_config(target):
+            print(f"❌ Could not write preset {name}")
+            return False
+        if not await self._verify(target, waiter):
+            print(f"❌ Device did not confirm preset {name}")
+            return False
+        print(f"✓ Applied preset {name}")
+        return True
+
+    async def _verify(self, target, waiter):
+        """Wait for a config notification with the target values, read the config if none arrives"""
+        if waiter is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.config.PRESET_VERIFY_TIMEOUT
+            try:
+                while True:
+                    notified = await asyncio.wait_for(waiter, max(0.0, deadline - loop.time()))
+                    if notified is None:  # Disconnected
+                        return False
+                    if notified == target:
+                        return True
+                    waiter = self.service.expect_config_notify()
+            except asyncio.TimeoutError:
+                print("Warning: No config notification, reading the config back")
+        data = await self.service.read_config()
+        return data is not None and DeviceConfig.from_bytes(data) == target
+
+    def session_metadata(self):
+        """Device config details for session log headers
+
+        Returns:
+            dict: 'preset' (name or None), 'device_config' (hex) and 'config' (field -> value name)
+        """
+        config = self.service.device_config
+        return {
+            'preset': self.match(config),
+            'device_config': config.raw_data.hex() if config else None,
+            'config': config.names() if config else None,
+        }
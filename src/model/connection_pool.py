@@ -0,0 +1,168 @@
+import asyncio
+import os
+from src.config.app_config import AppConfig
+from src.model.ble_service import BLEDeviceInfo
+from src.model.esp32_service import ESP32BLEService
+from src.model.session_recorder import SessionRecorder
+from src.model.connection_profiler import ConnectionProfiler
+from src.model.link_supervisor import LinkSupervisor
+from src.model.config_presets import ConfigPresetManager
+
+class DeviceSession:
+    """One glove of a ConnectionPool
+
+    Owns an independent ESP32BLEService (client, notification handlers and
+    ring buffers) and, when given a folder, a SessionRecorder logging every
+    stream of this glove. A LinkSupervisor reconnects it after link loss.
+    """
+
+    def __init__(self, address, path=None, name=None, preset=None):
+        """Initialize session
+
+        Args:
+            address: BLE address of the device
+            path: Session folder for the recorder, None to only fill the ring buffers
+            name: Optional label, e.g. "left" or "right"
+            preset: Name of a config preset applied before streaming
+        """
+        self.address = address
+        self.path = path
+        self.name = name or address
+        self.preset = preset
+        self.service = ESP32BLEService.create_session()
+        self.device_info = BLEDeviceInfo(address, self.name)
+        self.recorder = None
+        self.supervisor = LinkSupervisor(self.service)
+        self.presets = ConfigPresetManager(self.service)
+        self._subscribed = []
+
+    async def open(self):
+        """Connect and start streaming
+
+        Returns:
+            bool: True if the device is connected and all streams are subscribed
+        """
+        profiler = ConnectionProfiler()  # Get singleton instance
+        self.service.set_loop(asyncio.get_running_loop())
+        if not await self.service.connect(self.device_info):
+            print(f"❌ Could not connect to {self.name}")
+            return False
+        try:
+            if self.preset and not await self.presets.apply(self.preset):
+                error = f"❌ Could not apply preset {self.preset} to {self.name}"
+            elif not await self._start_streams():
+                error = f"❌ Could not start notifications of {self.name}"
+            else:
+                error = None
+        except Exception:
+            profiler.finish(False)
+            await self.close()
+            raise
+        if error:
+            print(error)
+            profiler.finish(False)
+            await self.close()
+            return False
+        trace = profiler.finish(True)
+        if trace:
+            print(f"✓ {self.name} streaming after {trace.total:.2f} s")
+        self.supervisor.start()
+        return True
+
+    async def _start_streams(self):
+        """Subscribe every buffered stream, through the recorder when logging"""
+        if self.path:
+            metadata = dict(self.presets.session_metadata(), address=self.address, name=self.name)
+            self.recorder = SessionRecorder(self.service, self.path, metadata)
+            return await self.recorder.start()
+        for uuid in self.service.buffers:
+            if not await self.service.start_stream_notify(uuid):
+                return False
+            self._subscribed.append(uuid)
+        return True
+
+    async def close(self):
+        """Stop streaming and disconnect"""
+        await self.supervisor.stop()
+        if self.recorder:
+            await self.recorder.stop()
+            self.recorder = None
+        if self.service.is_connected():
+            for uuid in self._subscribed:
+                await self.service.stop_stream_notify(uuid)
+        self._subscribed = []
+        await self.service.disconnect()
+
+    def is_connected(self):
+        return self.service.is_connected() or self.supervisor.recovering()
+
+
+class ConnectionPool:
+    """Hold several connected gloves at once
+
+    ESP32BLEService() and DeviceManager() are shared instances serving the
+    GUI's single device; the pool creates an independent service per device
+    instead, so every glove has its own notification pipeline and logger.
+    All sessions share the running event loop.
+    """
+
+    def __init__(self, max_devices=None):
+        """Initialize pool
+
+        Args:
+            max_devices: Most sessions held at once, defaults to AppConfig.POOL_MAX_DEVICES
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.max_devices = max_devices or self.config.POOL_MAX_DEVICES
+        self.sessions = {}  # Address -> DeviceSession
+
+    async def add(self, address, path=None, name=None, preset=None):
+        """Connect one more device
+
+        Returns:
+            DeviceSession, or None if the device could not be connected
+        """
+        address = address.upper()
+        if address in self.sessions:
+            return self.sessions[address]
+        if len(self.sessions) >= self.max_devices:
+            print(f"❌ Connection pool is full ({self.max_devices} devices)")
+            return None
+        session = DeviceSession(address, path, name, preset)
+        self.sessions[address] = session
+        if not await session.open():
+            del self.sessions[address]
+            return None
+        return session
+
+    async def add_all(self, addresses, out_dir=None, preset=None):
+        """Connect several devices concurrently
+
+        Args:
+            addresses: BLE addresses
+            out_dir: Folder in which each device gets a session subfolder, None for no logging
+            preset: Name of a config preset applied to every device
+        Returns:
+            list: DeviceSession or None for every address
+        """
+        def session_path(address):
+            if out_dir is None:
+                return None
+            return os.path.join(out_dir, address.replace(':', ''))
+
+        return await asyncio.gather(*(self.add(address, session_path(address), preset=preset)
+                                      for address in addresses))
+
+    async def remove(self, address):
+        """Disconnect one device"""
+        session = self.sessions.pop(address.upper(), None)
+        if session:
+            await session.close()
+
+    async def close(self):
+        """Disconnect every device"""
+        sessions, self.sessions = list(self.sessions.values()), {}
+        await asyncio.gather(*(session.close() for session in sessions), return_exceptions=True)
+
+    def __len__(self):
+        return len(self.sessions)
@@ -0,0 +1,179 @@
+import contextvars
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from src.config.app_config import AppConfig
+
+# Phase enclosing code running in the current task; a context variable so
+# phases started concurrently with asyncio.gather nest correctly
+_parent = contextvars.ContextVar('connection_phase_parent', default=None)
+# Trace begun in the current task, so devices connected concurrently by
+# ConnectionPool each record their own trace
+_trace = contextvars.ContextVar('connection_trace', default=None)
+
+
+class ConnectionPhase:
+    """One timed step of a connection"""
+
+    __slots__ = ('name', 'start', 'duration', 'parent', 'depth', 'ok', 'details')
+
+    def __init__(self, name, start, parent, details):
+        self.name = name
+        self.start = start  # Seconds since the trace began
+        self.duration = None
+        self.parent = parent  # Enclosing ConnectionPhase or None
+        self.depth = parent.depth + 1 if parent else 0
+        self.ok = True
+        self.details = details
+
+
+class ConnectionTrace:
+    """Phases of one connection, from scan to the last started service"""
+
+    def __init__(self, address=None):
+        self.address = address
+        self.created = time.time()
+        self.started = time.perf_counter()
+        self.phases = []
+        self.success = None
+        self.total = None
+
+    def ordered_phases(self):
+        """Phases in tree order: every phase directly followed by its children"""
+        children = {}
+        for phase in self.phases:
+            children.setdefault(phase.parent, []).append(phase)
+        ordered = []
+        stack = list(reversed(children.get(None, [])))
+        while stack:
+            phase = stack.pop()
+            ordered.append(phase)
+            stack.extend(reversed(children.get(phase, [])))
+        return ordered
+
+    def to_dict(self):
+        index = {phase: i for i, phase in enumerate(self.phases)}
+        return {
+            'address': self.address,
+            'created': self.created,
+            'success': self.success,
+            'total': round(self.total or 0.0, 4),
+            'phases': [
+                dict(phase.details, name=phase.name, start=round(phase.start, 4),
+                     duration=round(phase.duration or 0.0, 4), parent=index.get(phase.parent),
+                     ok=phase.ok)
+                for phase in self.phases
+            ],
+        }
+
+
+class ConnectionProfiler:
+    """Record how long every phase of connecting to a device takes
+
+    A trace starts with a scan (begin) or a connect (begin_connection) and
+    ends with finish(), which appends it as one JSON line to
+    AppConfig.CONNECTION_LOG_FILE. Phases outside a trace are not recorded.
+    A task that began a trace keeps recording into it even when other tasks
+    begin traces of their own; other tasks use the most recently begun one.
+    """
+
+    _instance = None
+
+    # Finished traces kept in memory for the timeline
+    HISTORY = 20
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.config = AppConfig()  # Get singleton instance
+            self.current = None
+            self.history = deque(maxlen=self.HISTORY)
+            self.initialized = True
+
+    def begin(self, address=None):
+        """Start a new trace, dropping an unfinished one"""
+        self.current = ConnectionTrace(address)
+        _trace.set(self.current)
+        return self.current
+
+    def begin_connection(self, address):
+        """Continue the scan trace with a connect to address, or start a new trace"""
+        trace = self._active()
+        if trace is None or trace.address not in (None, address):
+            return self.begin(address)
+        trace.address = address
+        _trace.set(trace)
+        return trace
+
+    def _active(self):
+        """Unfinished trace of the current task, else the most recently begun one"""
+        trace = _trace.get()
+        if trace is not None and trace.success is None:
+            return trace
+        return self.current
+
+    @contextmanager
+    def phase(self, name, **details):
+        """Time the enclosed block as a phase of the current trace
+
+        The yielded ConnectionPhase can be marked failed (ok = False) or given
+        more details; an exception leaving the block marks it failed too.
+        """
+        trace = self._active()
+        parent = _parent.get()
+        if trace is None or parent not in trace.phases:
+            parent = None  # Outside any phase, or left over from an earlier trace
+        phase = ConnectionPhase(name, 0.0, parent, details)
+        if trace is None:
+            yield phase
+            return
+        start = time.perf_counter()
+        phase.start = start - trace.started
+        trace.phases.append(phase)
+        token = _parent.set(phase)
+        try:
+            yield phase
+        except BaseException:
+            phase.ok = False
+            raise
+        finally:
+            _parent.reset(token)
+            phase.duration = time.perf_counter() - start
+
+    def finish(self, success):
+        """End the current trace and write it to the log file
+
+        Returns:
+            The finished ConnectionTrace, or None if no trace was running
+        """
+        trace = self._active()
+        if trace is None:
+            return None
+        if trace is self.current:
+            self.current = None
+        trace.success = success
+        trace.total = time.perf_counter() - trace.started
+        self.history.append(trace)
+        self._write(trace)
+        return trace
+
+    def latest(self):
+        """Running trace, else the last finished one, else None"""
+        if self.current is not None:
+            return self.current
+        return self.history[-1] if self.history else None
+
+    def _write(self, trace):
+        path = self.config.CONNECTION_LOG_FILE
+        if not path:
+            return
+        try:
+            with open(path, 'a') as f:
+                f.write(json.dumps(trace.to_dict()) + '\n')
+        except Exception as e:
+            print(f"Error writing connection log: {e}")
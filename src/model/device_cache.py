@@ -0,0 +1,88 @@
+import json
+import os
+import time
+from src.config.app_config import AppConfig
+
+class DeviceCache:
+    """On-disk cache of discovered services and profile strings per device
+
+    Entries are keyed by device address and remember the firmware revision
+    they were read from. A reconnect uses the cached values instead of
+    reading them again; ESP32BLEService revalidates them in the background
+    and replaces the entry when the firmware, a profile string or the service
+    list changed.
+    """
+
+    _instance = None
+
+    FORMAT_VERSION = 1
+    PROFILE_FIELDS = ('firmware', 'model', 'manufacturer', 'hardware')
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.config = AppConfig()  # Get singleton instance
+            self.path = self.config.DEVICE_CACHE_FILE
+            self._devices = self._load()
+            self.initialized = True
+
+    def get(self, address):
+        """Cached entry of a device
+
+        Returns:
+            dict with the profile fields, 'services' (service UUIDs) and
+            'updated', or None if the device is not cached
+        """
+        if not self.path:
+            return None
+        return self._devices.get(address.upper())
+
+    def store(self, address, device_info, services):
+        """Remember the profile strings of device_info and the service UUIDs
+
+        Returns:
+            bool: True if the entry changed
+        """
+        if not self.path:
+            return False
+        entry = {field: getattr(device_info, field, None) for field in self.PROFILE_FIELDS}
+        entry['services'] = sorted(str(uuid).lower() for uuid in services)
+        previous = self._devices.get(address.upper())
+        if previous and all(previous.get(key) == value for key, value in entry.items()):
+            return False
+        entry['updated'] = time.time()
+        self._devices[address.upper()] = entry
+        self._save()
+        return True
+
+    def invalidate(self, address):
+        """Forget a device"""
+        if self._devices.pop(address.upper(), None) is not None:
+            self._save()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != self.FORMAT_VERSION:
+                return {}
+            return data.get('devices', {})
+        except Exception as e:
+            print(f"Error loading device cache: {e}")
+            return {}
+
+    def _save(self):
+        # Write to a temporary file first so a crash never leaves a truncated cache
+        try:
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump({'version': self.FORMAT_VERSION, 'devices': self._devices}, f, indent=2)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving device cache: {e}")
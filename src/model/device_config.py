@@ -0,0 +1,213 @@
+import struct
+from src.model.sample import Sample, field
+
+class DeviceConfig(Sample):
+    """Model class for the 15-byte config characteristic
+
+    The one place that knows the config layout. Values are the raw codes
+    written to the device; the *_MAP tables give their names. Instances are
+    immutable: replace() returns a changed copy and diff() the fields two
+    configs differ in, so a write can be skipped when nothing changed.
+    """
+
+    # Commands of the cmd field
+    CMD_IDLE = 0
+    CMD_RUN = 1
+    CMD_CALIBRATE_IMU1 = 2
+    CMD_CALIBRATE_IMU2 = 3
+    CMD_NAMES = {
+        CMD_IDLE: "IDLE",
+        CMD_RUN: "RUN",
+        CMD_CALIBRATE_IMU1: "IMU1 CALIB",
+        CMD_CALIBRATE_IMU2: "IMU2 CALIB",
+    }
+
+    # Config value to name mappings
+    ACCEL_GYRO_FREQ_MAP = {
+        0: "LSM6DS_RATE_SHUTDOWN",
+        1: "LSM6DS_RATE_12_5_HZ",
+        2: "LSM6DS_RATE_26_HZ",
+        3: "LSM6DS_RATE_52_HZ",
+        4: "LSM6DS_RATE_104_HZ",
+        5: "LSM6DS_RATE_208_HZ",
+        6: "LSM6DS_RATE_416_HZ"
+    }
+
+    # Accel/gyro frequency code to IMU samples per second
+    ACCEL_GYRO_RATE_HZ = {0: 0.0, 1: 12.5, 2: 26.0, 3: 52.0, 4: 104.0, 5: 208.0, 6: 416.0}
+
+    MAG_FREQ_MAP = {
+        0: "LIS3MDL_DATARATE_0_625_HZ",
+        1: "LIS3MDL_DATARATE_1_25_HZ",
+        2: "LIS3MDL_DATARATE_2_5_HZ",
+        3: "LIS3MDL_DATARATE_5_HZ",
+        4: "LIS3MDL_DATARATE_10_HZ",
+        5: "LIS3MDL_DATARATE_20_HZ",
+        6: "LIS3MDL_DATARATE_40_HZ",
+        7: "LIS3MDL_DATARATE_80_HZ"
+    }
+
+    ACCEL_RANGE_MAP = {
+        0: "LSM6DS_ACCEL_RANGE_2_G",
+        1: "LSM6DS_ACCEL_RANGE_4_G",
+        2: "LSM6DS_ACCEL_RANGE_8_G",
+        3: "LSM6DS_ACCEL_RANGE_16_G"
+    }
+
+    GYRO_RANGE_MAP = {
+        0: "LSM6DS_GYRO_RANGE_125_DPS",
+        1: "LSM6DS_GYRO_RANGE_250_DPS",
+        2: "LSM6DS_GYRO_RANGE_500_DPS",
+        3: "LSM6DS_GYRO_RANGE_1000_DPS",
+        4: "LSM6DS_GYRO_RANGE_2000_DPS"
+    }
+
+    MAG_RANGE_MAP = {
+        0: "LIS3MDL_RANGE_4_GAUSS",
+        1: "LIS3MDL_RANGE_8_GAUSS",
+        2: "LIS3MDL_RANGE_12_GAUSS",
+        3: "LIS3MDL_RANGE_16_GAUSS"
+    }
+
+    SENSOR_INTERVAL_RANGE = (1, 0xFFFF)  # Milliseconds
+
+    __slots__ = ()
+    FIELDS = ('cmd',
+              'imu1_accel_gyro_freq', 'imu1_mag_freq', 'imu2_accel_gyro_freq', 'imu2_mag_freq',
+              'imu1_accel_range', 'imu1_gyro_range', 'imu1_mag_range',
+              'imu2_accel_range', 'imu2_gyro_range', 'imu2_mag_range',
+              'sensor_interval', 'reserved')
+    STRUCT = struct.Struct('<11BHH')  # 11 uint8 codes, uint16 interval in ms, uint16 reserved
+    SIZE = STRUCT.size
+
+    # Table each code field is validated against
+    FIELD_MAPS = {
+        'cmd': CMD_NAMES,
+        'imu1_accel_gyro_freq': ACCEL_GYRO_FREQ_MAP,
+        'imu1_mag_freq': MAG_FREQ_MAP,
+        'imu2_accel_gyro_freq': ACCEL_GYRO_FREQ_MAP,
+        'imu2_mag_freq': MAG_FREQ_MAP,
+        'imu1_accel_range': ACCEL_RANGE_MAP,
+        'imu1_gyro_range': GYRO_RANGE_MAP,
+        'imu1_mag_range': MAG_RANGE_MAP,
+        'imu2_accel_range': ACCEL_RANGE_MAP,
+        'imu2_gyro_range': GYRO_RANGE_MAP,
+        'imu2_mag_range': MAG_RANGE_MAP,
+    }
+
+    def __new__(cls, cmd=0, imu1_accel_gyro_freq=0, imu1_mag_freq=0, imu2_accel_gyro_freq=0, imu2_mag_freq=0,
+                imu1_accel_range=0, imu1_gyro_range=0, imu1_mag_range=0,
+                imu2_accel_range=0, imu2_gyro_range=0, imu2_mag_range=0,
+                sensor_interval=1000, reserved=0):
+        return tuple.__new__(cls, (cmd, imu1_accel_gyro_freq, imu1_mag_freq, imu2_accel_gyro_freq, imu2_mag_freq,
+                                   imu1_accel_range, imu1_gyro_range, imu1_mag_range,
+                                   imu2_accel_range, imu2_gyro_range, imu2_mag_range,
+                                   sensor_interval, reserved))
+
+    cmd = field(0)
+    imu1_accel_gyro_freq = field(1)
+    imu1_mag_freq = field(2)
+    imu2_accel_gyro_freq = field(3)
+    imu2_mag_freq = field(4)
+    imu1_accel_range = field(5)
+    imu1_gyro_range = field(6)
+    imu1_mag_range = field(7)
+    imu2_accel_range = field(8)
+    imu2_gyro_range = field(9)
+    imu2_mag_range = field(10)
+    sensor_interval = field(11)  # Milliseconds between flex, force and joystick updates
+    reserved = field(12)  # Kept as read from the device
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Create DeviceConfig from the characteristic value
+
+        Returns:
+            DeviceConfig, or None if data is shorter than SIZE bytes
+        """
+        if not data or len(data) < cls.SIZE:
+            return None
+        return cls._make(cls.STRUCT.unpack_from(data))
+
+    def encode_into(self, buffer, offset=0):
+        """Pack the config into a preallocated buffer, e.g. a reused bytearray"""
+        self.STRUCT.pack_into(buffer, offset, *self)
+
+    def imu(self, imu_number):
+        """Rate and range codes of one IMU
+
+        Returns:
+            dict: accel_gyro_freq, mag_freq, accel_range, gyro_range, mag_range
+        """
+        prefix = f"imu{imu_number}_"
+        return {name[len(prefix):]: value for name, value in zip(self.FIELDS, self) if name.startswith(prefix)}
+
+    def imu_rate_hz(self, imu_number):
+        """IMU samples per second, 0 while idle"""
+        if self.cmd == self.CMD_IDLE:
+            return 0.0
+        code = self.imu1_accel_gyro_freq if imu_number == 1 else self.imu2_accel_gyro_freq
+        return self.ACCEL_GYRO_RATE_HZ.get(code, 0.0)
+
+    @property
+    def sensor_rate_hz(self):
+        """Flex, force and joystick updates per second"""
+        return 1000.0 / max(self.sensor_interval, 1)
+
+    def replace(self, **fields):
+        """Copy with some fields changed
+
+        Raises:
+            KeyError: for an unknown field name
+            ValueError: for a value outside its table
+        """
+        unknown = set(fields) - set(self.FIELDS)
+        if unknown:
+            raise KeyError(f"Unknown config fields: {', '.join(sorted(unknown))}")
+        config = self._make(int(fields[name]) if name in fields else value for name, value in zip(self.FIELDS, self))
+        config.validate(fields)
+        return config
+
+    def diff(self, other):
+        """Fields whose value differs in other
+
+        Returns:
+            dict: field name -> value in other
+        """
+        return {name: new for name, old, new in zip(self.FIELDS, self, other) if old != new}
+
+    def errors(self, fields=None):
+        """Validation problems, one message per invalid field
+
+        Args:
+            fields: Names to check, all by default
+        """
+        fields = self.FIELDS if fields is None else fields
+        errors = []
+        for name in fields:
+            value = getattr(self, name)
+            table = self.FIELD_MAPS.get(name)
+            if table is not None:
+                if value not in table:
+                    errors.append(f"{name}={value!r} not in {sorted(table)}")
+            elif name == 'sensor_interval':
+                low, high = self.SENSOR_INTERVAL_RANGE
+                if not isinstance(value, int) or not low <= value <= high:
+                    errors.append(f"{name}={value!r} not in {low}..{high} ms")
+        return errors
+
+    def validate(self, fields=None):
+        """Raise ValueError if a field is outside its table"""
+        errors = self.errors(fields)
+        if errors:
+            raise ValueError(f"Invalid config: {'; '.join(errors)}")
+
+    def names(self):
+        """Field name -> table name of its value, raw value for fields without a table"""
+        return {
+            name: self.FIELD_MAPS[name].get(value, value) if name in self.FIELD_MAPS else value
+            for name, value in zip(self.FIELDS, self)
+        }
+
+    def to_dict(self):
+        return dict(zip(self.FIELDS, self))
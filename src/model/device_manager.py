@@ -1,4 +1,7 @@
 import asyncio
+from src.config.app_config import AppConfig
+from src.model.connection_profiler import ConnectionProfiler
+
 class DeviceManager:
     """Class for managing device services and notifications"""
     
@@ -17,6 +20,7 @@ class DeviceManager:
             presenters: Dictionary containing presenter instances
         """
         if not hasattr(self, 'initialized'):
+            self.config = AppConfig()  # Get singleton instance
             self.service = ble_service
             self.presenters = presenters
             self._verify_required_presenters()
@@ -31,23 +35,26 @@ class DeviceManager:
 
     async def _start_service_with_retry(self, service_name, max_retries=5, delay=0.2):
         """Start a service with retry logic and delay"""
-        for attempt in range(max_retries):
-            try:
-                if await self.presenters[service_name].start_notifications():
-                    return True
-                await asyncio.sleep(delay)
-            except Exception:
-                if attempt < max_retries - 1:
+        with ConnectionProfiler().phase(f"start {service_name}") as phase:
+            for attempt in range(max_retries):
+                phase.details['attempts'] = attempt + 1
+                try:
+                    if await self.presenters[service_name].start_notifications():
+                        return True
                     await asyncio.sleep(delay)
+                except Exception:
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(delay)
+            phase.ok = False
         return False
 
     async def start_services(self):
-        """Start all device services after connection with improved error handling"""
-        try:
-            # Wait for services to be fully discovered
-            await asyncio.sleep(0.5)
+        """Start all device services after connection with improved error handling
 
-            # Start services in sequence with delays
+        Finishes the ConnectionProfiler trace begun by connect().
+        """
+        profiler = ConnectionProfiler()  # Get singleton instance
+        try:
             services = [
                 'overall_status',  # Start first for device monitoring
                 'imu1',           # IMU services first
@@ -56,26 +63,60 @@ class DeviceManager:
                 'gamepad'         # Finally gamepad
             ]
 
-            failures = []
-            for service in services:
-                if not await self._start_service_with_retry(service):
-                    failures.append(service)
-                await asyncio.sleep(0.3)  # Delay between services
+            with profiler.phase("start_services", mode=self.config.SUBSCRIBE_MODE) as phase:
+                if self.config.SUBSCRIBE_MODE == "concurrent":
+                    failures = await self._start_services_concurrently(services)
+                else:
+                    failures = await self._start_services_sequentially(services)
+                phase.ok = not failures
 
             # Even if some services fail, try to read timestamp
-            await self.presenters['timestamp'].read_timestamp()
+            with profiler.phase("read timestamp"):
+                await self.presenters['timestamp'].read_timestamp()
 
             # Handle critical services
             critical_services = {'imu1', 'imu2'}
             if critical_services.intersection(failures):
                 await self.cleanup()
+                profiler.finish(False)
                 return False
+            profiler.finish(True)
             return True
 
         except Exception:
             await self.cleanup()
+            profiler.finish(False)
             return False
             
+    async def _start_services_sequentially(self, services):
+        """Start services one by one with settle delays, returns the failed ones"""
+        profiler = ConnectionProfiler()  # Get singleton instance
+
+        # Wait for services to be fully discovered
+        with profiler.phase("settle wait"):
+            await asyncio.sleep(0.5)
+
+        failures = []
+        for service in services:
+            if not await self._start_service_with_retry(service):
+                failures.append(service)
+            with profiler.phase("settle wait"):
+                await asyncio.sleep(0.3)  # Delay between services
+        return failures
+
+    async def _start_services_concurrently(self, services):
+        """Start all services at once, returns the failed ones
+
+        connect() has already checked service discovery, so no settle delay
+        is needed. The service bounds how many start_notify calls are in
+        flight and retries each characteristic on its own, so a presenter is
+        only started once.
+        """
+        results = await asyncio.gather(
+            *(self._start_service_with_retry(service, max_retries=1) for service in services),
+            return_exceptions=True)
+        return [service for service, result in zip(services, results) if result is not True]
+
     async def cleanup(self):
         """Clean up all device services"""
         try:
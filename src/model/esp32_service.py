@@ -5,7 +5,84 @@ from src.model.sensor import FlexSensorData, ForceSensorData
 from src.model.gamepad import JoystickData, ButtonsData
 from src.model.overall_status import OverallStatus
 from src.model.battery import BatteryLevelData, BatteryStateData
+from src.model.device_config import DeviceConfig
+from src.model.sample import Sample, parse_frame_header, SEQUENCE_MASK, SEQUENCE_HALF
+from src.model.ring_buffer import RingBuffer
+from src.config.app_config import AppConfig
+from src.model.connection_profiler import ConnectionProfiler
+from src.model.device_cache import DeviceCache
+from src.model.metrics import MetricsRegistry
+from time import monotonic
+import numpy as np
 import asyncio
+import inspect
+import struct
+from collections import Counter
+
+def _ignore(*args):
+    """Stands in for metric updates while metrics are disabled"""
+
+
+class CharacteristicDecoder:
+    """Prebuilt decode path for one characteristic
+
+    Kinds:
+        config: raw config bytes, delivered as a hex string
+        text: UTF-8 profile strings
+        battery: battery models, delivered as a display value
+        sample: Sample models, unpacked with the class STRUCT and ring buffered
+        model: other models, unpacked with the class STRUCT
+    """
+
+    __slots__ = ('name', 'uuid', 'kind', 'data_class', 'unpack', 'build', 'value')
+
+    def __init__(self, name, uuid, data_class):
+        self.name = name
+        self.uuid = uuid
+        self.data_class = data_class
+        self.unpack = None
+        self.build = None
+        self.value = None
+
+        if data_class is None:
+            self.kind = "config"
+        elif data_class is str:
+            self.kind = "text"
+        else:
+            if data_class in (BatteryLevelData, BatteryStateData):
+                self.kind = "battery"
+            elif issubclass(data_class, Sample):
+                self.kind = "sample"
+            else:
+                self.kind = "model"
+            # Battery payloads may carry more than the one byte we use, the rest is ignored
+            self.unpack = data_class.STRUCT.unpack_from if self.kind == "battery" else data_class.STRUCT.unpack
+            # Classes that validate values provide from_values, others are built directly
+            self.build = getattr(data_class, 'from_values', None) or data_class._make
+            if data_class is BatteryLevelData:
+                self.value = lambda sample: sample.level
+            elif data_class is BatteryStateData:
+                self.value = lambda sample: sample.state_text
+
+    def decode(self, data):
+        """Decode one payload, None if it cannot be parsed"""
+        if self.kind == "config":
+            return None
+        if self.kind == "text":
+            return data.decode('utf-8')
+        try:
+            return self.build(self.unpack(data))
+        except struct.error as e:
+            print(f"Error parsing {self.data_class.__name__} data: {e}")
+            return None
+
+
+def build_decoders(characteristics):
+    """Build the case-normalised UUID -> CharacteristicDecoder registry"""
+    return {
+        uuid.lower(): CharacteristicDecoder(name, uuid, data_class)
+        for name, (uuid, data_class) in characteristics.items()
+    }
 
 class ESP32BLEService(BLEService):
     """ESP32-specific BLE service implementation"""
@@ -18,49 +95,12 @@ class ESP32BLEService(BLEService):
         "Device": "0000180a-0000-1000-8000-00805f9b34fb"
     }
     
-    # Config value to name mappings
-    ACCEL_GYRO_FREQ_MAP = {
-        0: "LSM6DS_RATE_SHUTDOWN",
-        1: "LSM6DS_RATE_12_5_HZ",
-        2: "LSM6DS_RATE_26_HZ",
-        3: "LSM6DS_RATE_52_HZ",
-        4: "LSM6DS_RATE_104_HZ",
-        5: "LSM6DS_RATE_208_HZ",
-        6: "LSM6DS_RATE_416_HZ"
-    }
-
-    MAG_FREQ_MAP = {
-        0: "LIS3MDL_DATARATE_0_625_HZ",
-        1: "LIS3MDL_DATARATE_1_25_HZ",
-        2: "LIS3MDL_DATARATE_2_5_HZ",
-        3: "LIS3MDL_DATARATE_5_HZ",
-        4: "LIS3MDL_DATARATE_10_HZ",
-        5: "LIS3MDL_DATARATE_20_HZ",
-        6: "LIS3MDL_DATARATE_40_HZ",
-        7: "LIS3MDL_DATARATE_80_HZ"
-    }
-
-    ACCEL_RANGE_MAP = {
-        0: "LSM6DS_ACCEL_RANGE_2_G",
-        1: "LSM6DS_ACCEL_RANGE_4_G",
-        2: "LSM6DS_ACCEL_RANGE_8_G",
-        3: "LSM6DS_ACCEL_RANGE_16_G"
-    }
-
-    GYRO_RANGE_MAP = {
-        0: "LSM6DS_GYRO_RANGE_125_DPS",
-        1: "LSM6DS_GYRO_RANGE_250_DPS",
-        2: "LSM6DS_GYRO_RANGE_500_DPS",
-        3: "LSM6DS_GYRO_RANGE_1000_DPS",
-        4: "LSM6DS_GYRO_RANGE_2000_DPS"
-    }
-
-    MAG_RANGE_MAP = {
-        0: "LIS3MDL_RANGE_4_GAUSS",
-        1: "LIS3MDL_RANGE_8_GAUSS",
-        2: "LIS3MDL_RANGE_12_GAUSS",
-        3: "LIS3MDL_RANGE_16_GAUSS"
-    }
+    # Config value to name mappings, layout and validation live in DeviceConfig
+    ACCEL_GYRO_FREQ_MAP = DeviceConfig.ACCEL_GYRO_FREQ_MAP
+    MAG_FREQ_MAP = DeviceConfig.MAG_FREQ_MAP
+    ACCEL_RANGE_MAP = DeviceConfig.ACCEL_RANGE_MAP
+    GYRO_RANGE_MAP = DeviceConfig.GYRO_RANGE_MAP
+    MAG_RANGE_MAP = DeviceConfig.MAG_RANGE_MAP
 
     # Reverse maps for config writing
     ACCEL_GYRO_FREQ_REV_MAP = {v: k for k, v in ACCEL_GYRO_FREQ_MAP.items()}
@@ -68,6 +108,9 @@ class ESP32BLEService(BLEService):
     ACCEL_RANGE_REV_MAP = {v: k for k, v in ACCEL_RANGE_MAP.items()}
     GYRO_RANGE_REV_MAP = {v: k for k, v in GYRO_RANGE_MAP.items()}
     MAG_RANGE_REV_MAP = {v: k for k, v in MAG_RANGE_MAP.items()}
+
+    # Config fields that are commands rather than settings, written even when unchanged
+    COMMAND_FIELDS = frozenset({'cmd'})
     
     # Device UUIDs and their corresponding data classes
     CHARACTERISTICS = {
@@ -97,10 +140,36 @@ class ESP32BLEService(BLEService):
         "BUTTONS_UUID": ("34afe3d1-643e-4fe7-abd2-7e7a0cfb1601", ButtonsData)
     }
 
+    # Dispatch registry built once at class creation, keyed by lower-case UUID
+    DECODERS = build_decoders(CHARACTERISTICS)
+
+    # Rows kept per characteristic ring buffer (about 20 s of IMU data at 416 Hz)
+    RING_BUFFER_CAPACITY = 8192
+
     def __init__(self):
         super().__init__()
+        self.config = AppConfig()  # Get singleton instance
+        self._subscribe_slots = None  # Semaphore bounding concurrent start_notify calls
+        self._revalidate_task = None  # Background re-read of cached device profiles
+        # Last known device config, kept current by reads, writes and config notifications
+        self._config_shadow = None
+        self._config_patch = {}  # Field changes waiting for the next config write
+        self._config_flush = None  # Task writing the pending field changes
+        self._config_listeners = []
+        self._config_waiters = []  # Futures waiting for the next config notification
         # Create UUID class attributes and initialize callbacks dictionary
         self._callbacks = {}
+        self.lost_samples = {}  # Samples missing from framed notifications, by UUID
+        self.notifying = set()  # UUIDs with active notifications
+        # UUID -> Counter of the owners holding the subscription, see start_stream_notify
+        self._owners = {}
+        self._callback_owners = {}  # UUID -> owner whose callback the handler calls
+        self.raw_capture = None  # Optional RawCaptureWriter fed with every notification payload
+        # One preallocated ring buffer per sample characteristic, filled by the notification handlers
+        self.buffers = {
+            decoder.uuid: RingBuffer(decoder.data_class.DTYPE, self.RING_BUFFER_CAPACITY)
+            for decoder in self.DECODERS.values() if decoder.kind in ("sample", "battery")
+        }
         self.loop = None  # Event loop set by presenter
         for name, (uuid, _) in self.CHARACTERISTICS.items():
             setattr(self, name, uuid)
@@ -132,7 +201,8 @@ class ESP32BLEService(BLEService):
             max_retries = 5
             for attempt in range(max_retries):
                 # Wait for services to be discovered
-                await asyncio.sleep(0.2)
+                with ConnectionProfiler().phase("discovery poll", attempt=attempt + 1):
+                    await asyncio.sleep(0.2)
 
                 # Check if still connected
                 if not self.client or not self.client.is_connected:
@@ -198,77 +268,232 @@ class ESP32BLEService(BLEService):
             return None
         try:
             data = await self.read_characteristic(self.CONFIG_UUID)
-            if not data or len(data) < 15:  # Must have at least 15 bytes
+            if not data or len(data) < DeviceConfig.SIZE:  # Must have at least 15 bytes
                 return None
+            self._set_config_shadow(data)
             return data
         except Exception as e:
             print(f"Error reading config: {e}")
             return None
+
+    async def get_config(self):
+        """Current configuration from the shadow
+
+        The shadow is only trusted while config notifications keep it up to
+        date; otherwise the config is read from the device.
+
+        Returns:
+            DeviceConfig, or None
+        """
+        if self._config_shadow is None or not self.config_notifying:
+            await self.read_config()
+        return self._config_shadow
+
+    @property
+    def device_config(self):
+        """Shadow config as DeviceConfig, None until it is known"""
+        return self._config_shadow
+
+    @property
+    def config_notifying(self):
+        """True while config notifications keep the shadow up to date"""
+        return self.CONFIG_UUID in self.notifying
+
+    async def update_config(self, **fields):
+        """Change config fields with a single write and no read
+
+        The fields (see DeviceConfig.FIELDS) are patched into the shadow config.
+        Calls made while a write is pending are merged into the next write,
+        and a patch that changes nothing is not written at all, except for
+        the command field: the firmware changes cmd by itself, so a command
+        is always written. Without config notifications the shadow is read
+        back from the device before every write.
+
+        Raises:
+            KeyError: for an unknown field name
+            ValueError: for a value outside its DeviceConfig table
+        Returns:
+            bool: True if the device has the requested values
+        """
+        DeviceConfig().replace(**fields)  # Reject bad fields before queueing them
+        if not self.is_connected():
+            return False
+        if self._config_shadow is None and await self.read_config() is None:
+            return False
+        self._config_patch.update(fields)
+        if self._config_flush is None or self._config_flush.done():
+            self._config_flush = asyncio.get_running_loop().create_task(self._flush_config())
+        return await asyncio.shield(self._config_flush)
+
+    async def _flush_config(self):
+        """Write pending field changes until none are left"""
+        ok = True
+        while self._config_patch:
+            await asyncio.sleep(0)  # Let patches from the same loop iteration join this write
+            patch, self._config_patch = self._config_patch, {}
+            if not self.config_notifying:
+                await self.read_config()  # The shadow may be stale
+            if self._config_shadow is None:
+                return False
+            config = self._config_shadow.replace(**patch)
+            if self.COMMAND_FIELDS.intersection(patch) or self._config_shadow.diff(config):
+                ok = await self.write_config(config, patch) and ok
+        return ok
+
+    def add_config_listener(self, listener):
+        """Call listener(DeviceConfig) whenever the shadow config changes"""
+        self._config_listeners.append(listener)
+
+    def remove_config_listener(self, listener):
+        if listener in self._config_listeners:
+            self._config_listeners.remove(listener)
+
+    def expect_config_notify(self):
+        """Future resolved with the DeviceConfig of the next config notification
+
+        Call it before the write whose notification is awaited.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._config_waiters.append(future)
+        return future
+
+    def _set_config_shadow(self, data):
+        config = data if isinstance(data, DeviceConfig) else DeviceConfig.from_bytes(data)
+        if config is None or config == self._config_shadow:
+            return
+        self._config_shadow = config
+        for listener in list(self._config_listeners):
+            try:
+                listener(config)
+            except Exception as e:
+                print(f"Error in config listener: {e}")
+
+    async def _start_config_shadow(self):
+        """Load the shadow config and follow config notifications if the device sends them"""
+        with ConnectionProfiler().phase("config shadow"):
+            if self._can_notify(self.CONFIG_UUID):
+                await asyncio.gather(self.read_config(), self.start_config_notify(None))
+            else:
+                await self.read_config()
+
+    def _can_notify(self, uuid):
+        """Check the notify property of a discovered characteristic"""
+        for service in self.client.services or []:
+            for characteristic in service.characteristics:
+                if str(characteristic.uuid).lower() == uuid.lower():
+                    return 'notify' in characteristic.properties
+        return False
             
-    async def write_config(self, data):
+    async def write_config(self, data, fields=None):
         """Write IMU and sensor configuration
         
         Args:
-            data (bytes): 15 bytes configuration data
+            data: DeviceConfig, or 15 bytes configuration data
+            fields: Names to validate, defaults to the fields that differ from the
+                shadow config (all of them without one); values the device
+                already reported are written back unchecked
         Returns:
             bool: True if successful
         """
-        if not self.is_connected() or not data or len(data) != 15:
+        if isinstance(data, DeviceConfig):
+            config = data
+        elif data and len(data) == DeviceConfig.SIZE:
+            config = DeviceConfig.from_bytes(data)
+        else:
+            return False
+        if not self.is_connected():
+            return False
+        if fields is None and self._config_shadow is not None:
+            fields = self._config_shadow.diff(config)
+        errors = config.errors(fields)
+        if errors:
+            print(f"❌ Invalid config: {'; '.join(errors)}")
             return False
         try:
-            await self.write_characteristic(self.CONFIG_UUID, data)
+            await self.write_characteristic(self.CONFIG_UUID, config.raw_data)
+            self._set_config_shadow(config)
             return True
         except Exception as e:
             print(f"Error writing config: {e}")
             return False
 
     async def connect(self, device_info):
-        """Connect to a BLE device and check profiles with improved error handling"""
+        """Connect to a BLE device and check profiles with improved error handling
+
+        Every phase is timed by ConnectionProfiler; the trace is finished
+        here on failure and by DeviceManager.start_services on success.
+        A device found in DeviceCache is connected with discovery limited to
+        its cached services and gets its profile strings from the cache;
+        they are re-read in the background once the connection is up.
+        """
+        profiler = ConnectionProfiler()  # Get singleton instance
+        profiler.begin_connection(device_info.address)
+        cached = DeviceCache().get(device_info.address)
         try:
             # First attempt connection with retry
             max_connect_retries = 5
             for attempt in range(max_connect_retries):
                 try:
-                    result = await super().connect(device_info)
+                    with profiler.phase("connect attempt", attempt=attempt + 1) as phase:
+                        result = await super().connect(device_info, cached['services'] if cached else None)
+                        phase.ok = result
                     if result:
                         break
                     if attempt < max_connect_retries - 1:
                         print(f"Connection attempt {attempt + 1} failed, retrying...")
-                        await asyncio.sleep(0.5)
+                        with profiler.phase("retry delay"):
+                            await asyncio.sleep(0.5)
                 except Exception as e:
                     print(f"Connection error on attempt {attempt + 1}: {e}")
                     if attempt < max_connect_retries - 1:
-                        await asyncio.sleep(0.5)
+                        with profiler.phase("retry delay"):
+                            await asyncio.sleep(0.5)
                         continue
                     raise
 
             if not result:
                 print("Failed to establish connection after retries")
+                profiler.finish(False)
                 return False
 
             # Wait for initial connection stability
-            await asyncio.sleep(1.0)
+            with profiler.phase("stability wait"):
+                await asyncio.sleep(1.0)
 
             # Check for required services with increased timeout
-            has_services = await self.check_services()
+            with profiler.phase("check services", cached=cached is not None) as phase:
+                if cached:
+                    has_services = self._has_required_services()
+                else:
+                    has_services = await self.check_services()
+                phase.ok = has_services
             if not has_services:
                 print("Required services not found")
+                DeviceCache().invalidate(device_info.address)
                 await self.disconnect()
+                profiler.finish(False)
                 return False
             
             # Additional wait after service discovery
-            await asyncio.sleep(0.5)
+            with profiler.phase("post-discovery wait"):
+                await asyncio.sleep(0.5)
             
-            try:
-                # Read device profiles and update device_info
-                print("Reading device profiles...")
-                device_info.firmware = await self.check_firmware_revision()
-                device_info.model = await self.check_model_number()
-                device_info.manufacturer = await self.check_manufacturer()
-                device_info.hardware = await self.check_hardware_revision()
-            except Exception as e:
-                print(f"Warning: Error reading device profiles: {e}")
-                # Continue even if profile reading fails
+            if cached:
+                print(f"✓ Using cached device profile (firmware {cached['firmware']})")
+                for field in DeviceCache.PROFILE_FIELDS:
+                    setattr(device_info, field, cached[field])
+                self._revalidate_task = asyncio.create_task(self._revalidate_profiles(device_info, cached))
+            else:
+                try:
+                    # Read device profiles and update device_info
+                    print("Reading device profiles...")
+                    await self._read_profiles(device_info)
+                    if device_info.firmware:
+                        DeviceCache().store(device_info.address, device_info,
+                                            [service.uuid for service in self.client.services])
+                except Exception as e:
+                    print(f"Warning: Error reading device profiles: {e}")
+                    # Continue even if profile reading fails
 
             # Start battery notifications if view exists
             if hasattr(device_info, 'view'):
@@ -277,13 +502,107 @@ class ESP32BLEService(BLEService):
                 except Exception as e:
                     print(f"Warning: Error starting battery notifications: {e}")
                     # Continue even if battery notifications fail
+
+            try:
+                await self._start_config_shadow()
+            except Exception as e:
+                print(f"Warning: Error reading device config: {e}")
                 
             return True
         except Exception as e:
             print(f"Fatal error during connection process: {e}")
             await self.disconnect()
+            profiler.finish(False)
             return False
 
+    async def attach_client(self, client, device_info):
+        """Use an already connected client, read device profiles and start battery notifications if a view is set"""
+        ConnectionProfiler().begin_connection(device_info.address)
+        result = await super().attach_client(client, device_info)
+        if not result:
+            ConnectionProfiler().finish(False)
+            return False
+        await self._read_profiles(device_info)
+        if hasattr(device_info, 'view'):
+            try:
+                await self._start_battery_notifications(device_info.view)
+            except Exception as e:
+                print(f"Warning: Error starting battery notifications: {e}")
+        try:
+            await self._start_config_shadow()
+        except Exception as e:
+            print(f"Warning: Error reading device config: {e}")
+        return result
+
+    def _profile_uuids(self):
+        """Characteristic UUID of every device information string, by device_info attribute"""
+        return {
+            'firmware': self.FIRMWARE_UUID,
+            'model': self.MODEL_NUMBER_UUID,
+            'manufacturer': self.MANUFACTURER_UUID,
+            'hardware': self.HARDWARE_UUID,
+        }
+
+    async def _read_profiles(self, device_info):
+        """Read the device information strings into device_info with one bulk read"""
+        profile_uuids = self._profile_uuids()
+        with ConnectionProfiler().phase("read profiles", reads=len(profile_uuids)):
+            values = await self.read_characteristics_data(profile_uuids.values())
+        for field, uuid in profile_uuids.items():
+            setattr(device_info, field, values[uuid])
+
+    def _has_required_services(self):
+        """Check the discovered services without waiting for discovery"""
+        services = {str(service.uuid).lower() for service in self.client.services or []}
+        missing = [name for name, uuid in self.REQUIRED_SERVICES.items() if uuid.lower() not in services]
+        for name in missing:
+            print(f"❌ Missing {name} service ({self.REQUIRED_SERVICES[name]})")
+        return not missing
+
+    async def _revalidate_profiles(self, device_info, cached):
+        """Re-read the profile strings of a device connected from the cache
+
+        A different firmware revision drops the cache entry, so the next
+        connect discovers all services again; other changed strings update
+        the entry.
+        """
+        try:
+            await asyncio.sleep(self.config.DEVICE_CACHE_REVALIDATE_DELAY)
+            if not self.is_connected():
+                return
+            address = device_info.address
+            profile_uuids = self._profile_uuids()
+            values = await self.read_characteristics_data(profile_uuids.values())
+            firmware = values[self.FIRMWARE_UUID]
+            if not firmware:
+                return
+            for field, uuid in profile_uuids.items():
+                setattr(device_info, field, values[uuid])
+            if firmware != cached['firmware']:
+                print(f"Firmware changed from {cached['firmware']} to {firmware}, dropping cached profile")
+                DeviceCache().invalidate(address)
+            elif DeviceCache().store(address, device_info, cached['services']):
+                print("Device profile changed, cache updated")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Warning: Error revalidating cached device profile: {e}")
+
+    async def disconnect(self):
+        """Disconnect from the device and forget active notifications"""
+        if self._revalidate_task and not self._revalidate_task.done():
+            self._revalidate_task.cancel()
+        self._revalidate_task = None
+        self.notifying.clear()
+        self._subscribe_slots = None
+        self._config_shadow = None
+        self._config_patch = {}
+        waiters, self._config_waiters = self._config_waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+        return await super().disconnect()
+
     async def _read_characteristic_data(self, uuid):
         """Generic method to read and parse characteristic data"""
         if not self.is_connected():
@@ -291,24 +610,37 @@ class ESP32BLEService(BLEService):
 
         try:
             data = await self.read_characteristic(uuid)
-            if not data:
-                return None
+            return self._decode_read(uuid, data)
+        except Exception as e:
+            print(f"Error reading characteristic {uuid}: {e}")
+            return None
 
-            # Get the data class for this UUID
-            data_class = next((cls for _, (u, cls) in self.CHARACTERISTICS.items() if u == uuid), None)
-            if not data_class:
-                return None
+    async def read_characteristics_data(self, uuids):
+        """Read several characteristics at once and decode them
 
-            # Handle string data types
-            if data_class == str:
-                return data.decode('utf-8')
-            
-            # Handle data model classes
-            return data_class.from_bytes(data)
+        Args:
+            uuids: Characteristic UUIDs to read
+        Returns:
+            dict: UUID -> decoded value, None for failed reads and unknown characteristics
+        """
+        values = await self.read_characteristics(uuids)
+        decoded = {}
+        for uuid, data in values.items():
+            try:
+                decoded[uuid] = self._decode_read(uuid, data)
+            except Exception as e:
+                print(f"Error decoding characteristic {uuid}: {e}")
+                decoded[uuid] = None
+        return decoded
 
-        except Exception as e:
-            print(f"Error reading characteristic {uuid}: {e}")
+    def _decode_read(self, uuid, data):
+        """Decode a read value with the characteristic's decoder"""
+        if not data:
             return None
+        decoder = self.DECODERS.get(uuid.lower())
+        if not decoder:
+            return None
+        return decoder.decode(data)
 
     async def _write_characteristic_data(self, uuid, data):
         """Generic method to write characteristic data"""
@@ -324,95 +656,383 @@ class ESP32BLEService(BLEService):
             print(f"Error writing characteristic {uuid}: {e}")
             return False
 
-    async def _generic_notification_handler(self, sender, data, callback, data_class):
-        """Generic handler for notifications"""
+    def _tap_handler(self, uuid, handler):
+        """Wrap a handler so raw payloads reach self.raw_capture while it is set"""
+        if inspect.iscoroutinefunction(handler):
+            async def tapped(sender, data):
+                capture = self.raw_capture
+                if capture is not None:
+                    self._capture_raw(capture, uuid, data)
+                await handler(sender, data)
+        else:
+            def tapped(sender, data):
+                capture = self.raw_capture
+                if capture is not None:
+                    self._capture_raw(capture, uuid, data)
+                handler(sender, data)
+        return tapped
+
+    @staticmethod
+    def _capture_raw(capture, uuid, data):
+        """Hand a payload to the raw capture, a failing capture never stops the handler"""
         try:
-            if data_class == str:
-                parsed_data = data.decode('utf-8')
+            capture.record(uuid, data)
+        except Exception as e:
+            print(f"Error capturing notification from {uuid}: {e}")
+
+    def _stream_metrics(self, decoder):
+        """StreamMetrics the handler of decoder feeds, None if metrics are disabled"""
+        if not self.config.METRICS_ENABLED:
+            return None
+        device = self.connected_device.address if self.connected_device else ""
+        return MetricsRegistry().stream(decoder.name.removesuffix("_UUID"), device)
+
+    def _make_notification_handler(self, decoder, callback):
+        """Build a notification handler specialised for one characteristic
+
+        Everything that depends only on the characteristic is resolved here, so
+        the per-packet path is one unpack plus the model constructor.
+        """
+        uuid = decoder.uuid
+
+        if decoder.kind == "config":
+            async def handler(sender, data):
+                self._set_config_shadow(data)
+                if self._config_waiters:
+                    config = DeviceConfig.from_bytes(data)
+                    waiters, self._config_waiters = self._config_waiters, []
+                    for future in waiters:
+                        if not future.done():
+                            future.set_result(config)
+                if callback:
+                    # For raw config data, format as hex string
+                    hex_str = ' '.join([f"{b:02X}" for b in data])
+                    self.loop.create_task(callback(hex_str))
+            return handler
+
+        if decoder.kind == "text":
+            async def handler(sender, data):
+                try:
+                    await callback(sender, data.decode('utf-8'))
+                except Exception as e:
+                    print(f"Error in notification handler for {uuid}: {e}")
+            return handler
+
+        unpack = decoder.unpack
+        build = decoder.build
+        name = decoder.data_class.__name__
+        metrics = self._stream_metrics(decoder)
+        record = metrics.record if metrics else _ignore
+        count_error = metrics.error if metrics else _ignore
+        observe_decode = metrics.decode.observe if metrics else _ignore
+
+        if decoder.kind == "model":
+            async def handler(sender, data):
+                t = monotonic()
+                timed = record(t)
+                try:
+                    parsed = build(unpack(data))
+                    if timed:
+                        observe_decode(monotonic() - t)
+                    if parsed:
+                        await callback(sender, parsed)
+                except Exception as e:
+                    count_error()
+                    print(f"Error in {name} notification handler: {e}")
+            return handler
+
+        buffer = self.buffers[uuid]
+        append = buffer.append
+
+        if decoder.kind == "battery" and callback is not None:
+            value = decoder.value
+
+            async def handler(sender, data):
+                t = monotonic()
+                record(t)
+                try:
+                    values = unpack(data)
+                    append(t, values)
+                    if metrics is not None:
+                        metrics.value = values[0]
+                    parsed = build(values)
+                    if parsed:
+                        # Special handling for battery data
+                        await callback(value(parsed))
+                except Exception as e:
+                    count_error()
+                    print(f"Error in {name} notification handler: {e}")
+            return handler
+
+        if decoder.kind == "battery":
+            # Buffer-only battery subscription
+            def handler(sender, data):
+                t = monotonic()
+                record(t)
+                try:
+                    values = unpack(data)
+                    append(t, values)
+                    if metrics is not None:
+                        metrics.value = values[0]
+                except Exception as e:
+                    count_error()
+                    print(f"Error in {name} notification handler: {e}")
+            return handler
+
+        size = decoder.data_class.STRUCT.size
+        iter_unpack = decoder.data_class.STRUCT.iter_unpack
+        dtype = decoder.data_class.DTYPE
+        extend = buffer.extend
+        self.lost_samples[uuid] = 0
+        next_sequence = [None]  # Expected sequence of the next framed sample
+
+        def ingest(data):
+            """Decode one payload into the ring buffer, returns the unpacked values"""
+            t = monotonic()
+
+            # Single-sample payload
+            if len(data) == size:
+                timed = record(t)
+                values = unpack(data)
+                append(t, values)
+                if timed:
+                    observe_decode(monotonic() - t)
+                return (values,)
+
+            # Multi-sample frame, decoded in one pass
+            frame = parse_frame_header(data, size)
+            if frame is None:
+                raise ValueError(f"unexpected payload of {len(data)} bytes")
+            sequence, count, body = frame
+            timed = record(t, count)
+            end = (sequence + count) & SEQUENCE_MASK
+            expected = next_sequence[0]
+            if expected is None:
+                next_sequence[0] = end
             else:
-                parsed_data = data_class.from_bytes(data)
+                lost = (sequence - expected) & SEQUENCE_MASK
+                if lost < SEQUENCE_HALF:  # Ahead of the expected sequence, 0 if none are missing
+                    self.lost_samples[uuid] += lost
+                    if metrics is not None:
+                        metrics.lost += lost
+                # A duplicate or late frame counts no loss and never moves the expected sequence back
+                if 0 < ((end - expected) & SEQUENCE_MASK) < SEQUENCE_HALF:
+                    next_sequence[0] = end
+            extend(t, np.frombuffer(body, dtype=dtype))
+            if timed:
+                observe_decode(monotonic() - t)
+            return iter_unpack(body)
 
-            if parsed_data and callback:
-                if isinstance(parsed_data, (BatteryLevelData, BatteryStateData)):
-                    # Special handling for battery data
-                    value = parsed_data.level if isinstance(parsed_data, BatteryLevelData) else parsed_data.state_text
-                    await callback(value)
-                else:
-                    await callback(sender, parsed_data)
+        if callback is None:
+            # Buffer-only subscription: consumers read the ring buffer at their own pace
+            def handler(sender, data):
+                try:
+                    ingest(data)
+                except Exception as e:
+                    count_error()
+                    print(f"Error in {name} notification handler: {e}")
+            return handler
 
-        except Exception as e:
-            print(f"Error in {data_class.__name__} notification handler: {e}")
+        async def handler(sender, data):
+            try:
+                for values in ingest(data):
+                    parsed = build(values)
+                    if parsed:
+                        await callback(sender, parsed)
+            except Exception as e:
+                count_error()
+                print(f"Error in {name} notification handler: {e}")
+        return handler
 
-    async def _start_notify_generic(self, uuid, callback, retries=5, delay=0.2):
-        """Generic method to start notifications with retry logic"""
+    async def _start_notify_generic(self, uuid, callback=None, retries=None, delay=None, owner=None):
+        """Generic method to start notifications for an owner
+
+        A characteristic that is already notifying is shared: the owner is
+        counted and, without a callback, nothing goes over the air. The
+        subscription lasts until every owner has released it with
+        _stop_notify_generic.
+        """
+        owners = self._owners.setdefault(uuid, Counter())
+        shared = uuid in self.notifying
+        if not (shared and callback is None):
+            subscribe = self._replace_handler if shared else self._subscribe
+            if not await subscribe(uuid, callback, retries, delay):
+                return False
+            if not shared:
+                # Owners from before a disconnect are gone
+                owners.clear()
+                self._callback_owners.pop(uuid, None)
+            if callback is not None:
+                self._callback_owners[uuid] = owner
+        owners[owner] += 1
+        return True
+
+    async def _subscribe(self, uuid, callback=None, retries=None, delay=None):
+        """Start notifications with retry logic, owners are left alone
+
+        Samples always land in self.buffers[uuid]; callback is optional for
+        sample characteristics and, if given, is awaited once per sample.
+        In concurrent subscribe mode calls for different characteristics may
+        overlap, at most SUBSCRIBE_CONCURRENCY at a time, and each retries on
+        its own.
+        """
+        retries = self.config.SUBSCRIBE_RETRIES if retries is None else retries
+        delay = self.config.SUBSCRIBE_RETRY_DELAY if delay is None else delay
         if not self.is_connected():
             return False
+
+        decoder = self.DECODERS.get(uuid.lower())
+        if not decoder:
+            print(f"❌ No decoder registered for {uuid}")
+            return False
+
+        self._callbacks[uuid] = callback
+        handler = self._tap_handler(uuid, self._make_notification_handler(decoder, callback))
             
-        for attempt in range(retries):
-            try:
-                # Get the data class for this UUID
-                data_class = next((cls for _, (u, cls) in self.CHARACTERISTICS.items() if u == uuid), None)
-                
-                self._callbacks[uuid] = callback
-                async def handler(sender, data):
-                    try:
-                        # For raw config data, format as hex string
-                        if uuid == self.CONFIG_UUID:
-                            hex_str = ' '.join([f"{b:02X}" for b in data])
-                            # Create task for config update
-                            self.loop.create_task(callback(hex_str))
-                        # For others use generic handler
-                        elif data_class:
-                            await self._generic_notification_handler(sender, data, callback, data_class)
-                    except Exception as e:
-                        print(f"Error in notification handler for {uuid}: {e}")
-                
-                # Wait briefly before attempting to start notifications
-                await asyncio.sleep(0.1)
-                await self.client.start_notify(uuid, handler)
-                print(f"✓ Started notifications for {uuid}")
-                return True
+        with ConnectionProfiler().phase("start_notify", characteristic=decoder.name) as phase:
+            for attempt in range(retries):
+                phase.details['attempts'] = attempt + 1
+                try:
+                    if self.config.SUBSCRIBE_MODE == "concurrent":
+                        async with self._subscribe_limit():
+                            await self.client.start_notify(uuid, handler)
+                    else:
+                        # Wait briefly before attempting to start notifications
+                        await asyncio.sleep(0.1)
+                        await self.client.start_notify(uuid, handler)
+                    self.notifying.add(uuid)
+                    print(f"✓ Started notifications for {uuid}")
+                    return True
 
-            except Exception as e:
-                print(f"Error starting notifications for {uuid} (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    await asyncio.sleep(delay)
-                    print(f"Retrying...")
-                continue
+                except Exception as e:
+                    print(f"Error starting notifications for {uuid} (attempt {attempt + 1}/{retries}): {e}")
+                    if attempt < retries - 1:
+                        await asyncio.sleep(delay)
+                        print(f"Retrying...")
+                    continue
+            phase.ok = False
 
         print(f"❌ Failed to start notifications for {uuid} after {retries} attempts")
         return False
 
-    async def _stop_notify_generic(self, uuid):
-        """Generic method to stop notifications"""
+    def active_subscriptions(self):
+        """Characteristics with active notifications and their callbacks
+
+        Returns:
+            dict: UUID -> callback (None for buffer-only subscriptions)
+        """
+        return {uuid: self._callbacks.get(uuid) for uuid in self.notifying}
+
+    async def resubscribe(self, subscriptions):
+        """Start notifications again after a reconnect
+
+        Args:
+            subscriptions: dict from active_subscriptions(); characteristics
+                already notifying are skipped
+        Returns:
+            list: UUIDs that could not be subscribed
+        """
+        pending = [uuid for uuid in subscriptions if uuid not in self.notifying]
+        results = await asyncio.gather(
+            *(self._subscribe(uuid, subscriptions[uuid]) for uuid in pending),
+            return_exceptions=True)
+        return [uuid for uuid, result in zip(pending, results) if result is not True]
+
+    def _subscribe_limit(self):
+        """Semaphore bounding concurrent start_notify calls, created in the running loop"""
+        if self._subscribe_slots is None:
+            self._subscribe_slots = asyncio.Semaphore(self.config.SUBSCRIBE_CONCURRENCY)
+        return self._subscribe_slots
+
+    async def _stop_notify_generic(self, uuid, owner=None):
+        """Release an owner's subscription, notifications stop with the last owner"""
+        owners = self._owners.get(uuid)
+        if owners:
+            owners[owner] -= 1
+            if owners[owner] <= 0:
+                del owners[owner]
+            if owners:
+                releases_callback = uuid in self._callback_owners and self._callback_owners[uuid] == owner
+                if releases_callback and owner not in owners and uuid in self.notifying:
+                    # The others keep the stream buffer-only
+                    self._callback_owners.pop(uuid, None)
+                    await self._replace_handler(uuid, None)
+                return True
+        self._owners.pop(uuid, None)
+        self._callback_owners.pop(uuid, None)
         if not self.client:  # Already disconnected
             self._callbacks[uuid] = None
+            self.notifying.discard(uuid)
             return True
             
         try:
             await self.client.stop_notify(uuid)
             self._callbacks[uuid] = None
+            self.notifying.discard(uuid)
             return True
         except Exception as e:
             if hasattr(e, 'args') and len(e.args) > 0:
                 err_code = str(e.args[0])
                 if err_code == "61":  # Already stopped
                     self._callbacks[uuid] = None
+                    self.notifying.discard(uuid)
                     return True
             print(f"Error stopping notifications for {uuid}: {e}")
             return False
 
+    async def _replace_handler(self, uuid, callback, retries=None, delay=None):
+        """Subscribe again with another callback"""
+        try:
+            await self.client.stop_notify(uuid)
+        except Exception as e:
+            print(f"Error stopping notifications for {uuid}: {e}")
+        self.notifying.discard(uuid)
+        return await self._subscribe(uuid, callback, retries, delay)
+
     async def _start_battery_notifications(self, view):
         """Start battery and charging notifications"""
-        await self._start_notify_generic(self.BATTERY_LEVEL_UUID, view.update_battery)
-        await self._start_notify_generic(self.BATTERY_CHARGING_UUID, view.update_charging)
+        with ConnectionProfiler().phase("battery notifications"):
+            await self._start_notify_generic(self.BATTERY_LEVEL_UUID, self._ui_callback(view.update_battery))
+            await self._start_notify_generic(self.BATTERY_CHARGING_UUID, self._ui_callback(view.update_charging))
+
+    def _ui_callback(self, update):
+        """Wrap a view update as notification callback that runs it on the Tk thread
+
+        The notification handlers run on the loop thread; with an EventLoopBridge
+        loop the update is handed over through call_in_ui.
+        """
+        async def callback(value):
+            if hasattr(self.loop, 'call_in_ui'):
+                self.loop.call_in_ui(update, value)
+            else:
+                update(value)
+        return callback
+
+    # Generic stream methods
+    async def start_stream_notify(self, uuid, callback=None, owner=None):
+        """Start notifications for any registered characteristic, buffer-only without callback
+
+        Args:
+            uuid: Characteristic UUID
+            callback: Optional callback, replaces the one of an existing subscription
+            owner: Key the subscription is counted under, None for the presenters;
+                pass the same owner to stop_stream_notify
+        """
+        return await self._start_notify_generic(uuid, callback, owner=owner)
+
+    async def stop_stream_notify(self, uuid, owner=None):
+        """Release a subscription of any registered characteristic
+
+        Notifications only stop when no other owner holds the characteristic.
+        """
+        return await self._stop_notify_generic(uuid, owner)
 
     # IMU Methods
-    async def start_imu1_notify(self, callback):
+    async def start_imu1_notify(self, callback=None):
         """Start IMU1 notifications"""
         return await self._start_notify_generic(self.IMU1_CHAR_UUID, callback)
     
-    async def start_imu2_notify(self, callback):
+    async def start_imu2_notify(self, callback=None):
         """Start IMU2 notifications"""
         return await self._start_notify_generic(self.IMU2_CHAR_UUID, callback)
     
@@ -425,11 +1045,11 @@ class ESP32BLEService(BLEService):
         return await self._stop_notify_generic(self.IMU2_CHAR_UUID)
 
     # IMU Euler Methods
-    async def start_imu1_euler_notify(self, callback):
+    async def start_imu1_euler_notify(self, callback=None):
         """Start IMU1 Euler angles notifications"""
         return await self._start_notify_generic(self.IMU1_EULER_UUID, callback)
 
-    async def start_imu2_euler_notify(self, callback):
+    async def start_imu2_euler_notify(self, callback=None):
         """Start IMU2 Euler angles notifications"""
         return await self._start_notify_generic(self.IMU2_EULER_UUID, callback)
 
@@ -442,7 +1062,7 @@ class ESP32BLEService(BLEService):
         return await self._stop_notify_generic(self.IMU2_EULER_UUID)
 
     # Overall Status Methods
-    async def start_overall_status_notify(self, callback):
+    async def start_overall_status_notify(self, callback=None):
         """Start overall status notifications"""
         return await self._start_notify_generic(self.OVERALL_STATUS_UUID, callback)
             
@@ -451,11 +1071,11 @@ class ESP32BLEService(BLEService):
         return await self._stop_notify_generic(self.OVERALL_STATUS_UUID)
 
     # Sensor Methods
-    async def start_flex_sensor_notify(self, callback):
+    async def start_flex_sensor_notify(self, callback=None):
         """Start flex sensor notifications"""
         return await self._start_notify_generic(self.FLEX_SENSOR_UUID, callback)
 
-    async def start_force_sensor_notify(self, callback):
+    async def start_force_sensor_notify(self, callback=None):
         """Start force sensor notifications"""
         return await self._start_notify_generic(self.FORCE_SENSOR_UUID, callback)
 
@@ -468,11 +1088,11 @@ class ESP32BLEService(BLEService):
         return await self._stop_notify_generic(self.FORCE_SENSOR_UUID)
 
     # Gamepad Methods
-    async def start_joystick_notify(self, callback):
+    async def start_joystick_notify(self, callback=None):
         """Start joystick notifications"""
         return await self._start_notify_generic(self.JOYSTICK_UUID, callback)
 
-    async def start_buttons_notify(self, callback):
+    async def start_buttons_notify(self, callback=None):
         """Start buttons notifications"""
         return await self._start_notify_generic(self.BUTTONS_UUID, callback)
 
@@ -485,8 +1105,8 @@ class ESP32BLEService(BLEService):
         return await self._stop_notify_generic(self.BUTTONS_UUID)
 
     # Config Methods
-    async def start_config_notify(self, callback):
-        """Start config notifications"""
+    async def start_config_notify(self, callback=None):
+        """Start config notifications, which always keep the shadow config current"""
         return await self._start_notify_generic(self.CONFIG_UUID, callback)
             
     async def stop_config_notify(self):
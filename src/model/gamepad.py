@@ -1,15 +1,21 @@
 import struct
+from src.model.sample import Sample, field
 
-class JoystickData:
+class JoystickData(Sample):
     """Model class representing joystick data"""
-    
-    def __init__(self, x=0, y=0, button_state=0, raw_data=None):
-        # X and Y axis values (int16)
-        self.x = x
-        self.y = y
-        # Button state (0 = Not detected, 1 = detected)
-        self.button_state = button_state
-        self.raw_data = raw_data
+
+    __slots__ = ()
+    FIELDS = ('x', 'y', 'button_state')
+    STRUCT = struct.Struct('<2hB')  # 2 int16 + 1 uint8
+
+    def __new__(cls, x=0, y=0, button_state=0, raw_data=None):
+        return tuple.__new__(cls, (x, y, button_state))
+
+    # X and Y axis values (int16)
+    x = field(0)
+    y = field(1)
+    # Button state (0 = Not detected, 1 = detected)
+    button_state = field(2)
         
     @classmethod
     def from_bytes(cls, data):
@@ -24,19 +30,10 @@ class JoystickData:
             return None
             
         try:
-            # Unpack 2 int16 values and 1 uint8
-            x, y = struct.unpack('<2h', data[0:4])
-            button = data[4]
-            return cls(x=x, y=y, button_state=button, raw_data=data)
+            return cls._make(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing joystick data: {e}")
             return None
-            
-    def to_hex_string(self):
-        """Convert raw data to hex string representation"""
-        if not self.raw_data:
-            return ""
-        return ' '.join(f'{b:02x}' for b in self.raw_data)
         
     def get_debug_text(self):
         """Get formatted debug text"""
@@ -47,13 +44,21 @@ class JoystickData:
         debug_text += f"Button: {'Pressed' if self.button_state else 'Released'}"
         return debug_text
 
-class ButtonsData:
+class ButtonsData(Sample):
     """Model class representing buttons data"""
-    
-    def __init__(self, states=None, raw_data=None):
+
+    __slots__ = ()
+    FIELDS = ('button1', 'button2', 'button3', 'button4')
+    STRUCT = struct.Struct('<4B')  # 4 uint8 values
+
+    def __new__(cls, states=None, raw_data=None):
         # Array of 4 button states (0 = Not detected, 1 = detected)
-        self.states = states if states else [0] * 4
-        self.raw_data = raw_data
+        return tuple.__new__(cls, states if states else (0,) * 4)
+
+    @property
+    def states(self):
+        """Button states in button order"""
+        return tuple(self)
         
     @classmethod
     def from_bytes(cls, data):
@@ -67,22 +72,15 @@ class ButtonsData:
             
         try:
             # Each byte represents one button state
-            states = list(data)
-            return cls(states=states, raw_data=data)
+            return cls._make(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing buttons data: {e}")
             return None
-            
-    def to_hex_string(self):
-        """Convert raw data to hex string representation"""
-        if not self.raw_data:
-            return ""
-        return ' '.join(f'{b:02x}' for b in self.raw_data)
         
     def get_debug_text(self):
         """Get formatted debug text"""
         hex_str = self.to_hex_string()
         debug_text = f"Raw data ({len(self.raw_data)} bytes):\n{hex_str}\n\n"
-        for i, state in enumerate(self.states, 1):
+        for i, state in enumerate(self, 1):
             debug_text += f"Button {i}: {'Pressed' if state else 'Released'}\n"
         return debug_text
@@ -1,20 +1,65 @@
 import struct
+import numpy as np
+from src.model.sample import Sample, field
 
-class IMUEulerData:
+# Structured record layouts matching the notification payloads byte for byte
+IMU_DTYPE = np.dtype([
+    ('ax', '<i2'), ('ay', '<i2'), ('az', '<i2'),
+    ('gx', '<i2'), ('gy', '<i2'), ('gz', '<i2'),
+    ('mx', '<i2'), ('my', '<i2'), ('mz', '<i2')
+])
+IMU_EULER_DTYPE = np.dtype([
+    ('yaw', '<f4'), ('pitch', '<f4'), ('roll', '<f4'),
+    ('calib_status', 'u1')
+])
+
+
+def _decode_batch(payloads, dtype, name):
+    """Decode raw payloads into a structured array of the given dtype
+
+    Args:
+        payloads: list of raw payloads or one contiguous buffer of packed samples
+        dtype: structured dtype describing a single sample
+        name: sample name used in error messages
+    Returns:
+        numpy.ndarray with one row per complete sample
+    """
+    size = dtype.itemsize
+    if isinstance(payloads, (bytes, bytearray, memoryview)):
+        buffer = payloads
+    else:
+        buffer = b''.join(p for p in payloads if p and len(p) == size)
+
+    count = len(buffer) // size
+    if count * size != len(buffer):
+        print(f"Error parsing {name} batch: {len(buffer) % size} trailing bytes ignored")
+    return np.frombuffer(buffer, dtype=dtype, count=count)
+
+
+class IMUEulerData(Sample):
     """Model class representing IMU Euler angles data"""
-    
-    def __init__(self, yaw=0, pitch=0, roll=0, calib_status=0, raw_data=None):
-        # Euler angles in degrees
-        self.euler = {
-            'yaw': yaw,
-            'pitch': pitch,
-            'roll': roll
-        }
-        # Calibration status (stored for future use)
-        self.calib_status = calib_status
-        # Raw binary data
-        self.raw_data = raw_data
-        
+
+    __slots__ = ()
+    FIELDS = ('yaw', 'pitch', 'roll', 'calib_status')
+    STRUCT = struct.Struct('<3fB')  # 3 float32 + 1 uint8
+    DTYPE = IMU_EULER_DTYPE
+
+    def __new__(cls, yaw=0, pitch=0, roll=0, calib_status=0, raw_data=None):
+        # raw_data is accepted for compatibility, the payload is re-packed on demand
+        return tuple.__new__(cls, (yaw, pitch, roll, calib_status))
+
+    # Euler angles in degrees
+    yaw = field(0)
+    pitch = field(1)
+    roll = field(2)
+    # Calibration status (stored for future use)
+    calib_status = field(3)
+
+    @property
+    def euler(self):
+        """Euler angles as a dict keyed by axis name"""
+        return {'yaw': self[0], 'pitch': self[1], 'roll': self[2]}
+
     @classmethod
     def from_bytes(cls, data):
         """Create IMUEulerData object from byte array"""
@@ -22,61 +67,80 @@ class IMUEulerData:
             return None
             
         try:
-            # Unpack 3 float32 values for euler angles
-            yaw, pitch, roll = struct.unpack('<3f', data[0:12])
-            # Last byte is calibration status
-            calib = data[12]
-            return cls(yaw, pitch, roll, calib, data)
+            return cls._make(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing IMU Euler data: {e}")
             return None
-            
-    def to_hex_string(self):
-        """Convert raw data to hex string representation"""
-        if not self.raw_data:
-            return ""
-        return ' '.join(f'{b:02x}' for b in self.raw_data)
+
+    @classmethod
+    def from_bytes_batch(cls, payloads):
+        """Decode many 13-byte Euler payloads into a structured array
+
+        Args:
+            payloads: list of payloads or one contiguous buffer of packed samples
+        Returns:
+            numpy.ndarray with IMU_EULER_DTYPE fields (yaw, pitch, roll, calib_status)
+        """
+        return _decode_batch(payloads, IMU_EULER_DTYPE, "IMU Euler")
         
     def get_debug_text(self):
         """Get formatted debug text"""
         hex_str = self.to_hex_string()
         debug_text = f"Raw data ({len(self.raw_data)} bytes):\n{hex_str}\n\n"
         debug_text += f"Parsed values:\n"
-        debug_text += f"Yaw: {self.euler['yaw']}°\n"
-        debug_text += f"Pitch: {self.euler['pitch']}°\n"
-        debug_text += f"Roll: {self.euler['roll']}°\n"
+        debug_text += f"Yaw: {self.yaw}°\n"
+        debug_text += f"Pitch: {self.pitch}°\n"
+        debug_text += f"Roll: {self.roll}°\n"
         debug_text += f"Calibration: {self.calib_status}"
         return debug_text
 
-class IMUData:
+class IMUData(Sample):
     """Model class representing IMU sensor data"""
-    
-    def __init__(self, accel_x=0, accel_y=0, accel_z=0, 
-                 gyro_x=0, gyro_y=0, gyro_z=0,
-                 mag_x=0, mag_y=0, mag_z=0, raw_data=None):
-        # Accelerometer data
-        self.accel = {
-            'x': accel_x,
-            'y': accel_y,
-            'z': accel_z
-        }
-        
-        # Gyroscope data
-        self.gyro = {
-            'x': gyro_x,
-            'y': gyro_y,
-            'z': gyro_z
-        }
-        
-        # Magnetometer data
-        self.mag = {
-            'x': mag_x,
-            'y': mag_y,
-            'z': mag_z
-        }
-        
-        # Raw binary data
-        self.raw_data = raw_data
+
+    __slots__ = ()
+    FIELDS = ('accel_x', 'accel_y', 'accel_z',
+              'gyro_x', 'gyro_y', 'gyro_z',
+              'mag_x', 'mag_y', 'mag_z')
+    STRUCT = struct.Struct('<9h')  # 9 int16 values
+    DTYPE = IMU_DTYPE
+
+    def __new__(cls, accel_x=0, accel_y=0, accel_z=0,
+                gyro_x=0, gyro_y=0, gyro_z=0,
+                mag_x=0, mag_y=0, mag_z=0, raw_data=None):
+        # raw_data is accepted for compatibility, the payload is re-packed on demand
+        return tuple.__new__(cls, (accel_x, accel_y, accel_z,
+                                   gyro_x, gyro_y, gyro_z,
+                                   mag_x, mag_y, mag_z))
+
+    # Accelerometer data
+    accel_x = field(0)
+    accel_y = field(1)
+    accel_z = field(2)
+
+    # Gyroscope data
+    gyro_x = field(3)
+    gyro_y = field(4)
+    gyro_z = field(5)
+
+    # Magnetometer data
+    mag_x = field(6)
+    mag_y = field(7)
+    mag_z = field(8)
+
+    @property
+    def accel(self):
+        """Accelerometer values as a dict keyed by axis"""
+        return {'x': self[0], 'y': self[1], 'z': self[2]}
+
+    @property
+    def gyro(self):
+        """Gyroscope values as a dict keyed by axis"""
+        return {'x': self[3], 'y': self[4], 'z': self[5]}
+
+    @property
+    def mag(self):
+        """Magnetometer values as a dict keyed by axis"""
+        return {'x': self[6], 'y': self[7], 'z': self[8]}
         
     @classmethod
     def from_bytes(cls, data):
@@ -85,29 +149,28 @@ class IMUData:
             return None
             
         try:
-            values = struct.unpack('<9h', data)
-            return cls(
-                accel_x=values[0], accel_y=values[1], accel_z=values[2],
-                gyro_x=values[3], gyro_y=values[4], gyro_z=values[5],
-                mag_x=values[6], mag_y=values[7], mag_z=values[8],
-                raw_data=data
-            )
+            return cls._make(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing IMU data: {e}")
             return None
-            
-    def to_hex_string(self):
-        """Convert raw data to hex string representation"""
-        if not self.raw_data:
-            return ""
-        return ' '.join(f'{b:02x}' for b in self.raw_data)
+
+    @classmethod
+    def from_bytes_batch(cls, payloads):
+        """Decode many 18-byte IMU payloads into a structured array
+
+        Args:
+            payloads: list of payloads or one contiguous buffer of packed samples
+        Returns:
+            numpy.ndarray with IMU_DTYPE fields (ax..az, gx..gz, mx..mz)
+        """
+        return _decode_batch(payloads, IMU_DTYPE, "IMU")
         
     def get_debug_text(self):
         """Get formatted debug text"""
         hex_str = self.to_hex_string()
         debug_text = f"Raw data ({len(self.raw_data)} bytes):\n{hex_str}\n\n"
         debug_text += f"Parsed values:\n"
-        debug_text += f"Accel: ({self.accel['x']}, {self.accel['y']}, {self.accel['z']})\n"
-        debug_text += f"Gyro: ({self.gyro['x']}, {self.gyro['y']}, {self.gyro['z']})\n"
-        debug_text += f"Mag: ({self.mag['x']}, {self.mag['y']}, {self.mag['z']})"
+        debug_text += f"Accel: ({self.accel_x}, {self.accel_y}, {self.accel_z})\n"
+        debug_text += f"Gyro: ({self.gyro_x}, {self.gyro_y}, {self.gyro_z})\n"
+        debug_text += f"Mag: ({self.mag_x}, {self.mag_y}, {self.mag_z})"
         return debug_text
@@ -1,37 +1,124 @@
 import csv
+import json
 import os
 import time
+from functools import partial
+import numpy as np
+from src.config.app_config import AppConfig
+from src.model.imu import IMU_DTYPE
+from src.model.session_log import SessionWriter
+from src.model.background_writer import BackgroundWriter
+from src.model.metrics import MetricsRegistry
+
+# One logged row: receive timestamp (Unix ms), raw IMU sample, paired Euler angles
+IMU_LOG_DTYPE = np.dtype([('timestamp', '<i8')] + IMU_DTYPE.descr +
+                         [('yaw', '<f4'), ('pitch', '<f4'), ('roll', '<f4')])
+
+class IMURowPairer:
+    """Pair ring buffer IMU rows with the latest Euler row received before each one"""
+
+    def __init__(self):
+        self.last_euler_row = None  # Kept across reads so early IMU rows of a batch still pair
+
+    def reset(self):
+        """Forget the last Euler row, e.g. when Euler notifications restart"""
+        self.last_euler_row = None
+
+    def pair(self, imu_rows, euler_rows):
+        """Pair a batch of rows read from the IMU and Euler ring buffers
+
+        Args:
+            imu_rows: IMU rows with receive time field 't' (time.monotonic seconds)
+            euler_rows: Euler rows with receive time field 't'
+
+        Returns:
+            (imu_rows, euler_rows, timestamps) of equal length, with Unix millisecond
+            timestamps. IMU rows received before any Euler row are left out.
+        """
+        previous = self.last_euler_row
+        if len(euler_rows):
+            self.last_euler_row = euler_rows[-1:]
+        if previous is not None:
+            euler_rows = np.concatenate((previous, euler_rows))
+        if not len(euler_rows) or not len(imu_rows):
+            return imu_rows[:0], euler_rows[:0], []
+
+        index = np.searchsorted(euler_rows['t'], imu_rows['t'], side='right') - 1
+        paired = index >= 0
+        imu_rows = imu_rows[paired]
+        euler_rows = euler_rows[index[paired]]
+
+        # Receive times are monotonic, the CSV uses Unix milliseconds
+        offset = time.time() - time.monotonic()
+        timestamps = ((imu_rows['t'] + offset) * 1000).astype(np.int64).tolist()
+        return imu_rows, euler_rows, timestamps
+
 
 class IMULogger:
-    def __init__(self, path):
-        """Initialize IMU logger with path for CSV files
+    """CSV logger for IMU data with a background writer thread
+
+    Callers only queue rows; formatting, writing and flushing happen on a
+    BackgroundWriter thread, which also bounds crash loss and counts drops.
+
+    Rows go to imu1.csv/imu2.csv, or with the binary format to
+    imu1.bin/imu2.bin session logs (see session_log) holding IMU_LOG_DTYPE
+    records with the same columns. The metadata is also written to
+    session.json next to the logs, since CSV files have no header for it.
+    """
+
+    CSV = "csv"
+    BINARY = "binary"
+    SESSION_FILE = "session.json"
+
+    def __init__(self, path, log_format=None, metadata=None):
+        """Initialize IMU logger with path for log files
         
         Args:
-            path: Directory path where CSV files will be created
+            path: Directory path where log files will be created
+            log_format: CSV or BINARY, defaults to AppConfig.LOG_FORMAT
+            metadata: Optional dict stored in binary log headers, e.g. device config
         """
+        self.config = AppConfig()  # Get singleton instance
         self.path = path
+        self.log_format = log_format or self.config.LOG_FORMAT
+        self.metadata = metadata or {}
         self.imu1_file = None
         self.imu2_file = None
         self.imu1_writer = None
         self.imu2_writer = None
         self.is_logging = False
+
+        self._writer = BackgroundWriter(self._write_rows, self._flush_files, "imu-logger")
+        self.metrics = MetricsRegistry()  # Rows handed to the writer per IMU; queue depth is a writer gauge
         
         # CSV headers
         self.headers = ['timestamp', 'ax', 'ay', 'az', 'gx', 'gy', 'gz', 'mx', 'my', 'mz', 'ex', 'ey', 'ez']
         
     def start_logging(self):
-        """Start logging IMU data to CSV files"""
+        """Start logging IMU data to log files"""
         try:
-            # Create CSV files with headers
-            self.imu1_file = open(os.path.join(self.path, 'imu1.csv'), 'w', newline='')
-            self.imu2_file = open(os.path.join(self.path, 'imu2.csv'), 'w', newline='')
-            
-            self.imu1_writer = csv.writer(self.imu1_file)
-            self.imu2_writer = csv.writer(self.imu2_file)
-            
-            # Write headers
-            self.imu1_writer.writerow(self.headers)
-            self.imu2_writer.writerow(self.headers)
+            if self.log_format == self.BINARY:
+                # Session writers write their header on creation and flush/close like files
+                self.imu1_writer = self.imu1_file = SessionWriter(
+                    os.path.join(self.path, 'imu1.bin'), 'imu1', IMU_LOG_DTYPE, self.headers, self.metadata)
+                self.imu2_writer = self.imu2_file = SessionWriter(
+                    os.path.join(self.path, 'imu2.bin'), 'imu2', IMU_LOG_DTYPE, self.headers, self.metadata)
+            else:
+                # Create CSV files with headers
+                self.imu1_file = open(os.path.join(self.path, 'imu1.csv'), 'w', newline='')
+                self.imu2_file = open(os.path.join(self.path, 'imu2.csv'), 'w', newline='')
+
+                self.imu1_writer = csv.writer(self.imu1_file)
+                self.imu2_writer = csv.writer(self.imu2_file)
+
+                # Write headers
+                self.imu1_writer.writerow(self.headers)
+                self.imu2_writer.writerow(self.headers)
+
+            self._write_session_file()
+
+            # Start background writer
+            self._writer.start()
             
             self.is_logging = True
             return True
@@ -39,6 +126,12 @@ class IMULogger:
             self.stop_logging()
             return False
             
+    def _write_session_file(self):
+        """Write the session metadata (device config, preset) to session.json"""
+        session = dict(self.metadata, log_format=self.log_format, started=time.time())
+        with open(os.path.join(self.path, self.SESSION_FILE), 'w') as f:
+            json.dump(session, f, indent=2)
+
     def log_imu_data(self, imu_number, imu_data, euler_data):
         """Log IMU and Euler data to corresponding CSV file
         
@@ -50,33 +143,88 @@ class IMULogger:
         if not self.is_logging:
             return
             
-        try:
-            # Get raw timestamp in milliseconds
-            timestamp = int(time.time() * 1000)
-            
-            # Prepare row data
-            row = [
-                timestamp,
-                imu_data.accel['x'], imu_data.accel['y'], imu_data.accel['z'],
-                imu_data.gyro['x'], imu_data.gyro['y'], imu_data.gyro['z'],
-                imu_data.mag['x'], imu_data.mag['y'], imu_data.mag['z'],
-                euler_data.euler['yaw'], euler_data.euler['pitch'], euler_data.euler['roll']
-            ]
-            
-            # Write to appropriate file
-            if imu_number == 1:
-                self.imu1_writer.writerow(row)
-                self.imu1_file.flush()  # Ensure data is written immediately
-            else:
-                self.imu2_writer.writerow(row)
-                self.imu2_file.flush()  # Ensure data is written immediately
-                
-        except Exception as e:
-            pass
-            
+        # Get raw timestamp in milliseconds
+        timestamp = int(time.time() * 1000)
+        
+        # Prepare row data
+        row = [
+            timestamp,
+            imu_data.accel['x'], imu_data.accel['y'], imu_data.accel['z'],
+            imu_data.gyro['x'], imu_data.gyro['y'], imu_data.gyro['z'],
+            imu_data.mag['x'], imu_data.mag['y'], imu_data.mag['z'],
+            euler_data.euler['yaw'], euler_data.euler['pitch'], euler_data.euler['roll']
+        ]
+        if self.log_format == self.BINARY:
+            self._writer.enqueue(imu_number, 1, partial(np.array, [tuple(row)], IMU_LOG_DTYPE))
+        else:
+            self._writer.enqueue(imu_number, 1, lambda: (row,))
+        self.metrics.count("imu-logger rows", imu=imu_number)
+
+    def log_imu_batch(self, imu_number, imu_batch, euler_batch, timestamps=None):
+        """Log a batch of decoded IMU and Euler samples in one write
+
+        Args:
+            imu_number: 1 or 2 indicating which IMU data to log
+            imu_batch: structured array with IMU_DTYPE fields (extra fields are ignored)
+            euler_batch: structured array with IMU_EULER_DTYPE fields, same length as imu_batch
+            timestamps: optional per-row timestamps in milliseconds, defaults to now
+        """
+        if not self.is_logging or len(imu_batch) == 0:
+            return
+
+        if timestamps is None:
+            timestamps = [int(time.time() * 1000)] * len(imu_batch)
+        # Rows are formatted on the writer thread
+        make_rows = self._batch_records if self.log_format == self.BINARY else self._batch_rows
+        self._writer.enqueue(imu_number, len(imu_batch), partial(make_rows, imu_batch, euler_batch, timestamps))
+        self.metrics.count("imu-logger rows", len(imu_batch), imu=imu_number)
+
+    @staticmethod
+    def _batch_rows(imu_batch, euler_batch, timestamps):
+        """CSV rows for a batch of IMU and Euler samples"""
+        # Column-wise conversion avoids building one object per sample
+        columns = [imu_batch[name].tolist() for name in IMU_DTYPE.names]
+        columns += [euler_batch[name].tolist() for name in ('yaw', 'pitch', 'roll')]
+        return zip(timestamps, *columns)
+
+    @staticmethod
+    def _batch_records(imu_batch, euler_batch, timestamps):
+        """IMU_LOG_DTYPE records for a batch of IMU and Euler samples"""
+        records = np.empty(len(imu_batch), dtype=IMU_LOG_DTYPE)
+        records['timestamp'] = timestamps
+        for name in IMU_DTYPE.names:
+            records[name] = imu_batch[name]
+        for name in ('yaw', 'pitch', 'roll'):
+            records[name] = euler_batch[name]
+        return records
+
+    def get_stats(self):
+        """Writer counters
+
+        Returns:
+            dict with queued, written and dropped row counts
+        """
+        return self._writer.get_stats()
+
+    def _write_rows(self, imu_number, rows):
+        """Write formatted rows, called on the writer thread"""
+        writer = self.imu1_writer if imu_number == 1 else self.imu2_writer
+        if self.log_format == self.BINARY:
+            writer.append(rows)
+        else:
+            writer.writerows(rows)
+
+    def _flush_files(self):
+        """Flush both log files, called on the writer thread"""
+        self.imu1_file.flush()
+        self.imu2_file.flush()
+
     def stop_logging(self):
-        """Stop logging and close CSV files"""
+        """Stop logging, write all queued rows and close CSV files"""
         self.is_logging = False
+
+        # Let the writer drain the queue before the files are closed
+        self._writer.stop()
         
         # Close files if open
         if self.imu1_file:
@@ -0,0 +1,272 @@
+import asyncio
+import time
+from src.config.app_config import AppConfig
+from src.model.connection_profiler import ConnectionProfiler
+
+class LinkGap:
+    """One interruption of the data streams"""
+
+    __slots__ = ('reason', 'started', 'attempts', 'restored', 'streams')
+
+    def __init__(self, reason, started):
+        self.reason = reason  # "disconnected" or "stale"
+        self.started = started  # time.time() when the loss was noticed
+        self.attempts = 0  # Reconnect attempts needed
+        self.restored = None  # Seconds from the loss until notifications were restored
+        self.streams = {}  # Stream name -> seconds between the last sample before and the first after
+
+    @property
+    def duration(self):
+        """Longest data gap of any stream, else the time until the link was restored"""
+        if self.streams:
+            return max(self.streams.values())
+        return self.restored
+
+    def to_dict(self):
+        return {
+            'reason': self.reason,
+            'started': self.started,
+            'attempts': self.attempts,
+            'restored': self.restored,
+            'duration': self.duration,
+            'streams': dict(self.streams),
+        }
+
+
+class LinkSupervisor:
+    """Keep the connection of an ESP32BLEService alive
+
+    Notices link loss through the client's disconnected callback and through
+    stream liveness: when every subscribed stream stays silent for
+    LINK_STALE_TIMEOUT seconds the link is treated as lost as well. Streams
+    are judged against the rate the device config promises: a stream the
+    config keeps idle is not expected to deliver, and a slow one gets a few
+    sample periods before it counts as silent. It then
+    reconnects with exponential backoff and restores every active
+    subscription with its callback. The service and its ring buffers are
+    kept, so presenters and loggers reading them carry on where they were.
+    Every interruption is kept in gaps.
+
+    States:
+        connected: streams are flowing
+        reconnecting: link lost, reconnecting with backoff
+        resubscribing: reconnected, restoring the notifications
+        failed: gave up after RECONNECT_ATTEMPTS, or AUTO_RECONNECT is off
+        stopped: not supervising
+    """
+
+    CONNECTED = "connected"
+    RECONNECTING = "reconnecting"
+    RESUBSCRIBING = "resubscribing"
+    FAILED = "failed"
+    STOPPED = "stopped"
+
+    # Streams sent every sensor_interval of the device config
+    SENSOR_STREAMS = ("FLEX_SENSOR_UUID", "FORCE_SENSOR_UUID", "JOYSTICK_UUID")
+    STALE_PERIODS = 3  # Sample periods a slow stream may miss before it counts as silent
+
+    def __init__(self, service, on_state=None):
+        """Initialize supervisor
+
+        Args:
+            service: ESP32BLEService to supervise
+            on_state: Optional callback(state, message) called on every state change
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.service = service
+        self.on_state = on_state
+        self.state = self.STOPPED
+        self.device_info = None
+        self.gaps = []
+        self._task = None
+        self._loop = None
+        self._lost = None
+        self._last_total = {}  # UUID -> buffer.total at the last check
+        self._last_seen = {}  # UUID -> time.monotonic() of the last check that saw new rows
+        self._pending = {}  # UUID -> (buffer.total, last 't') of streams not resumed after a gap
+
+    def start(self):
+        """Start supervising the connected service"""
+        if self._task and not self._task.done():
+            return
+        self.device_info = self.service.connected_device
+        self._loop = asyncio.get_running_loop()
+        self._lost = asyncio.Event()
+        self._last_total = {}
+        self._last_seen = {}
+        self._pending = {}
+        self.service.on_link_lost = self._on_link_lost
+        self._set_state(self.CONNECTED)
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self):
+        """Stop supervising, e.g. before a deliberate disconnect"""
+        self.service.on_link_lost = None
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._set_state(self.STOPPED)
+
+    def recovering(self):
+        """True from the moment link loss is noticed until the link is restored or given up"""
+        lost = self._lost is not None and self._lost.is_set()
+        return lost or self.state in (self.RECONNECTING, self.RESUBSCRIBING)
+
+    def stream_ages(self):
+        """Seconds since each supervised stream last delivered data, by characteristic name"""
+        now = time.monotonic()
+        return {self._name(uuid): now - seen for uuid, seen in self._last_seen.items()}
+
+    def _on_link_lost(self):
+        # Called from the client's disconnected callback, possibly off the loop thread
+        if not self._loop or not self._lost:
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._lost.set()
+        else:
+            self._loop.call_soon_threadsafe(self._lost.set)
+
+    def _set_state(self, state, message=""):
+        self.state = state
+        if self.on_state:
+            self.on_state(state, message)
+
+    async def _run(self):
+        """Watch the link until it is lost for good"""
+        while True:
+            try:
+                await asyncio.wait_for(self._lost.wait(), self.config.LINK_CHECK_INTERVAL)
+                reason = "disconnected"
+            except asyncio.TimeoutError:
+                reason = self._check_streams()
+            if reason is None:
+                continue
+            if not self.config.AUTO_RECONNECT:
+                self._set_state(self.FAILED, f"Link lost ({reason})")
+                return
+            if not await self._recover(reason):
+                self._set_state(self.FAILED, "Reconnect failed")
+                return
+
+    def _check_streams(self):
+        """Update stream liveness and measure resumed streams
+
+        Returns:
+            "stale" if every supervised stream that should deliver is silent, else None
+        """
+        now = time.monotonic()
+        tracked = live = False
+        for uuid in list(self.service.notifying):
+            buffer = self.service.buffers.get(uuid)
+            if buffer is None:
+                continue
+            if buffer.total != self._last_total.get(uuid):
+                self._last_total[uuid] = buffer.total
+                self._last_seen[uuid] = now
+            seen = self._last_seen.setdefault(uuid, now)
+            self._measure_gap(uuid, buffer)
+
+            rate = self._expected_rate(uuid)
+            if rate == 0:
+                continue  # Idle by config, silence says nothing about the link
+            tracked = True
+            timeout = self.config.LINK_STALE_TIMEOUT
+            if rate:
+                timeout = max(timeout, self.STALE_PERIODS / rate)
+            if now - seen < timeout:
+                live = True
+        return "stale" if tracked and not live else None
+
+    def _expected_rate(self, uuid):
+        """Samples per second the device config promises on a stream
+
+        Returns:
+            float, 0 for a stream the config keeps idle, None if the config says nothing about it
+        """
+        config = self.service.device_config
+        if config is None:
+            return None
+        name = self._name(uuid)
+        if name.startswith("IMU1_"):
+            return config.imu_rate_hz(1)
+        if name.startswith("IMU2_"):
+            return config.imu_rate_hz(2)
+        if name in self.SENSOR_STREAMS:
+            return config.sensor_rate_hz
+        return None
+
+    def _measure_gap(self, uuid, buffer):
+        """Record the data gap of a stream once it delivers again"""
+        mark = self._pending.get(uuid)
+        if mark is None or buffer.total <= mark[0]:
+            return
+        del self._pending[uuid]
+        gap = self.gaps[-1]
+        first = buffer.rows(mark[0], mark[0] + 1)['t'][0]
+        gap.streams[self._name(uuid)] = float(first - mark[1])
+        if not self._pending:
+            print(f"Data gap after link loss: {gap.duration:.2f} s")
+
+    def _name(self, uuid):
+        decoder = self.service.DECODERS.get(uuid.lower())
+        return decoder.name if decoder else uuid
+
+    async def _recover(self, reason):
+        """Reconnect with exponential backoff and restore the subscriptions
+
+        Returns:
+            bool: True if the link is back
+        """
+        lost_at = time.monotonic()
+        gap = LinkGap(reason, time.time())
+        self.gaps.append(gap)
+        subscriptions = self.service.active_subscriptions()
+        marks = {}
+        for uuid in subscriptions:
+            buffer = self.service.buffers.get(uuid)
+            if buffer is not None and buffer.total:
+                marks[uuid] = (buffer.total, float(buffer.latest()['t']))
+        print(f"❌ Link lost ({reason}), reconnecting...")
+        self._set_state(self.RECONNECTING, f"Link lost ({reason})")
+
+        # Drop the dead client; a stale link is closed deliberately
+        await self.service.disconnect()
+        self._lost.clear()
+
+        attempts = self.config.RECONNECT_ATTEMPTS
+        attempt = 0
+        while not attempts or attempt < attempts:
+            delay = min(self.config.RECONNECT_MAX_DELAY, self.config.RECONNECT_BASE_DELAY * 2 ** attempt)
+            attempt += 1
+            gap.attempts = attempt
+            self._set_state(self.RECONNECTING, f"Reconnecting (attempt {attempt})")
+            await asyncio.sleep(delay)
+            if not await self.service.connect(self.device_info):
+                continue
+
+            self._set_state(self.RESUBSCRIBING, "Restoring notifications")
+            profiler = ConnectionProfiler()  # Get singleton instance
+            with profiler.phase("resubscribe", streams=len(subscriptions)) as phase:
+                failed = await self.service.resubscribe(subscriptions)
+                phase.ok = not failed
+            profiler.finish(not failed)
+            for uuid in failed:
+                print(f"❌ Could not restore notifications for {self._name(uuid)}")
+
+            gap.restored = time.monotonic() - lost_at
+            self._lost.clear()
+            self._last_total = {}
+            self._last_seen = {}
+            self._pending = {uuid: mark for uuid, mark in marks.items() if uuid not in failed}
+            print(f"✓ Link restored after {attempt} attempt(s), {gap.restored:.2f} s")
+            self._set_state(self.CONNECTED, f"Reconnected after {gap.restored:.1f} s")
+            return True
+        return False
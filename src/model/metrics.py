@@ -0,0 +1,252 @@
+import json
+import time
+from time import monotonic
+
+class Histogram:
+    """Histogram with power-of-two buckets and O(1) updates
+
+    Bucket 0 counts values below first, bucket i values in
+    [first * 2**(i-1), first * 2**i), the last bucket everything above.
+    """
+
+    __slots__ = ('first', 'counts', 'count', 'total', 'total_sq')
+
+    def __init__(self, first=0.001, buckets=12):
+        self.first = first
+        self.counts = [0] * (buckets + 1)
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def observe(self, value):
+        index = int(value / self.first).bit_length()
+        counts = self.counts
+        counts[index if index < len(counts) else -1] += 1
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+
+    def bounds(self):
+        """Upper bound of every bucket but the last, which is unbounded"""
+        return [self.first * 2 ** index for index in range(len(self.counts) - 1)]
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding quantile q, None without values
+
+        Values in the last bucket report its lower bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        bounds = self.bounds()
+        for bound, count in zip(bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return bounds[-1]
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.mean,
+            'std': self.std,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'bounds': self.bounds(),
+            'counts': list(self.counts),
+        }
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    @property
+    def std(self):
+        if not self.count:
+            return None
+        mean = self.total / self.count
+        return max(0.0, self.total_sq / self.count - mean * mean) ** 0.5
+
+
+class StreamMetrics:
+    """Counters of one notifying characteristic
+
+    record() is called once per notification from the handler, so it only
+    does a few additions. It also closes the rate window once RATE_WINDOW
+    seconds passed, so the rate follows the notification clock and not the
+    callers of snapshot(); snapshot() only reads, any number of consumers
+    (diagnostics panel, exports, scrapes) see the same rate.
+    Decode time costs two extra clock reads, so the handler only measures it
+    for one notification in DECODE_SAMPLE_MASK + 1, as told by record().
+    """
+
+    __slots__ = ('name', 'device', 'notifications', 'samples', 'decode_errors', 'lost',
+                 'interarrival', 'decode', 'value', 'last', 'rate', '_window_start', '_window_notifications')
+
+    RATE_WINDOW = 1.0  # Seconds per rate measurement
+    DECODE_SAMPLE_MASK = 15  # Decode time is measured when notifications & mask == 0
+
+    def __init__(self, name, device=""):
+        self.name = name
+        self.device = device
+        self.notifications = 0
+        self.samples = 0
+        self.decode_errors = 0
+        self.lost = 0  # Samples missing from framed sequences
+        self.interarrival = Histogram()  # Seconds between notifications
+        self.decode = Histogram(first=0.000001, buckets=16)  # Seconds from arrival to decoded, sampled
+        self.value = None  # Latest value of single-value streams, e.g. battery level
+        self.last = None  # time.monotonic() of the last notification
+        self.rate = 0.0  # Notifications per second over the last window
+        self._window_start = monotonic()
+        self._window_notifications = 0
+
+    def record(self, t, samples=1):
+        """Count one notification received at t (time.monotonic seconds)
+
+        Returns:
+            bool: True if the caller should measure the decode time of this notification
+        """
+        self.notifications = notifications = self.notifications + 1
+        self.samples += samples
+        last = self.last
+        self.last = t
+        if last is not None:
+            self.interarrival.observe(t - last)
+        elapsed = t - self._window_start
+        if elapsed >= self.RATE_WINDOW:
+            self.rate = (notifications - self._window_notifications) / elapsed
+            self._window_start = t
+            self._window_notifications = notifications
+        return not notifications & self.DECODE_SAMPLE_MASK
+
+    def error(self):
+        """Count one payload that could not be decoded"""
+        self.decode_errors += 1
+
+    def snapshot(self, now):
+        """Current counters, the rate as of now without closing the window"""
+        rate = self.rate
+        elapsed = now - self._window_start
+        if elapsed >= self.RATE_WINDOW:
+            # No notification closed the window, the stream slowed down or stalled
+            rate = (self.notifications - self._window_notifications) / elapsed
+        return {
+            'name': self.name,
+            'device': self.device,
+            'notifications': self.notifications,
+            'samples': self.samples,
+            'rate': rate,
+            'decode_errors': self.decode_errors,
+            'lost': self.lost,
+            'value': self.value,
+            'interarrival': self.interarrival.to_dict(),
+            'decode': self.decode.to_dict(),
+        }
+
+
+class MetricsRegistry:
+    """Process-wide pipeline metrics
+
+    ESP32BLEService feeds one StreamMetrics per characteristic from its
+    notification handlers. Queue depths are gauges: callables registered by
+    their owners and only read when a snapshot is taken, so they cost
+    nothing in between. Gauges registered several times under one name
+    (e.g. one imu-logger per glove) are summed. Events off the hot path,
+    such as connects, are labelled counters, and durations such as the
+    render frame time are named histograms in seconds.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.streams = {}  # (device, name) -> StreamMetrics
+            self._gauges = {}  # Name -> list of callables returning a number
+            self.counters = {}  # (name, sorted label items) -> count
+            self.histograms = {}  # Name -> Histogram of seconds
+            self.started = monotonic()
+            self.initialized = True
+
+    def stream(self, name, device=""):
+        """StreamMetrics of a characteristic, created on first use"""
+        key = (device, name)
+        metrics = self.streams.get(key)
+        if metrics is None:
+            metrics = self.streams[key] = StreamMetrics(name, device)
+        return metrics
+
+    def count(self, name, n=1, **labels):
+        """Add n to the counter name with labels, e.g. count("connects", device=address)"""
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    def counter(self, name, **labels):
+        """Current value of a counter, 0 if never counted"""
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, name, first=0.001, buckets=12):
+        """Named Histogram of durations in seconds, created on first use"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(first, buckets)
+        return histogram
+
+    def register_gauge(self, name, read):
+        """Report read() under name in every snapshot"""
+        self._gauges.setdefault(name, []).append(read)
+
+    def unregister_gauge(self, name, read):
+        reads = self._gauges.get(name)
+        if reads and read in reads:
+            reads.remove(read)
+            if not reads:
+                del self._gauges[name]
+
+    def gauges(self):
+        values = {}
+        for name, reads in list(self._gauges.items()):
+            try:
+                values[name] = sum(read() for read in reads)
+            except Exception as e:
+                print(f"Error reading gauge {name}: {e}")
+        return values
+
+    def snapshot(self):
+        """Current value of every metric
+
+        Returns:
+            dict: 'time', 'uptime', 'streams' (list of StreamMetrics snapshots), 'gauges',
+            'counters' (list of name, labels and value) and 'histograms' (name -> histogram)
+        """
+        now = monotonic()
+        return {
+            'time': time.time(),
+            'uptime': now - self.started,
+            'streams': [metrics.snapshot(now) for metrics in list(self.streams.values())],
+            'gauges': self.gauges(),
+            'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                         for (name, labels), value in list(self.counters.items())],
+            'histograms': {name: histogram.to_dict() for name, histogram in list(self.histograms.items())},
+        }
+
+    def export(self, path):
+        """Append a snapshot as one JSON line to path
+
+        Returns:
+            bool: True if written
+        """
+        try:
+            with open(path, 'a') as f:
+                f.write(json.dumps(self.snapshot()) + '\n')
+            return True
+        except Exception as e:
+            print(f"Error exporting metrics: {e}")
+            return False
@@ -0,0 +1,164 @@
+import asyncio
+import re
+from src.config.app_config import AppConfig
+from src.model.metrics import MetricsRegistry
+
+class MetricsServer:
+    """Serve MetricsRegistry to Prometheus on a local HTTP port
+
+    Runs on the asyncio loop that already drives the BLE service, so a
+    scrape takes a MetricsRegistry snapshot on the same thread the
+    notification handlers count on and nothing is locked or copied between
+    scrapes. GET /metrics answers in the Prometheus text format, or in
+    OpenMetrics when the scraper asks for it. Only METRICS_HOST (localhost by
+    default) is bound.
+    """
+
+    PREFIX = "glove_"
+    TEXT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+    REQUEST_TIMEOUT = 5.0  # Seconds to wait for the request headers
+
+    def __init__(self, port=None, host=None):
+        """Initialize server
+
+        Args:
+            port: TCP port, defaults to AppConfig.METRICS_PORT
+            host: Address to bind, defaults to AppConfig.METRICS_HOST
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.port = port or self.config.METRICS_PORT
+        self.host = host or self.config.METRICS_HOST
+        self.metrics = MetricsRegistry()  # Get singleton instance
+        self.scrapes = 0
+        self._server = None
+
+    async def start(self):
+        """Start listening on the running loop
+
+        Returns:
+            bool: True if listening
+        """
+        try:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            print(f"✓ Serving metrics on http://{self.host}:{self.port}/metrics")
+            return True
+        except Exception as e:
+            print(f"❌ Could not serve metrics on {self.host}:{self.port}: {e}")
+            return False
+
+    async def stop(self):
+        """Stop listening"""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader, writer):
+        """Answer one HTTP request and close the connection"""
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.REQUEST_TIMEOUT)
+            lines = request.decode('latin-1').split("\r\n")
+            method, path = (lines[0].split(" ") + ["", ""])[:2]
+            headers = dict(line.split(":", 1) for line in lines[1:] if ":" in line)
+            accept = next((value for name, value in headers.items() if name.strip().lower() == "accept"), "")
+
+            if method != "GET":
+                status, content_type, body = "405 Method Not Allowed", "text/plain", "GET only\n"
+            elif path.split("?")[0] != "/metrics":
+                status, content_type, body = "404 Not Found", "text/plain", "Metrics are served on /metrics\n"
+            else:
+                openmetrics = "application/openmetrics-text" in accept
+                body = self.render(self.metrics.snapshot(), openmetrics)
+                content_type = self.OPENMETRICS_TYPE if openmetrics else self.TEXT_TYPE
+                status = "200 OK"
+                self.scrapes += 1
+
+            data = body.encode('utf-8')
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode('latin-1') + data)
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass  # Client went away or never sent a request
+        except Exception as e:
+            print(f"Error serving metrics: {e}")
+        finally:
+            writer.close()
+
+    @classmethod
+    def render(cls, snapshot, openmetrics=False):
+        """Format a MetricsRegistry snapshot as Prometheus text or OpenMetrics
+
+        Args:
+            snapshot: dict returned by MetricsRegistry.snapshot()
+            openmetrics: True for the OpenMetrics format
+        """
+        families = {}  # Metric name -> (type, help, samples)
+
+        def add(name, kind, help_text, labels, value, suffix=""):
+            family = families.setdefault(cls.PREFIX + name, (kind, help_text, []))
+            family[2].append((suffix, labels, value))
+
+        def add_histogram(name, help_text, labels, histogram):
+            seen = 0
+            for bound, count in zip(histogram['bounds'], histogram['counts']):
+                seen += count
+                add(name, "histogram", help_text, dict(labels, le=repr(float(bound))), seen, "_bucket")
+            add(name, "histogram", help_text, dict(labels, le="+Inf"), histogram['count'], "_bucket")
+            add(name, "histogram", help_text, labels, histogram['sum'], "_sum")
+            add(name, "histogram", help_text, labels, histogram['count'], "_count")
+
+        for stream in snapshot['streams']:
+            labels = {'device': stream['device'], 'characteristic': stream['name']}
+            add("notifications", "counter", "Notifications received", labels, stream['notifications'], "_total")
+            add("samples", "counter", "Samples received", labels, stream['samples'], "_total")
+            add("decode_errors", "counter", "Payloads that could not be decoded", labels,
+                stream['decode_errors'], "_total")
+            add("lost_samples", "counter", "Samples missing from framed sequences", labels, stream['lost'], "_total")
+            add("notification_rate", "gauge", "Notifications per second over the last window", labels, stream['rate'])
+            add_histogram("notification_interarrival_seconds", "Time between notifications", labels,
+                          stream['interarrival'])
+            add_histogram("decode_seconds", "Time from arrival to decoded, sampled", labels, stream['decode'])
+            if stream['value'] is not None:
+                # Single-value streams, e.g. glove_battery_level
+                add(cls._name(stream['name']), "gauge", f"Latest {stream['name']} value",
+                    {'device': stream['device']}, stream['value'])
+
+        for name, value in snapshot['gauges'].items():
+            add(cls._name(name), "gauge", name, {}, value)
+        for counter in snapshot['counters']:
+            add(cls._name(counter['name']), "counter", counter["name"], counter['labels'],
+                counter['value'], "_total")
+        for name, histogram in snapshot['histograms'].items():
+            add_histogram(cls._name(name) + "_seconds", f"{name} duration", {}, histogram)
+
+        lines = []
+        for name, (kind, help_text, samples) in families.items():
+            # Prometheus text names the counter family with its _total suffix, OpenMetrics without
+            family = name if openmetrics or kind != "counter" else name + "_total"
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{name}{suffix}{cls._labels(labels)} {cls._value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _name(name):
+        """Metric name for a registry name, e.g. imu-logger queue -> imu_logger_queue"""
+        return re.sub(r'[^a-zA-Z0-9]+', '_', name).strip('_').lower()
+
+    @staticmethod
+    def _labels(labels):
+        if not labels:
+            return ""
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+                   for value in labels.values())
+        return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
+
+    @staticmethod
+    def _value(value):
+        if value is None:
+            return "NaN"
+        return repr(float(value)) if isinstance(value, float) else str(int(value))
@@ -1,4 +1,7 @@
-class OverallStatus:
+import struct
+from src.model.sample import Sample, field
+
+class OverallStatus(Sample):
     """Model class representing overall system status"""
     
     # Status codes
@@ -10,13 +13,19 @@ class OverallStatus:
     FAILED = 1
     IDLE = 2
     RUNNING = 3
+
+    __slots__ = ()
+    FIELDS = ('status_code', 'fuelgause', 'imu1', 'imu2')
+    STRUCT = struct.Struct('<4B')  # 4 uint8 values
     
-    def __init__(self, fuelgause=NOT_DETECT, 
-                 imu1=NOT_DETECT, imu2=NOT_DETECT, raw_data=None):
-        self.fuelgause = fuelgause
-        self.imu1 = imu1
-        self.imu2 = imu2
-        self.raw_data = raw_data
+    def __new__(cls, fuelgause=NOT_DETECT,
+                imu1=NOT_DETECT, imu2=NOT_DETECT, raw_data=None, status_code=NO_ERROR):
+        return tuple.__new__(cls, (status_code, fuelgause, imu1, imu2))
+
+    status_code = field(0)
+    fuelgause = field(1)
+    imu1 = field(2)
+    imu2 = field(3)
         
     @classmethod
     def from_bytes(cls, data):
@@ -29,31 +38,20 @@ class OverallStatus:
             return None
             
         try:
-            status_code = data[0]
-            fuelgause = data[1]
-            imu1 = data[2]
-            imu2 = data[3]
-            
-            valid_states = {cls.NOT_DETECT, cls.FAILED, cls.IDLE, cls.RUNNING}
-            if (fuelgause not in valid_states or 
-                imu1 not in valid_states or 
-                imu2 not in valid_states):
-                return None
-            return cls(
-                fuelgause=fuelgause,
-                imu1=imu1,
-                imu2=imu2,
-                raw_data=data
-            )
+            return cls.from_values(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing Overall Status data: {e}")
             return None
-            
-    def to_hex_string(self):
-        """Convert raw data to hex string representation"""
-        if not self.raw_data:
-            return ""
-        return ' '.join(f'{b:02x}' for b in self.raw_data)
+
+    @classmethod
+    def from_values(cls, values):
+        """Create OverallStatus from unpacked values, None if a state is invalid"""
+        valid_states = (cls.NOT_DETECT, cls.FAILED, cls.IDLE, cls.RUNNING)
+        if (values[1] not in valid_states or 
+            values[2] not in valid_states or 
+            values[3] not in valid_states):
+            return None
+        return cls._make(values)
         
     def get_debug_text(self):
         """Get formatted debug text"""
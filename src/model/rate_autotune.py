@@ -0,0 +1,197 @@
+import asyncio
+import json
+import os
+import platform
+import socket
+import time
+from src.config.app_config import AppConfig
+from src.model.device_config import DeviceConfig
+
+class TuneStep:
+    """Delivery measured at one IMU accel/gyro rate"""
+
+    __slots__ = ('code', 'rate_hz', 'streams', 'ok')
+
+    def __init__(self, code, rate_hz):
+        self.code = code  # ACCEL_GYRO_FREQ_MAP code of both IMUs
+        self.rate_hz = rate_hz
+        self.streams = {}  # Stream name -> expected, delivered, ratio, missing and lost samples
+        self.ok = False
+
+    @property
+    def ratio(self):
+        """Worst delivery ratio of any stream"""
+        return min((stream['ratio'] for stream in self.streams.values()), default=0.0)
+
+    def to_dict(self):
+        return {
+            'code': self.code,
+            'rate_hz': self.rate_hz,
+            'ok': self.ok,
+            'ratio': self.ratio,
+            'streams': self.streams,
+        }
+
+
+class RateAutoTuner:
+    """Find the highest IMU rate the BLE link sustains
+
+    Steps the accel/gyro rate of both IMUs up through ACCEL_GYRO_FREQ_MAP,
+    and at every rate counts the samples each stream delivers into the
+    service ring buffers against the samples the config should produce. It
+    stops at the first rate where a stream falls below the target delivery
+    ratio and leaves the device at the last rate that held it. Results are
+    kept per host and adapter in AUTOTUNE_RESULTS_FILE, since the sustainable
+    rate depends on the host's BLE stack and radio as much as on the glove.
+    """
+
+    # Streams measured, subscribed for the run if nobody else has
+    STREAMS = ('IMU1_CHAR_UUID', 'IMU2_CHAR_UUID', 'FLEX_SENSOR_UUID', 'FORCE_SENSOR_UUID', 'JOYSTICK_UUID')
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, service, target=None, adapter=None):
+        """Initialize tuner
+
+        Args:
+            service: Connected ESP32BLEService
+            target: Delivery ratio every stream must hold, defaults to AppConfig.AUTOTUNE_TARGET_RATIO
+            adapter: Label of the BLE adapter the results are stored under, e.g. "hci1"
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.service = service
+        self.target = target if target is not None else self.config.AUTOTUNE_TARGET_RATIO
+        self.adapter = adapter or "default"
+        self.steps = []
+
+    async def run(self):
+        """Step the rates and settle on the highest one that holds the target
+
+        Returns:
+            dict: the result as stored in AUTOTUNE_RESULTS_FILE, or None if the device is not connected
+        """
+        original = await self.service.get_config()
+        if original is None:
+            print("❌ Auto-tune needs a connected device")
+            return None
+        started = []
+        for uuid in self._stream_uuids():
+            if await self.service.start_stream_notify(uuid, owner=self):
+                started.append(uuid)
+
+        best = None
+        self.steps = []
+        try:
+            for code in sorted(code for code in DeviceConfig.ACCEL_GYRO_FREQ_MAP if code):
+                config = original.replace(cmd=DeviceConfig.CMD_RUN,
+                                          imu1_accel_gyro_freq=code, imu2_accel_gyro_freq=code)
+                if not await self.service.write_config(config):
+                    print(f"❌ Could not write rate {DeviceConfig.ACCEL_GYRO_FREQ_MAP[code]}")
+                    break
+                step = await self._measure(config, code)
+                self.steps.append(step)
+                print(f"{config.imu_rate_hz(1):6.1f} Hz: worst delivery {step.ratio:.1%} "
+                      f"{'✓' if step.ok else '❌'}")
+                if not step.ok:
+                    break
+                best = config
+        finally:
+            if self.service.is_connected():
+                await self.service.write_config(best or original)
+                for uuid in started:
+                    await self.service.stop_stream_notify(uuid, owner=self)
+
+        result = self._result(best)
+        if best:
+            print(f"✓ Settled on {best.imu_rate_hz(1):.1f} Hz ({result['rate']})")
+        else:
+            print("❌ No IMU rate holds the target delivery ratio, config restored")
+        self.save(result)
+        return result
+
+    def _stream_uuids(self):
+        return [getattr(self.service, name) for name in self.STREAMS]
+
+    def _expected_rate(self, uuid, config):
+        """Samples per second a stream should deliver with config"""
+        if uuid == self.service.IMU1_CHAR_UUID:
+            return config.imu_rate_hz(1)
+        if uuid == self.service.IMU2_CHAR_UUID:
+            return config.imu_rate_hz(2)
+        return config.sensor_rate_hz
+
+    async def _measure(self, config, code):
+        """Count delivered samples of every stream for AUTOTUNE_WINDOW seconds"""
+        step = TuneStep(code, config.imu_rate_hz(1))
+        await asyncio.sleep(self.config.AUTOTUNE_SETTLE_TIME)
+        uuids = self._stream_uuids()
+        totals = {uuid: self.service.buffers[uuid].total for uuid in uuids}
+        lost = {uuid: self.service.lost_samples.get(uuid, 0) for uuid in uuids}
+        start = time.monotonic()
+        await asyncio.sleep(self.config.AUTOTUNE_WINDOW)
+        elapsed = time.monotonic() - start
+
+        step.ok = True
+        for uuid in uuids:
+            expected = self._expected_rate(uuid, config) * elapsed
+            delivered = self.service.buffers[uuid].total - totals[uuid]
+            # One sample of slack for the window edges, capped at full delivery
+            ratio = min(1.0, (delivered + 1) / expected) if expected else 1.0
+            step.streams[self.service.DECODERS[uuid.lower()].name] = {
+                'expected': round(expected, 1),
+                'delivered': delivered,
+                'ratio': round(ratio, 4),
+                'missing': max(0, round(expected - delivered)),
+                'lost': self.service.lost_samples.get(uuid, 0) - lost[uuid],  # Gaps in framed sequences
+            }
+            if ratio < self.target:
+                step.ok = False
+        return step
+
+    def _result(self, best):
+        device = self.service.connected_device
+        return {
+            'host': socket.gethostname(),
+            'adapter': self.adapter,
+            'platform': platform.platform(),
+            'backend': self.config.BLE_BACKEND,
+            'device': device.address if device else None,
+            'firmware': getattr(device, 'firmware', None),
+            'target': self.target,
+            'rate': DeviceConfig.ACCEL_GYRO_FREQ_MAP[best.imu1_accel_gyro_freq] if best else None,
+            'rate_hz': best.imu_rate_hz(1) if best else None,
+            'sensor_interval': best.sensor_interval if best else None,
+            'steps': [step.to_dict() for step in self.steps],
+            'tuned': time.time(),
+        }
+
+    def save(self, result):
+        """Store result under its host and adapter, replacing the previous one"""
+        path = self.config.AUTOTUNE_RESULTS_FILE
+        if not path:
+            return
+        results = self.load()
+        results.setdefault(result['host'], {})[result['adapter']] = result
+        try:
+            temp_path = path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump({'version': self.FORMAT_VERSION, 'results': results}, f, indent=2)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error saving auto-tune results: {e}")
+
+    @classmethod
+    def load(cls):
+        """Stored results as host -> adapter -> result"""
+        path = AppConfig().AUTOTUNE_RESULTS_FILE
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != cls.FORMAT_VERSION:
+                return {}
+            return data.get('results', {})
+        except Exception as e:
+            print(f"Error loading auto-tune results: {e}")
+            return {}
@@ -0,0 +1,179 @@
+"""Lossless capture of raw notification payloads
+
+File layout:
+
+    bytes 0-7   magic b'VRGRAW01'
+    bytes 8-11  header length N (uint32, little endian)
+    bytes 12-   N bytes of UTF-8 JSON: UUID table, creation time, metadata
+    then        records: receive time (float64, time.monotonic seconds),
+                UUID table index (uint8), payload length (uint16), payload
+
+Records are appended in arrival order, so replaying them in file order
+reproduces the notification sequence exactly.
+"""
+import json
+import struct
+import time
+from src.config.app_config import AppConfig
+from src.model.background_writer import BackgroundWriter
+
+MAGIC = b'VRGRAW01'
+FORMAT_VERSION = 1
+HEADER_LENGTH = struct.Struct('<I')
+RECORD = struct.Struct('<dBH')
+
+# Payloads handed to the writer thread at once
+CHUNK_RECORDS = 256
+
+# Bytes read from a capture file at once
+READ_CHUNK_SIZE = 1 << 20
+
+
+class RawCaptureWriter:
+    """Record every notification payload of ESP32BLEService to a capture file
+
+    record() runs inside the notification handlers, so it only stores the
+    payload; packing and file I/O happen on a BackgroundWriter thread. Its
+    queue is unbounded: a slow disk costs memory, never payloads. Only
+    failed writes count as dropped in get_stats().
+    """
+
+    def __init__(self, service, path, metadata=None):
+        """Initialize writer
+
+        Args:
+            service: ESP32BLEService whose notifications are captured
+            path: Capture file path, overwritten if it exists
+            metadata: Optional JSON-serializable dict stored in the header
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.service = service
+        self.path = path
+        self.metadata = metadata or {}
+        self.uuids = [uuid for uuid, _ in service.CHARACTERISTICS.values()]
+        self._index = {uuid.lower(): i for i, uuid in enumerate(self.uuids)}
+        self._pending = []
+        self._last_handoff = 0.0
+        self._file = None
+        self._writer = BackgroundWriter(self._write_records, self._flush_file, "raw-capture", bounded=False)
+        self.records = 0
+
+    def start(self):
+        """Open the file and start capturing
+
+        Returns:
+            bool: True if capturing started
+        """
+        try:
+            header = {
+                'version': FORMAT_VERSION,
+                'uuids': self.uuids,
+                'created': time.time(),
+                'metadata': self.metadata,
+            }
+            body = json.dumps(header).encode('utf-8')
+            self._file = open(self.path, 'wb')
+            self._file.write(MAGIC + HEADER_LENGTH.pack(len(body)) + body)
+        except Exception as e:
+            print(f"Error opening raw capture file: {e}")
+            return False
+        self._last_handoff = time.monotonic()
+        self._writer.start()
+        self.service.raw_capture = self
+        return True
+
+    def stop(self):
+        """Stop capturing, write everything recorded and close the file"""
+        if self.service.raw_capture is self:
+            self.service.raw_capture = None
+        self._handoff()
+        self._writer.stop()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def record(self, uuid, data):
+        """Store one notification payload, called from the notification handlers"""
+        t = time.monotonic()
+        self._pending.append((t, self._index[uuid.lower()], bytes(data)))
+        self.records += 1
+        if len(self._pending) >= CHUNK_RECORDS or t - self._last_handoff >= self.config.LOG_FLUSH_INTERVAL:
+            self._last_handoff = t
+            self._handoff()
+
+    def get_stats(self):
+        """Writer counters plus the number of recorded payloads"""
+        stats = self._writer.get_stats()
+        stats['records'] = self.records
+        return stats
+
+    def _handoff(self):
+        """Pass pending payloads to the writer thread"""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._writer.enqueue(self.path, len(pending), lambda: pending)
+
+    def _write_records(self, path, records):
+        """Pack and write records, called on the writer thread"""
+        pack = RECORD.pack
+        self._file.write(b''.join(pack(t, index, len(payload)) + payload for t, index, payload in records))
+
+    def _flush_file(self):
+        self._file.flush()
+
+
+class RawCaptureReader:
+    """Sequential reader of a capture file
+
+    Only the header is read on open; records are streamed from the file in
+    READ_CHUNK_SIZE pieces while iterating.
+    """
+
+    def __init__(self, path):
+        """Open a capture file and read its header
+
+        Args:
+            path: File written by RawCaptureWriter
+
+        Raises:
+            ValueError: If the file is not a raw capture
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            prefix = f.read(len(MAGIC) + HEADER_LENGTH.size)
+            if len(prefix) < len(MAGIC) + HEADER_LENGTH.size or prefix[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"Not a raw capture file: {path}")
+            length, = HEADER_LENGTH.unpack_from(prefix, len(MAGIC))
+            self.header = json.loads(f.read(length).decode('utf-8'))
+        if self.header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported raw capture version: {self.header.get('version')}")
+        self.uuids = self.header['uuids']
+        self.metadata = self.header['metadata']
+        self._offset = len(prefix) + length
+
+    def __iter__(self):
+        """Yield (receive time, uuid, payload) in arrival order
+
+        A trailing partial record (interrupted write) is ignored.
+        """
+        unpack_from = RECORD.unpack_from
+        uuids = self.uuids
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = b''
+            offset = 0
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    return
+                # Carry the incomplete record at the end of the previous chunk over
+                data = data[offset:] + chunk
+                offset = 0
+                end = len(data)
+                while offset + RECORD.size <= end:
+                    t, index, length = unpack_from(data, offset)
+                    if offset + RECORD.size + length > end:
+                        break
+                    offset += RECORD.size
+                    yield t, uuids[index], data[offset:offset + length]
+                    offset += length
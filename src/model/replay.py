@@ -0,0 +1,127 @@
+import asyncio
+import inspect
+import time
+from src.model.ble_service import BLEDeviceInfo
+from src.model.raw_capture import RawCaptureReader
+
+class ReplayClient:
+    """Stand-in for BleakClient that serves notifications from a raw capture
+
+    Reads return the last payload seen for a characteristic, writes are kept
+    so a later read returns them.
+    """
+
+    def __init__(self, values=None):
+        """Initialize client
+
+        Args:
+            values: Optional dict of uuid -> bytes returned by reads
+        """
+        self.is_connected = True
+        self.services = []
+        self.handlers = {}
+        self.values = {uuid.lower(): value for uuid, value in (values or {}).items()}
+
+    async def start_notify(self, uuid, callback):
+        self.handlers[uuid.lower()] = callback
+
+    async def stop_notify(self, uuid):
+        self.handlers.pop(uuid.lower(), None)
+
+    async def read_gatt_char(self, uuid):
+        return self.values.get(uuid.lower())
+
+    async def write_gatt_char(self, uuid, data, response=None):
+        self.values[uuid.lower()] = bytes(data)
+
+    async def disconnect(self):
+        self.is_connected = False
+        self.handlers.clear()
+
+    async def deliver(self, uuid, data):
+        """Hand one payload to the handler subscribed to uuid, like a notification"""
+        key = uuid.lower()
+        self.values[key] = data
+        handler = self.handlers.get(key)
+        if handler is None:
+            return False
+        result = handler(uuid, bytearray(data))
+        if inspect.isawaitable(result):
+            await result
+        return True
+
+
+class NotificationReplay:
+    """Feed a raw capture back through the ESP32BLEService notification handlers
+
+    Payloads are delivered in capture order through the same handlers BLE
+    notifications use, so ring buffers, presenters and loggers see the
+    recorded traffic. speed scales the recorded timing: 1 is real time, N is
+    N times faster and 0 replays as fast as possible.
+    """
+
+    # Payloads delivered between yields to the event loop when running ahead
+    YIELD_EVERY = 64
+
+    def __init__(self, service, path, speed=1.0):
+        """Initialize replay
+
+        Args:
+            service: ESP32BLEService to feed
+            path: Raw capture file
+            speed: Replay speed factor, 0 for as fast as possible
+        """
+        self.service = service
+        self.reader = RawCaptureReader(path)
+        self.speed = speed
+        reads = self.reader.metadata.get('reads', {})
+        self.client = ReplayClient({uuid: bytes.fromhex(value) for uuid, value in reads.items()})
+        self.delivered = 0
+        self.skipped = 0  # Payloads of characteristics nobody subscribed to
+        self.elapsed = 0.0
+
+    async def attach(self, device_info=None):
+        """Connect the service to the replay client instead of a BLE device
+
+        Returns:
+            BLEDeviceInfo used for the connection, or None on failure
+        """
+        device_info = device_info or BLEDeviceInfo(
+            address=self.reader.metadata.get('address', 'replay'), name="Replay")
+        if not await self.service.attach_client(self.client, device_info):
+            return None
+        return device_info
+
+    async def run(self):
+        """Replay the whole capture
+
+        Returns:
+            dict with delivered and skipped payload counts, elapsed seconds and rate
+        """
+        start = time.monotonic()
+        first = None
+        for index, (t, uuid, payload) in enumerate(self.reader):
+            if not self.client.is_connected:
+                break
+            if first is None:
+                first = t
+            delay = (start + (t - first) / self.speed - time.monotonic()) if self.speed else 0
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif index % self.YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+            if await self.client.deliver(uuid, payload):
+                self.delivered += 1
+            else:
+                self.skipped += 1
+        self.elapsed = time.monotonic() - start
+        return self.get_stats()
+
+    def get_stats(self):
+        """Replay counters"""
+        return {
+            'delivered': self.delivered,
+            'skipped': self.skipped,
+            'elapsed': self.elapsed,
+            'rate': self.delivered / self.elapsed if self.elapsed else 0.0,
+        }
@@ -0,0 +1,94 @@
+import numpy as np
+
+class RingBuffer:
+    """Preallocated, fixed-capacity ring buffer of decoded sample rows
+
+    Each row holds the host receive time (time.monotonic seconds) in field 't'
+    followed by the sample fields. The writer only ever overwrites the oldest
+    rows, so a slow reader loses old samples instead of stalling the writer.
+    """
+
+    def __init__(self, sample_dtype, capacity):
+        """Initialize ring buffer
+
+        Args:
+            sample_dtype: structured dtype of one sample, without the time field
+            capacity: number of rows kept before the oldest are overwritten
+        """
+        self.dtype = np.dtype([('t', '<f8')] + sample_dtype.descr)
+        self.capacity = capacity
+        self.total = 0  # Rows ever written, doubles as the write cursor
+        self._rows = np.zeros(capacity, dtype=self.dtype)
+
+    def append(self, t, values):
+        """Append one sample
+
+        Args:
+            t: host receive time
+            values: tuple of sample values in field order
+        """
+        self._rows[self.total % self.capacity] = (t, *values)
+        self.total += 1
+
+    def extend(self, t, samples):
+        """Append a batch of samples received together
+
+        Args:
+            t: host receive time shared by the batch
+            samples: structured array with the sample dtype
+        """
+        count = len(samples)
+        if count > self.capacity:
+            samples = samples[-self.capacity:]
+            self.total += count - self.capacity
+            count = self.capacity
+        index = np.arange(self.total, self.total + count) % self.capacity
+        self._rows['t'][index] = t
+        for name in samples.dtype.names:
+            self._rows[name][index] = samples[name]
+        self.total += count
+
+    def rows(self, start, stop):
+        """Copy of rows [start, stop) counted in total-written order"""
+        start = max(start, stop - self.capacity, 0)
+        return self._rows[np.arange(start, stop) % self.capacity]
+
+    def latest(self):
+        """Copy of the most recent row, or None if nothing was written"""
+        if not self.total:
+            return None
+        return self._rows[(self.total - 1) % self.capacity].copy()
+
+    def clear(self):
+        """Forget all rows"""
+        self.total = 0
+
+    def reader(self):
+        """Create an independent reader starting at the current write position"""
+        return RingReader(self)
+
+
+class RingReader:
+    """Cursor over a RingBuffer for one consumer"""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.cursor = buffer.total
+        self.dropped = 0  # Rows overwritten before this reader got to them
+
+    def pending(self):
+        """Number of rows written since the last read"""
+        return self.buffer.total - self.cursor
+
+    def read(self):
+        """Return all rows written since the last read"""
+        total = self.buffer.total
+        if total < self.cursor:
+            # Buffer was cleared, start over
+            self.cursor = 0
+        overrun = total - self.cursor - self.buffer.capacity
+        if overrun > 0:
+            self.dropped += overrun
+        rows = self.buffer.rows(self.cursor, total)
+        self.cursor = total
+        return rows
@@ -0,0 +1,102 @@
+import re
+import struct
+from operator import itemgetter
+import numpy as np
+
+# Multi-sample notification frame: header followed by `count` packed samples.
+# A frame is never the size of a single sample, so both layouts can share a
+# characteristic and are told apart by payload length.
+FRAME_MAGIC = 0xA5
+FRAME_HEADER = struct.Struct('<BBH')  # magic, sample count, sequence of first sample
+SEQUENCE_MASK = 0xFFFF  # Frame sequences wrap at 16 bits
+SEQUENCE_HALF = 0x8000  # Wrapped deltas of at least this much point backwards
+
+
+# struct format codes to little-endian NumPy types
+_NUMPY_TYPES = {'b': 'i1', 'B': 'u1', 'h': '<i2', 'H': '<u2', 'i': '<i4', 'I': '<u4',
+                'q': '<i8', 'Q': '<u8', 'f': '<f4', 'd': '<f8'}
+
+
+def struct_dtype(sample_struct, names):
+    """Structured dtype with the same layout as a little-endian struct format"""
+    types = []
+    for count, code in re.findall(r'(\d*)([a-zA-Z])', sample_struct.format):
+        types += [_NUMPY_TYPES[code]] * int(count or 1)
+    return np.dtype(list(zip(names, types)))
+
+
+def parse_frame_header(data, sample_size):
+    """Split a multi-sample frame into (sequence, count, body)
+
+    Returns None if data is not a valid frame of samples of sample_size bytes.
+    """
+    if len(data) < FRAME_HEADER.size or len(data) == sample_size:
+        return None
+    magic, count, sequence = FRAME_HEADER.unpack_from(data)
+    if magic != FRAME_MAGIC or count == 0 or len(data) != FRAME_HEADER.size + count * sample_size:
+        return None
+    return sequence, count, memoryview(data)[FRAME_HEADER.size:]
+
+
+def field(index):
+    """Read-only accessor for one value of a Sample"""
+    return property(itemgetter(index))
+
+
+class Sample(tuple):
+    """Base class for compact immutable sample models
+
+    Field values live directly in the tuple, so a sample costs one tuple
+    allocation and no per-instance dict. The raw payload is not kept: it is
+    re-packed from the values with STRUCT when raw_data is requested.
+    """
+
+    __slots__ = ()
+
+    # Field names in payload order and the struct used to (un)pack them
+    FIELDS = ()
+    STRUCT = None
+    # Structured dtype of one sample, derived from STRUCT unless a class sets it
+    DTYPE = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.STRUCT is not None and 'DTYPE' not in cls.__dict__:
+            cls.DTYPE = struct_dtype(cls.STRUCT, cls.FIELDS)
+
+    @classmethod
+    def _make(cls, values):
+        """Create a sample straight from unpacked values"""
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def from_frame(cls, data):
+        """Decode a multi-sample frame
+
+        Returns:
+            (sequence, samples) with sequence of the first sample, or None if
+            data is not a valid frame for this sample type
+        """
+        frame = parse_frame_header(data, cls.STRUCT.size)
+        if frame is None:
+            return None
+        sequence, count, body = frame
+        build = getattr(cls, 'from_values', None) or cls._make
+        samples = [build(values) for values in cls.STRUCT.iter_unpack(body)]
+        return sequence, [sample for sample in samples if sample]
+
+    @property
+    def raw_data(self):
+        """Binary payload re-packed from the stored values"""
+        return self.STRUCT.pack(*self)
+
+    def to_hex_string(self):
+        """Convert raw data to hex string representation"""
+        return ' '.join(f'{b:02x}' for b in self.raw_data)
+
+    def __repr__(self):
+        values = ', '.join(f"{name}={value!r}" for name, value in zip(self.FIELDS, self))
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        return (self._make, (tuple(self),))
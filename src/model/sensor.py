@@ -1,12 +1,21 @@
 import struct
+from src.model.sample import Sample, field
 
-class FlexSensorData:
+class FlexSensorData(Sample):
     """Model class representing flex sensor data"""
-    
-    def __init__(self, values=None, raw_data=None):
+
+    __slots__ = ()
+    FIELDS = ('flex1', 'flex2', 'flex3', 'flex4', 'flex5')
+    STRUCT = struct.Struct('<5f')  # 5 float32 values
+
+    def __new__(cls, values=None, raw_data=None):
         # Array of 5 resistance values in kOhm
-        self.values = values if values else [0.0] * 5
-        self.raw_data = raw_data
+        return tuple.__new__(cls, values if values else (0.0,) * 5)
+
+    @property
+    def values(self):
+        """Resistance values in kOhm, one per flex sensor"""
+        return tuple(self)
         
     @classmethod
     def from_bytes(cls, data):
@@ -15,36 +24,33 @@ class FlexSensorData:
             return None
             
         try:
-            # Unpack 5 float32 values
-            values = list(struct.unpack('<5f', data))
-            return cls(values=values, raw_data=data)
+            return cls._make(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing flex sensor data: {e}")
             return None
-            
-    def to_hex_string(self):
-        """Convert raw data to hex string representation"""
-        if not self.raw_data:
-            return ""
-        return ' '.join(f'{b:02x}' for b in self.raw_data)
         
     def get_debug_text(self):
         """Get formatted debug text"""
         hex_str = self.to_hex_string()
         debug_text = f"Raw data ({len(self.raw_data)} bytes):\n{hex_str}\n\n"
         debug_text += "Flex sensor values (kOhm):\n"
-        for i, value in enumerate(self.values, 1):
+        for i, value in enumerate(self, 1):
             debug_text += f"Sensor {i}: {value:.2f}\n"
         return debug_text
 
 
-class ForceSensorData:
+class ForceSensorData(Sample):
     """Model class representing force sensor data"""
-    
-    def __init__(self, value=0.0, raw_data=None):
+
+    __slots__ = ()
+    FIELDS = ('value',)
+    STRUCT = struct.Struct('<f')  # 1 float32 value
+
+    def __new__(cls, value=0.0, raw_data=None):
         # Resistance value in kOhm
-        self.value = value
-        self.raw_data = raw_data
+        return tuple.__new__(cls, (value,))
+
+    value = field(0)
         
     @classmethod
     def from_bytes(cls, data):
@@ -53,18 +59,10 @@ class ForceSensorData:
             return None
             
         try:
-            # Unpack float32 value
-            value = struct.unpack('<f', data)[0]
-            return cls(value=value, raw_data=data)
+            return cls._make(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing force sensor data: {e}")
             return None
-            
-    def to_hex_string(self):
-        """Convert raw data to hex string representation"""
-        if not self.raw_data:
-            return ""
-        return ' '.join(f'{b:02x}' for b in self.raw_data)
         
     def get_debug_text(self):
         """Get formatted debug text"""
@@ -0,0 +1,200 @@
+"""Append-only binary session log
+
+One file per stream: a small header followed by fixed-width records.
+
+    bytes 0-7   magic b'VRGSESS1'
+    bytes 8-11  header length N (uint32, little endian)
+    bytes 12-   N bytes of UTF-8 JSON, space padded so records start on a
+                64-byte boundary: schema (NumPy dtype descr), CSV column
+                names, creation time and free-form metadata such as config
+    then        records, little endian, packed back to back
+
+Records are only ever appended, so a file cut short by a crash is still
+readable up to its last complete record.
+
+Convert a session folder to CSV:
+    python -m src.model.session_log path/to/session
+"""
+import csv
+import json
+import os
+import struct
+import sys
+import time
+import numpy as np
+
+MAGIC = b'VRGSESS1'
+FORMAT_VERSION = 1
+HEADER_LENGTH = struct.Struct('<I')
+ALIGNMENT = 64
+EXTENSION = '.bin'
+
+
+class SessionWriter:
+    """Append structured records of one stream to a binary session file"""
+
+    def __init__(self, path, stream, dtype, columns=None, metadata=None):
+        """Create the file and write its header
+
+        Args:
+            path: File path, overwritten if it exists
+            stream: Stream name stored in the header
+            dtype: Structured dtype of one record
+            columns: Optional CSV column names, defaults to the dtype field names
+            metadata: Optional JSON-serializable dict, e.g. device config
+        """
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.records = 0
+        header = {
+            'version': FORMAT_VERSION,
+            'stream': stream,
+            'dtype': self.dtype.descr,
+            'columns': list(columns or self.dtype.names),
+            'created': time.time(),
+            'metadata': metadata or {},
+        }
+        self._file = open(path, 'wb')
+        self._file.write(encode_header(header))
+
+    def append(self, records):
+        """Append records, converting to the stream dtype if needed
+
+        Args:
+            records: Structured array with the stream fields
+        """
+        if len(records) == 0:
+            return
+        if records.dtype != self.dtype:
+            converted = np.empty(len(records), dtype=self.dtype)
+            for name in self.dtype.names:
+                converted[name] = records[name]
+            records = converted
+        self._file.write(records.tobytes())
+        self.records += len(records)
+
+    def flush(self):
+        """Flush written records to the operating system"""
+        self._file.flush()
+
+    def close(self):
+        """Close the file"""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class SessionReader:
+    """Memory-mapped, zero-copy view of a binary session file"""
+
+    def __init__(self, path):
+        """Open a session file
+
+        Args:
+            path: File written by SessionWriter
+
+        Raises:
+            ValueError: If the file is not a session file
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self.header, self.data_offset = decode_header(f)
+        self.stream = self.header['stream']
+        self.columns = self.header['columns']
+        self.metadata = self.header['metadata']
+        self.dtype = np.dtype([tuple(field) for field in self.header['dtype']])
+
+        # A trailing partial record (interrupted write) is ignored
+        count = (os.path.getsize(path) - self.data_offset) // self.dtype.itemsize
+        if count > 0:
+            self.records = np.memmap(path, dtype=self.dtype, mode='r', offset=self.data_offset, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=self.dtype)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def export_csv(self, csv_path):
+        """Write the records as CSV with the stored column names
+
+        Args:
+            csv_path: Destination CSV file
+
+        Returns:
+            int: Number of rows written
+        """
+        chunk = 65536
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            for start in range(0, len(self.records), chunk):
+                block = self.records[start:start + chunk]
+                writer.writerows(zip(*(block[name].tolist() for name in self.dtype.names)))
+        return len(self.records)
+
+
+def encode_header(header):
+    """Encode a header dict, padded so the records start aligned"""
+    body = json.dumps(header).encode('utf-8')
+    size = len(MAGIC) + HEADER_LENGTH.size + len(body)
+    body += b' ' * (-size % ALIGNMENT)
+    return MAGIC + HEADER_LENGTH.pack(len(body)) + body
+
+
+def decode_header(f):
+    """Read a header from a binary file object
+
+    Returns:
+        (header dict, offset of the first record)
+    """
+    prefix = f.read(len(MAGIC) + HEADER_LENGTH.size)
+    if len(prefix) < len(MAGIC) + HEADER_LENGTH.size or prefix[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not a session log file: {f.name}")
+    length, = HEADER_LENGTH.unpack_from(prefix, len(MAGIC))
+    header = json.loads(f.read(length).decode('utf-8'))
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported session log version: {header.get('version')}")
+    return header, len(prefix) + length
+
+
+def open_session(folder):
+    """Open every stream of a session folder
+
+    Returns:
+        dict mapping stream name to SessionReader
+    """
+    readers = {}
+    for name in sorted(os.listdir(folder)):
+        if name.endswith(EXTENSION):
+            reader = SessionReader(os.path.join(folder, name))
+            readers[reader.stream] = reader
+    return readers
+
+
+def export_session_csv(folder, out_folder=None):
+    """Convert every stream of a session folder to <stream>.csv
+
+    Args:
+        folder: Session folder with .bin files
+        out_folder: Destination folder, defaults to the session folder
+
+    Returns:
+        dict mapping CSV path to number of rows written
+    """
+    out_folder = out_folder or folder
+    written = {}
+    for stream, reader in open_session(folder).items():
+        csv_path = os.path.join(out_folder, stream + '.csv')
+        written[csv_path] = reader.export_csv(csv_path)
+    return written
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python -m src.model.session_log <session folder> [output folder]")
+        sys.exit(1)
+    for path, rows in export_session_csv(*sys.argv[1:]).items():
+        print(f"✓ {path}: {rows} rows")
@@ -0,0 +1,139 @@
+import asyncio
+import os
+from src.config.app_config import AppConfig
+from src.model.background_writer import BackgroundWriter
+from src.model.session_log import SessionWriter, EXTENSION
+
+class SessionRecorder:
+    """Record every buffered characteristic of ESP32BLEService to one session folder
+
+    Each stream (IMU, Euler, flex, force, joystick, buttons, overall status,
+    battery) is written to <stream>.bin as a binary session log. Records are
+    the ring buffer rows: host receive time 't' (time.monotonic seconds)
+    followed by the sample fields, so streams can be aligned with each other.
+
+    The recorder drains the ring buffers from the event loop and leaves the
+    file I/O to a BackgroundWriter thread; notification handlers are untouched.
+    The recorder holds every stream it records as an owner of the
+    subscription (buffer-only if nobody else subscribed it) and releases
+    them on stop; a stream stops only when no presenter holds it either.
+    """
+
+    def __init__(self, service, path, metadata=None):
+        """Initialize recorder
+
+        Args:
+            service: Connected ESP32BLEService
+            path: Session folder, created if missing
+            metadata: Optional dict stored in every stream header
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.service = service
+        self.path = path
+        self.metadata = metadata or {}
+        self.is_recording = False
+        self._files = {}
+        self._readers = {}
+        self._subscribed = []
+        self._task = None
+        self._writer = BackgroundWriter(self._write_rows, self._flush_files, "session-recorder")
+
+    @staticmethod
+    def stream_name(characteristic_name):
+        """File stream name for a characteristic, e.g. FLEX_SENSOR_UUID -> flex_sensor"""
+        return characteristic_name.lower().removesuffix('_uuid')
+
+    async def start(self):
+        """Open the stream files, subscribe missing streams and start draining
+
+        Returns:
+            bool: True if recording started
+        """
+        if self.is_recording:
+            return True
+        self._files = {}
+        self._readers = {}
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            device = self.service.connected_device
+            for name, (uuid, data_class) in self.service.CHARACTERISTICS.items():
+                buffer = self.service.buffers.get(uuid)
+                if buffer is None:
+                    continue
+                stream = self.stream_name(name)
+                metadata = dict(self.metadata, uuid=uuid, data_class=data_class.__name__,
+                                device=getattr(device, 'address', None))
+                self._files[stream] = SessionWriter(
+                    os.path.join(self.path, stream + EXTENSION), stream, buffer.dtype, metadata=metadata)
+                self._readers[stream] = buffer.reader()
+        except Exception as e:
+            print(f"Error opening session files: {e}")
+            self._close_files()
+            self._files = {}
+            return False
+
+        self._writer.start()
+        self.is_recording = True
+
+        for uuid in self.service.buffers:
+            if await self.service.start_stream_notify(uuid, owner=self):
+                self._subscribed.append(uuid)
+
+        self._task = asyncio.get_running_loop().create_task(self._drain_loop())
+        return True
+
+    async def stop(self):
+        """Stop draining, write everything still buffered and close the files"""
+        if not self.is_recording:
+            return
+        self.is_recording = False
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        for uuid in self._subscribed:
+            await self.service.stop_stream_notify(uuid, owner=self)
+        self._subscribed = []
+        self._drain()
+
+        # Let the writer drain the queue before the files are closed
+        self._writer.stop()
+        self._close_files()
+
+    def get_stats(self):
+        """Recorder counters
+
+        Returns:
+            dict with writer counters plus per-stream records and ring buffer overruns
+        """
+        stats = self._writer.get_stats()
+        stats['records'] = {stream: writer.records for stream, writer in self._files.items()}
+        stats['overrun'] = {stream: reader.dropped for stream, reader in self._readers.items()}
+        return stats
+
+    async def _drain_loop(self):
+        """Move new ring buffer rows to the writer at a fixed pace"""
+        while True:
+            await asyncio.sleep(self.config.SAMPLE_CONSUME_INTERVAL)
+            self._drain()
+
+    def _drain(self):
+        """Queue every row written since the last drain"""
+        for stream, reader in self._readers.items():
+            rows = reader.read()
+            if len(rows):
+                # Rows are copies, safe to hand to the writer thread as they are
+                self._writer.enqueue(stream, len(rows), lambda rows=rows: rows)
+
+    def _write_rows(self, stream, rows):
+        """Append rows to a stream file, called on the writer thread"""
+        self._files[stream].append(rows)
+
+    def _flush_files(self):
+        """Flush all stream files, called on the writer thread"""
+        for writer in self._files.values():
+            writer.flush()
+
+    def _close_files(self):
+        for writer in self._files.values():
+            writer.close()
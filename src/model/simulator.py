@@ -0,0 +1,478 @@
+"""In-process simulated ESP32 glove for running without hardware
+
+SimulatedClient and SimulatedScanner implement the parts of the BleakClient
+and BleakScanner interfaces the application uses. Select them with
+AppConfig.BLE_BACKEND = "simulated" (or --simulate on main.py,
+ble_debug_app.py and src.capture); see transport.py.
+
+The simulated device exposes the same GATT characteristics as the firmware:
+device information strings, battery level and charging state, the 15-byte
+config, a readable/writable timestamp and notifying IMU, Euler, flex, force,
+joystick, buttons and overall status streams. Stream rates follow the config
+characteristic like the firmware (IMU accel/gyro frequency, sensor update
+interval) unless AppConfig.SIM_RATE_HZ or SIM_RATES override them, so rates
+of 1 kHz and more per stream are possible. AppConfig.SIM_JITTER and SIM_LOSS
+add timing jitter and dropped notifications, SIM_FRAME_SAMPLES > 1 sends
+multi-sample frames with sequence numbers like the batching firmware.
+Every GATT operation takes AppConfig.SIM_GATT_LATENCY seconds and, like ATT, which allows one
+outstanding request per link, operations of one client run one after another.
+"""
+import asyncio
+import math
+import random
+import struct
+import time
+import numpy as np
+from src.config.app_config import AppConfig
+from src.model.esp32_service import ESP32BLEService
+from src.model.device_config import DeviceConfig
+from src.model.replay import ReplayClient
+from src.model.sample import FRAME_MAGIC, FRAME_HEADER
+from src.model.overall_status import OverallStatus
+
+# Config the simulated device starts with: RUN, 104 Hz IMUs, 100 ms sensor interval
+DEFAULT_CONFIG = DeviceConfig(cmd=DeviceConfig.CMD_RUN,
+                              imu1_accel_gyro_freq=4, imu1_mag_freq=3, imu2_accel_gyro_freq=4, imu2_mag_freq=3,
+                              imu1_accel_range=0, imu1_gyro_range=2, imu1_mag_range=1,
+                              imu2_accel_range=0, imu2_gyro_range=2, imu2_mag_range=1,
+                              sensor_interval=100)
+
+# Streams that report at a fixed slow rate regardless of config
+STATUS_RATE_HZ = 1.0
+
+# Seconds of notifications the simulated device queues while the link is saturated
+LINK_QUEUE_TIME = 0.05
+
+# Largest sample count a frame header can carry
+MAX_FRAME_SAMPLES = 255
+
+# Seconds of calibration until a calibrating IMU reports full calibration (3)
+CALIBRATION_TIME = 3.0
+
+C = ESP32BLEService.CHARACTERISTICS
+
+# GATT layout: service name -> (service UUID, characteristic names)
+SERVICES = {
+    "Device": ("0000180a-0000-1000-8000-00805f9b34fb",
+               ("FIRMWARE_UUID", "MODEL_NUMBER_UUID", "MANUFACTURER_UUID", "HARDWARE_UUID")),
+    "Battery": ("0000180f-0000-1000-8000-00805f9b34fb",
+                ("BATTERY_LEVEL_UUID", "BATTERY_CHARGING_UUID")),
+    "Sensors": ("ED38FBD9-3657-4BE3-BF5E-3AB5D29818D8",
+                ("CONFIG_UUID", "TIMESTAMP_CHAR_UUID", "OVERALL_STATUS_UUID",
+                 "IMU1_CHAR_UUID", "IMU2_CHAR_UUID", "IMU1_EULER_UUID", "IMU2_EULER_UUID",
+                 "FLEX_SENSOR_UUID", "FORCE_SENSOR_UUID")),
+    "Gamepad": ("aade5d3b-2717-4903-8ed8-7544b47d1fc0",
+                ("JOYSTICK_UUID", "BUTTONS_UUID")),
+}
+
+# Characteristic properties reported to service discovery
+READ_ONLY = ("FIRMWARE_UUID", "MODEL_NUMBER_UUID", "MANUFACTURER_UUID", "HARDWARE_UUID")
+READ_WRITE = ("CONFIG_UUID", "TIMESTAMP_CHAR_UUID")
+
+
+class SimulatedCharacteristic:
+    """GATT characteristic description as seen by service discovery"""
+
+    def __init__(self, uuid, properties):
+        self.uuid = uuid
+        self.properties = properties
+
+
+class SimulatedGattService:
+    """GATT service description as seen by service discovery"""
+
+    def __init__(self, uuid, characteristics):
+        self.uuid = uuid
+        self.characteristics = characteristics
+
+
+class SimulatedBLEDevice:
+    """Advertised device, shaped like bleak's BLEDevice"""
+
+    def __init__(self, address, name, rssi):
+        self.address = address
+        self.name = name
+        self.rssi = rssi
+
+
+class SimulatedAdvertisement:
+    """Advertisement data, shaped like bleak's AdvertisementData"""
+
+    def __init__(self, rssi):
+        self.rssi = rssi
+
+
+def _wave(t, period, amplitude, phase=0.0):
+    """Sine wave over the sample times t"""
+    return amplitude * np.sin(2 * np.pi * t / period + phase)
+
+
+class SimulatedDevice:
+    """State and signal generators of one simulated glove
+
+    Devices are kept per address, so config and timestamp writes survive a
+    reconnect like they do on the firmware.
+    """
+
+    _devices = {}
+
+    def __init__(self, address, name):
+        self.address = address
+        self.name = name
+        self.config = DEFAULT_CONFIG
+        self.timestamp_offset = 0  # Device time minus host time, in ms
+        self.calibration_start = {1: None, 2: None}
+        self.calibrated = {1: 3, 2: 3}
+        self.started = time.monotonic()
+        self.unavailable_until = 0.0  # Connects fail before this time.monotonic(), see SimulatedClient.drop_link
+        self.services = [
+            SimulatedGattService(uuid, [
+                SimulatedCharacteristic(C[name][0], self._properties(name)) for name in names
+            ])
+            for uuid, names in SERVICES.values()
+        ]
+
+    @classmethod
+    def get(cls, address):
+        """Simulated device for an address, created on first use"""
+        device = cls._devices.get(address)
+        if device is None:
+            device = cls._devices[address] = cls(address, f"VR Glove Sim {len(cls._devices) + 1}")
+        return device
+
+    @classmethod
+    def advertised(cls):
+        """Devices the simulated scanner reports, AppConfig.SIM_DEVICE_COUNT of them"""
+        count = AppConfig().SIM_DEVICE_COUNT
+        return [cls.get(f"00:00:5E:00:53:{index:02X}") for index in range(1, count + 1)]
+
+    @staticmethod
+    def _properties(name):
+        if name in READ_ONLY:
+            return ["read"]
+        if name == "CONFIG_UUID":
+            return ["read", "write", "notify"]
+        if name in READ_WRITE:
+            return ["read", "write"]
+        return ["read", "notify"]
+
+    def rate(self, name):
+        """Samples per second a notifying characteristic produces"""
+        config = AppConfig()
+        if name in config.SIM_RATES:
+            return config.SIM_RATES[name]
+        if name in ("OVERALL_STATUS_UUID", "BATTERY_LEVEL_UUID", "BATTERY_CHARGING_UUID"):
+            return STATUS_RATE_HZ
+        if name.startswith("IMU"):
+            if self.config.cmd == DeviceConfig.CMD_IDLE:
+                return 0.0
+            if config.SIM_RATE_HZ:
+                return config.SIM_RATE_HZ
+            return self.config.imu_rate_hz(1 if name.startswith("IMU1") else 2)
+        if config.SIM_RATE_HZ:
+            return config.SIM_RATE_HZ
+        return self.config.sensor_rate_hz
+
+    def write(self, name, data):
+        """Apply a characteristic write"""
+        if name == "CONFIG_UUID":
+            if len(data) != DeviceConfig.SIZE:
+                raise ValueError(f"config must be {DeviceConfig.SIZE} bytes")
+            new_config = DeviceConfig.from_bytes(data)
+            for imu in (1, 2):
+                calibrating = new_config.cmd == imu + 1
+                if calibrating and self.calibration_start[imu] is None:
+                    self.calibration_start[imu] = time.monotonic()
+                elif not calibrating:
+                    self.calibration_start[imu] = None
+            self.config = new_config
+        elif name == "TIMESTAMP_CHAR_UUID":
+            value, = struct.unpack('<Q', bytes(data))
+            self.timestamp_offset = value - int(time.time() * 1000)
+        else:
+            raise ValueError(f"{name} is not writable")
+
+    def read(self, name):
+        """Current value of a readable characteristic"""
+        if name == "FIRMWARE_UUID":
+            return b"1.0.0-sim"
+        if name == "MODEL_NUMBER_UUID":
+            return b"VR Glove"
+        if name == "MANUFACTURER_UUID":
+            return b"Simulator"
+        if name == "HARDWARE_UUID":
+            return b"sim"
+        if name == "CONFIG_UUID":
+            return self.config.raw_data
+        if name == "TIMESTAMP_CHAR_UUID":
+            return struct.pack('<Q', int(time.time() * 1000) + self.timestamp_offset)
+        samples = self.generate(name, np.array([time.monotonic() - self.started]))
+        return samples.tobytes()
+
+    def calib_status(self, imu, t):
+        """Calibration status 0-3 of an IMU at device time t"""
+        start = self.calibration_start[imu]
+        if start is None:
+            return self.calibrated[imu]
+        progress = (t + self.started - start) / CALIBRATION_TIME
+        self.calibrated[imu] = min(3, int(progress * 3))
+        return self.calibrated[imu]
+
+    def generate(self, name, t):
+        """Samples of a characteristic at device times t (seconds since start)
+
+        Returns:
+            Structured array with the characteristic data class DTYPE
+        """
+        data_class = C[name][1]
+        samples = np.zeros(len(t), dtype=data_class.DTYPE)
+        if name in ("IMU1_CHAR_UUID", "IMU2_CHAR_UUID"):
+            phase = 0.0 if name.startswith("IMU1") else 1.0
+            for axis, field in enumerate(('ax', 'ay', 'az')):
+                samples[field] = _wave(t, 4.0 + axis, 2000, phase + axis)
+            samples['az'] += 16384  # 1 g at the 2 g range
+            for axis, field in enumerate(('gx', 'gy', 'gz')):
+                samples[field] = _wave(t, 2.0 + axis, 3000, phase + axis)
+            for axis, field in enumerate(('mx', 'my', 'mz')):
+                samples[field] = 400 + _wave(t, 20.0, 100, phase + axis)
+        elif name in ("IMU1_EULER_UUID", "IMU2_EULER_UUID"):
+            imu = 1 if name.startswith("IMU1") else 2
+            samples['yaw'] = (t * 30.0) % 360.0 - 180.0
+            samples['pitch'] = _wave(t, 6.0, 30.0, imu)
+            samples['roll'] = _wave(t, 9.0, 20.0, imu)
+            samples['calib_status'] = self.calib_status(imu, float(t[-1])) if len(t) else 0
+        elif name == "FLEX_SENSOR_UUID":
+            for finger in range(5):
+                samples[f'flex{finger + 1}'] = 45.0 + _wave(t, 3.0 + finger * 0.5, 45.0, finger)
+        elif name == "FORCE_SENSOR_UUID":
+            samples['value'] = np.abs(_wave(t, 5.0, 10.0))
+        elif name == "JOYSTICK_UUID":
+            samples['x'] = _wave(t, 4.0, 2000)
+            samples['y'] = _wave(t, 4.0, 2000, math.pi / 2)
+            samples['button_state'] = (t % 6.0) < 1.0
+        elif name == "BUTTONS_UUID":
+            for button in range(4):
+                samples[f'button{button + 1}'] = (t + button) % 8.0 < 1.0
+        elif name == "OVERALL_STATUS_UUID":
+            running = OverallStatus.IDLE if self.config.cmd == DeviceConfig.CMD_IDLE else OverallStatus.RUNNING
+            samples['fuelgause'] = OverallStatus.RUNNING
+            samples['imu1'] = running
+            samples['imu2'] = running
+        elif name == "BATTERY_LEVEL_UUID":
+            samples['level'] = np.maximum(0, 100 - (t // 60)).astype(np.uint8)
+        return samples
+
+
+class SimulatedClient(ReplayClient):
+    """BleakClient stand-in talking to a SimulatedDevice
+
+    Each subscribed notifying characteristic gets a task that produces the
+    samples due since its last round and hands them to the notification
+    handler, one payload per sample or packed into frames.
+    """
+
+    def __init__(self, address_or_device, **kwargs):
+        """Initialize client
+
+        Args:
+            address_or_device: Device address or an object with an address attribute
+            services: Optional service UUIDs; like bleak, only these are discovered
+        """
+        super().__init__()
+        self.config = AppConfig()  # Get singleton instance
+        self.address = getattr(address_or_device, 'address', address_or_device)
+        self.device = SimulatedDevice.get(self.address)
+        services = kwargs.get('services')
+        self._service_filter = {uuid.lower() for uuid in services} if services else None
+        self._disconnected_callback = kwargs.get('disconnected_callback')
+        self._drop_task = None
+        self.is_connected = False
+        self._names = {uuid.lower(): name for name, (uuid, _) in C.items()}
+        self._streams = {}
+        # Counters, in notifications
+        self.sent = 0
+        self.dropped = 0
+        # Token bucket of AppConfig.SIM_LINK_CAPACITY, shared by every stream of this client
+        self._link_budget = 0.0
+        self._link_time = time.monotonic()
+        self._att = asyncio.Lock()  # One outstanding GATT request per link
+
+    async def connect(self, **kwargs):
+        await asyncio.sleep(self.config.SIM_GATT_LATENCY)
+        if time.monotonic() < self.device.unavailable_until:
+            raise ConnectionError(f"Device with address {self.address} was not found")
+        self.is_connected = True
+        self.services = [
+            service for service in self.device.services
+            if self._service_filter is None or service.uuid.lower() in self._service_filter
+        ]
+        if self.config.SIM_LINK_DROP_INTERVAL:
+            self._drop_task = asyncio.get_running_loop().create_task(self._drop_later())
+        return True
+
+    async def disconnect(self):
+        was_connected = self.is_connected
+        self._close()
+        await super().disconnect()
+        if was_connected and self._disconnected_callback:
+            self._disconnected_callback(self)
+        return True
+
+    def drop_link(self, down_time=None):
+        """Lose the connection like a glove moving out of range
+
+        Args:
+            down_time: Seconds during which reconnects fail, defaults to AppConfig.SIM_LINK_DOWN_TIME
+        """
+        if not self.is_connected:
+            return
+        self._close()
+        self.is_connected = False
+        self.handlers.clear()
+        self.device.unavailable_until = time.monotonic() + (
+            self.config.SIM_LINK_DOWN_TIME if down_time is None else down_time)
+        if self._disconnected_callback:
+            self._disconnected_callback(self)
+
+    def _close(self):
+        """Stop the notification streams and the link drop timer"""
+        for task in self._streams.values():
+            task.cancel()
+        self._streams.clear()
+        if self._drop_task and self._drop_task is not asyncio.current_task():
+            self._drop_task.cancel()
+        self._drop_task = None
+
+    async def _drop_later(self):
+        await asyncio.sleep(self.config.SIM_LINK_DROP_INTERVAL)
+        print("Simulated link loss")
+        self.drop_link()
+
+    async def _gatt_operation(self):
+        """Wait for the link like one ATT request, queued behind any other in flight"""
+        async with self._att:
+            await asyncio.sleep(self.config.SIM_GATT_LATENCY)
+
+    async def start_notify(self, uuid, callback):
+        name = self._name(uuid)
+        if name == "CONFIG_UUID":
+            # Notified on every config change instead of streaming
+            await self._gatt_operation()
+            await super().start_notify(uuid, callback)
+            return
+        if C[name][1] in (None, str) or name == "TIMESTAMP_CHAR_UUID":
+            raise ValueError(f"{name} does not notify")
+        await self._gatt_operation()
+        await super().start_notify(uuid, callback)
+        task = self._streams.pop(uuid.lower(), None)
+        if task:
+            task.cancel()
+        self._streams[uuid.lower()] = asyncio.get_running_loop().create_task(self._stream(uuid, name))
+
+    async def stop_notify(self, uuid):
+        task = self._streams.pop(uuid.lower(), None)
+        if task:
+            task.cancel()
+        await self._gatt_operation()
+        await super().stop_notify(uuid)
+
+    async def read_gatt_char(self, uuid):
+        self._check_connected()
+        await self._gatt_operation()
+        return bytearray(self.device.read(self._name(uuid)))
+
+    async def write_gatt_char(self, uuid, data, response=None):
+        self._check_connected()
+        await self._gatt_operation()
+        name = self._name(uuid)
+        self.device.write(name, bytes(data))
+        if name == "CONFIG_UUID":
+            await self.deliver(uuid, self.device.config.raw_data)
+
+    def _check_connected(self):
+        if not self.is_connected:
+            raise ConnectionError("Not connected")
+
+    def _name(self, uuid):
+        name = self._names.get(str(uuid).lower())
+        if name is None:
+            raise ValueError(f"Characteristic {uuid} not found")
+        return name
+
+    async def _stream(self, uuid, name):
+        """Produce notifications for one characteristic until cancelled"""
+        device = self.device
+        size = C[name][1].STRUCT.size
+        frame_samples = min(self.config.SIM_FRAME_SAMPLES, MAX_FRAME_SAMPLES)
+        sequence = 0
+        produced = 0  # Samples produced since the current rate took effect
+        rate = device.rate(name)
+        rate_start = time.monotonic()
+        while self.is_connected:
+            await asyncio.sleep(self.config.SIM_TICK + abs(random.gauss(0.0, self.config.SIM_JITTER)))
+            now = time.monotonic()
+            new_rate = device.rate(name)
+            if new_rate != rate:
+                rate, rate_start, produced = new_rate, now, 0
+            count = int((now - rate_start) * rate) - produced
+            if count <= 0:
+                continue
+            # Sample times evenly spaced up to now, in device time
+            t = now - device.started - (np.arange(count, 0, -1) - 1) / rate
+            data = device.generate(name, t).tobytes()
+            produced += count
+
+            if frame_samples > 1:
+                payloads = []
+                for start in range(0, count, frame_samples):
+                    chunk = min(frame_samples, count - start)
+                    payloads.append(FRAME_HEADER.pack(FRAME_MAGIC, chunk, (sequence + start) & 0xFFFF)
+                                    + data[start * size:(start + chunk) * size])
+            else:
+                payloads = [data[i:i + size] for i in range(0, len(data), size)]
+            sequence = (sequence + count) & 0xFFFF
+
+            for payload in payloads:
+                if (self.config.SIM_LOSS and random.random() < self.config.SIM_LOSS) or not self._link_has_room():
+                    self.dropped += 1
+                    continue
+                self.sent += 1
+                await self.deliver(uuid, payload)
+
+    def _link_has_room(self):
+        """Take one notification from the link budget, False if the link is saturated"""
+        capacity = self.config.SIM_LINK_CAPACITY
+        if not capacity:
+            return True
+        now = time.monotonic()
+        burst = max(1.0, capacity * LINK_QUEUE_TIME)
+        self._link_budget = min(burst, self._link_budget + (now - self._link_time) * capacity)
+        self._link_time = now
+        if self._link_budget < 1.0:
+            return False
+        self._link_budget -= 1.0
+        return True
+
+
+class SimulatedScanner:
+    """BleakScanner stand-in reporting the simulated devices"""
+
+    def __init__(self, detection_callback=None, **kwargs):
+        self.detection_callback = detection_callback
+
+    async def __aenter__(self):
+        if self.detection_callback:
+            for device in SimulatedDevice.advertised():
+                result = self.detection_callback(
+                    SimulatedBLEDevice(device.address, device.name, -40),
+                    SimulatedAdvertisement(-40))
+                if asyncio.iscoroutine(result):
+                    await result
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @classmethod
+    async def discover(cls, timeout=5.0, **kwargs):
+        return [SimulatedBLEDevice(device.address, device.name, -40) for device in SimulatedDevice.advertised()]
@@ -1,7 +1,10 @@
+import struct
 from datetime import datetime
 
 class TimestampData:
     """Model class representing timestamp data"""
+
+    STRUCT = struct.Struct('<Q')  # 64-bit millisecond timestamp
     
     def __init__(self, unix_timestamp=0, raw_data=None):
         self.unix_timestamp = unix_timestamp
@@ -24,16 +27,21 @@ class TimestampData:
             return None
             
         try:
-            timestamp = int.from_bytes(data, byteorder='little')
-            # Convert milliseconds to seconds and ensure valid range
-            if timestamp > 32503680000000:  # Max valid ms timestamp (year 3000)
-                return None
-            
-            unix_timestamp = timestamp // 1000  # Convert ms to seconds
-            return cls(unix_timestamp=unix_timestamp, raw_data=data)
+            return cls.from_values(cls.STRUCT.unpack(data))
         except Exception as e:
             print(f"Error parsing timestamp data: {e}")
             return None
+
+    @classmethod
+    def from_values(cls, values):
+        """Create TimestampData from the unpacked millisecond timestamp"""
+        timestamp = values[0]
+        # Convert milliseconds to seconds and ensure valid range
+        if timestamp > 32503680000000:  # Max valid ms timestamp (year 3000)
+            return None
+        
+        unix_timestamp = timestamp // 1000  # Convert ms to seconds
+        return cls(unix_timestamp=unix_timestamp, raw_data=cls.STRUCT.pack(timestamp))
             
     @classmethod
     def current(cls):
@@ -0,0 +1,46 @@
+"""BLE transport selection
+
+Code that talks to devices creates its clients and scanners through
+client_class() and scanner_class(), so the same code runs against real
+hardware through bleak or against the in-process simulator. The backend is
+picked by AppConfig.BLE_BACKEND.
+"""
+from bleak import BleakClient, BleakScanner
+from src.config.app_config import AppConfig
+
+
+def _bleak_backend():
+    return BleakClient, BleakScanner
+
+
+def _simulated_backend():
+    # Imported on demand, the simulator pulls in the ESP32 service model
+    from src.model.simulator import SimulatedClient, SimulatedScanner
+    return SimulatedClient, SimulatedScanner
+
+
+# Backend name -> callable returning (client class, scanner class)
+BACKENDS = {
+    "bleak": _bleak_backend,
+    "simulated": _simulated_backend,
+}
+
+
+def get_backend():
+    """(client class, scanner class) of the configured backend"""
+    name = AppConfig().BLE_BACKEND
+    backend = BACKENDS.get(name)
+    if backend is None:
+        print(f"❌ Unknown BLE backend '{name}', using bleak")
+        backend = _bleak_backend
+    return backend()
+
+
+def client_class():
+    """BleakClient-compatible class of the configured backend"""
+    return get_backend()[0]
+
+
+def scanner_class():
+    """BleakScanner-compatible class of the configured backend"""
+    return get_backend()[1]
@@ -1,6 +1,10 @@
 import asyncio
-from bleak import BleakScanner
+import time
+from src.model.transport import scanner_class
 from src.model.ble_service import BLEDeviceInfo
+from src.model.connection_profiler import ConnectionProfiler
+from src.model.link_supervisor import LinkSupervisor
+from src.model.config_presets import ConfigPresetManager
 
 class ConnectionPresenter:
     """Presenter for handling device connections"""
@@ -11,6 +15,13 @@ class ConnectionPresenter:
         self.loop = loop
         self.connection_dialog = None
         self.status_dialog = None
+        self.supervisor = LinkSupervisor(ble_service, self._on_link_state)
+
+        # Config presets, the view shows the one matching the device config
+        self.presets = ConfigPresetManager(ble_service)
+        self.main_view.presets = self.presets  # Session headers record the active preset
+        self.main_view.set_preset_handler(self.presets.names(), self.apply_preset)
+        ble_service.add_config_listener(self._on_device_config)
         
     def _create_device_info(self, device_dict):
         """Create BLEDeviceInfo from dictionary"""
@@ -26,19 +37,7 @@ class ConnectionPresenter:
         """Connect to a device. If device_dict is None, show connection dialog"""
         if device_dict is None:
             # Show connection dialog and handle device selection
-            from src.view.connection_dialog import ConnectionDialog
-            self.connection_dialog = ConnectionDialog(
-                self.main_view,
-                self.loop,
-                BleakScanner
-            )
-            
-            # Set up dialog callbacks
-            self.connection_dialog.on_device_selected(self._on_device_selected)
-            self.connection_dialog.on_connect_clicked(self._on_connect_clicked)
-            
-            # Start initial scan
-            self.loop.create_task(self._scan_for_devices())
+            self._call_in_ui(self._show_connection_dialog)
         else:
             # Direct connection to device (e.g. for reconnect)
             device_info = self._create_device_info(device_dict)
@@ -47,35 +46,64 @@ class ConnectionPresenter:
             result = await self.service.connect(device_info)
             if result:
                 await self.service.start_services()
-                self.main_view.update_connection_status(True, device_info)
+                self._call_in_ui(self.main_view.update_connection_status, True, device_info)
+                self._show_preset()
+                self.supervisor.start()
             else:
-                self.main_view.update_connection_status(False, None, "Connection failed")
+                self._call_in_ui(self.main_view.update_connection_status, False, None, "Connection failed")
+
+    def _show_connection_dialog(self):
+        """Create the connection dialog and start the initial scan, on the Tk thread"""
+        from src.view.connection_dialog import ConnectionDialog
+        self.connection_dialog = ConnectionDialog(
+            self.main_view,
+            self.loop,
+            scanner_class()
+        )
+        
+        # Set up dialog callbacks
+        self.connection_dialog.on_device_selected(self._on_device_selected)
+        self.connection_dialog.on_connect_clicked(self._on_connect_clicked)
+        
+        # Start initial scan
+        self.loop.create_task(self._scan_for_devices())
         
     async def _scan_for_devices(self):
         """Handle device scanning"""
-        if not self.connection_dialog:
+        dialog = self.connection_dialog
+        if not dialog:
             return
             
-        self.connection_dialog.show_scanning()
+        self._call_in_ui(dialog.show_scanning)
         device_count = 0
+        first_device = None  # Seconds until the first named device showed up
+        scan_started = time.perf_counter()
         
         async def detection_callback(device, advertisement_data):
-            nonlocal device_count
+            nonlocal device_count, first_device
             if device.name:  # Only show devices with names
-                self.connection_dialog.add_device(
+                if first_device is None:
+                    first_device = time.perf_counter() - scan_started
+                self._call_in_ui(
+                    dialog.add_device,
                     device.name,
                     device.address,
                     advertisement_data.rssi
                 )
                 device_count += 1
         
+        profiler = ConnectionProfiler()  # Get singleton instance
+        profiler.begin()
         try:
-            async with BleakScanner(detection_callback=detection_callback) as scanner:
-                await asyncio.sleep(5)  # Scan for 5 seconds
+            with profiler.phase("scan") as phase:
+                async with scanner_class()(detection_callback=detection_callback) as scanner:
+                    await asyncio.sleep(5)  # Scan for 5 seconds
+                phase.details['devices'] = device_count
+                phase.details['first_device'] = first_device
         except Exception as e:
             print(f"Scan error: {e}")
             
-        self.connection_dialog.show_scan_complete(device_count)
+        self._call_in_ui(dialog.show_scan_complete, device_count)
         
     def _on_device_selected(self, device_info):
         """Handle device selection"""
@@ -84,9 +112,20 @@ class ConnectionPresenter:
         
     async def _on_connect_clicked(self, device_dict):
         """Handle connect button click"""
+        self._call_in_ui(self._show_connecting)
+        
+        # Try to connect
+        device_info = self._create_device_info(device_dict)
+        result = await self.service.connect(device_info)
+        
+        # Store device info for service start
+        self.current_device_info = device_info if result else None
+        self._call_in_ui(self._show_connect_result, result, device_info)
+
+    def _show_connecting(self):
+        """Create and show the status dialog, on the Tk thread"""
         from src.view.connection_status_dialog import ConnectionStatusDialog
         
-        # Create and show status dialog
         self.status_dialog = ConnectionStatusDialog(self.connection_dialog)
         self.status_dialog.show_connecting()
         
@@ -102,31 +141,52 @@ class ConnectionPresenter:
             if self.connection_dialog.connection_success:
                 async def start_services():
                     await self.service.start_services()
-                    self.main_view.update_connection_status(True, self.current_device_info)
+                    self._call_in_ui(self.main_view.update_connection_status, True, self.current_device_info)
+                    self._show_preset()
+                    self.supervisor.start()
                 self.loop.create_task(start_services())
             
         self.status_dialog.on_ok_clicked(close_dialogs_and_start_services)
-        
-        # Try to connect
-        device_info = self._create_device_info(device_dict)
-        result = await self.service.connect(device_info)
-        
+
+    def _show_connect_result(self, result, device_info):
+        """Show the connection result in the status dialog, on the Tk thread"""
         if result:
-            # Store device info for service start
-            self.current_device_info = device_info
             self.status_dialog.show_connected(device_info)
             self.connection_dialog.connection_success = True
         else:
-            self.current_device_info = None
             self.status_dialog.show_failed()
             self.connection_dialog.connection_success = False
             
+    def _on_link_state(self, state, message):
+        """Show link supervisor state changes on the main view"""
+        self._call_in_ui(self.main_view.update_link_state, state, message)
+
+    async def apply_preset(self, name):
+        """Apply a config preset selected on the main view"""
+        await self.presets.apply(name)
+        self._show_preset()
+
+    def _on_device_config(self, config):
+        """Config listener: a dialog or preset changed the device config"""
+        self._show_preset()
+
+    def _show_preset(self):
+        self._call_in_ui(self.main_view.update_preset, self.presets.active())
+
+    def _call_in_ui(self, callback, *args):
+        """Run a view call on the Tk thread, the presenter coroutines run on the loop thread"""
+        if hasattr(self.loop, 'call_in_ui'):
+            self.loop.call_in_ui(callback, *args)
+        else:
+            callback(*args)
+
     async def disconnect(self):
         """Disconnect from current device"""
+        await self.supervisor.stop()
         if hasattr(self.service, 'stop_battery_notify'):
             await self.service.stop_battery_notify()
         result = await self.service.disconnect()
-        self.main_view.update_connection_status(False, None, "Disconnected")
+        self._call_in_ui(self.main_view.update_connection_status, False, None, "Disconnected")
         return result
         
     def is_connected(self):
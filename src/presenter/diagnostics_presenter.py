@@ -0,0 +1,51 @@
+import asyncio
+from src.config.app_config import AppConfig
+from src.model.metrics import MetricsRegistry
+from src.presenter.render_scheduler import RenderScheduler
+
+class DiagnosticsPresenter:
+    """Presenter showing pipeline metrics in the diagnostics view
+
+    Metrics are counted by the notification handlers whether or not this
+    presenter runs; it only takes a snapshot every DIAGNOSTICS_INTERVAL
+    seconds and hands it to the render scheduler.
+    """
+
+    def __init__(self, view, loop):
+        """Initialize the presenter
+
+        Args:
+            view: Reference to the diagnostics view
+            loop: Event loop the snapshot task runs on
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.view = view
+        self.loop = loop
+        self.metrics = MetricsRegistry()  # Get singleton instance
+        self._task = None
+
+        # View updates are coalesced and rendered at a fixed rate
+        self.render_scheduler = RenderScheduler()  # Get singleton instance
+        self.render_scheduler.register("diagnostics", self.view.update_metrics)
+
+        if self.config.METRICS_ENABLED:
+            self.start()
+
+    def start(self):
+        """Start taking snapshots"""
+        if self._task is None:
+            self._task = self.loop.create_task(self._snapshot_loop())
+
+    def stop(self):
+        """Stop taking snapshots"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(self.config.DIAGNOSTICS_INTERVAL)
+            try:
+                self.render_scheduler.submit("diagnostics", self.metrics.snapshot())
+            except Exception as e:
+                print(f"Error taking metrics snapshot: {e}")
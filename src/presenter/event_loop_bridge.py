@@ -0,0 +1,122 @@
+import asyncio
+import queue
+import threading
+from src.config.app_config import AppConfig
+
+class EventLoopBridge:
+    """Run the asyncio loop alongside the Tk main loop
+
+    Two modes are supported (AppConfig.ASYNCIO_MODE):
+        pump: the loop runs inside the Tk thread, advanced from an after() callback
+        thread: the loop runs on its own thread and hands work to Tk through a
+            thread-safe queue drained on the Tk side
+
+    The bridge stands in for the loop wherever views and presenters expect one:
+    create_task() is safe to call from either thread and every other attribute
+    is forwarded to the wrapped loop.
+    """
+
+    PUMP = "pump"
+    THREAD = "thread"
+
+    def __init__(self, loop, window, mode=None):
+        """Initialize bridge
+
+        Args:
+            loop: asyncio event loop to run
+            window: Tk widget used to schedule after() callbacks
+            mode: PUMP or THREAD, defaults to AppConfig.ASYNCIO_MODE
+        """
+        self.config = AppConfig()  # Get singleton instance
+        self.loop = loop
+        self.window = window
+        self.mode = mode or self.config.ASYNCIO_MODE
+        if self.mode not in (self.PUMP, self.THREAD):
+            raise ValueError(f"Unknown asyncio mode: {self.mode}")
+        self._ui_queue = queue.SimpleQueue()
+        self._thread = None
+        self._after_id = None
+        self._running = False
+
+    def __getattr__(self, name):
+        return getattr(self.loop, name)
+
+    def start(self):
+        """Start running the loop"""
+        self._running = True
+        if self.mode == self.THREAD:
+            self._thread = threading.Thread(target=self._run_loop, name="asyncio", daemon=True)
+            self._thread.start()
+            self._after_id = self.window.after(self.config.UI_QUEUE_INTERVAL_MS, self._drain_ui_queue)
+        else:
+            self._after_id = self.window.after(self.config.ASYNCIO_PUMP_INTERVAL_MS, self._pump)
+
+    def stop(self, timeout=2.0):
+        """Stop running the loop and the Tk side callbacks"""
+        self._running = False
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+            self._after_id = None
+        if self._thread:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            if not self.in_loop_thread():
+                self._thread.join(timeout)
+            self._thread = None
+
+    def run_until_complete(self, coro, timeout=None):
+        """Run a coroutine to completion from the Tk thread"""
+        if self._thread:
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+        return self.loop.run_until_complete(coro)
+
+    def in_loop_thread(self):
+        """Check if the caller runs on the thread driving the loop"""
+        if self._thread:
+            return threading.current_thread() is self._thread
+        return True
+
+    def create_task(self, coro):
+        """Schedule a coroutine on the loop from any thread
+
+        Returns:
+            asyncio.Task on the loop thread, concurrent.futures.Future otherwise
+        """
+        if self.in_loop_thread():
+            return self.loop.create_task(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_in_ui(self, callback, *args):
+        """Run callback on the Tk thread
+
+        In pump mode the loop already runs on the Tk thread, so the callback is
+        called immediately.
+        """
+        if self._thread:
+            self._ui_queue.put((callback, args))
+        else:
+            callback(*args)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _pump(self):
+        """Advance the loop by one iteration batch from the Tk thread"""
+        self.loop.stop()
+        self.loop.run_forever()
+        if self._running:
+            self._after_id = self.window.after(self.config.ASYNCIO_PUMP_INTERVAL_MS, self._pump)
+
+    def _drain_ui_queue(self):
+        """Run callbacks handed over by the loop thread"""
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error in UI callback: {e}")
+        if self._running:
+            self._after_id = self.window.after(self.config.UI_QUEUE_INTERVAL_MS, self._drain_ui_queue)
@@ -1,4 +1,5 @@
 from src.model.gamepad import JoystickData, ButtonsData
+from src.presenter.render_scheduler import RenderScheduler
 
 class GamepadPresenter:
     """Presenter for handling gamepad data"""
@@ -17,6 +18,11 @@ class GamepadPresenter:
         self.view.loop = loop  # Set event loop for async operations
         self._current_joystick_data = None
         self._current_buttons_data = None
+
+        # View updates are coalesced and rendered at a fixed rate
+        self.render_scheduler = RenderScheduler()  # Get singleton instance
+        self.render_scheduler.register("joystick", self._render_joystick)
+        self.render_scheduler.register("buttons", self._render_buttons)
         
         # Initially disable buttons until connection is established
         self.view.set_button_states(False)
@@ -48,10 +54,7 @@ class GamepadPresenter:
         """
         if joystick_data and isinstance(joystick_data, JoystickData):
             self._current_joystick_data = joystick_data
-            # Update view with new values
-            self.view.update_xy_values(joystick_data.x, joystick_data.y)
-            # Update joystick button state
-            self.view.update_joystick_button_state(bool(joystick_data.button_state))
+            self.render_scheduler.submit("joystick", joystick_data)
 
     async def _handle_buttons_update(self, sender, buttons_data):
         """Handle buttons data updates
@@ -62,14 +65,26 @@ class GamepadPresenter:
         """
         if buttons_data and isinstance(buttons_data, ButtonsData):
             self._current_buttons_data = buttons_data
-            # Update view with new button states
-            for i, state in enumerate(buttons_data.states):
-                self.view.update_button_state(i, bool(state))
+            self.render_scheduler.submit("buttons", buttons_data)
+
+    def _render_joystick(self, joystick_data):
+        """Push the latest joystick data to the view"""
+        # Update view with new values
+        self.view.update_xy_values(joystick_data.x, joystick_data.y)
+        # Update joystick button state
+        self.view.update_joystick_button_state(bool(joystick_data.button_state))
+
+    def _render_buttons(self, buttons_data):
+        """Push the latest buttons data to the view"""
+        # Update view with new button states
+        for i, state in enumerate(buttons_data.states):
+            self.view.update_button_state(i, bool(state))
 
     def clear_values(self):
         """Clear current gamepad values"""
         self._current_joystick_data = None
         self._current_buttons_data = None
+        self.render_scheduler.discard("joystick", "buttons")
         
         # Reset joystick position
         self.view.update_xy_values(0, 0)
@@ -1,24 +1,41 @@
 import asyncio
+from src.config.app_config import AppConfig
 from src.model.imu import IMUData, IMUEulerData
+from src.model.imu_logger import IMURowPairer
+from src.presenter.render_scheduler import RenderScheduler
 from src.view.imu_config_dialog import IMUConfigDialog
 
 class IMUPresenter:
     """Presenter for IMU data operations"""
     
     def __init__(self, view, ble_service, characteristic_uuid, loop):
+        self.config = AppConfig()  # Get singleton instance
         self.view = view
         self.service = ble_service
         self.view.imu_service = ble_service  # Set service for configuration
         self.view.loop = loop  # Set event loop for async operations
         ble_service.set_loop(loop)  # Set event loop for service notifications
         self.char_uuid = characteristic_uuid
-        self.euler_uuid = characteristic_uuid.replace("CHAR", "EULER")
+        self.is_imu1 = characteristic_uuid == ble_service.IMU1_CHAR_UUID
+        self.euler_uuid = ble_service.IMU1_EULER_UUID if self.is_imu1 else ble_service.IMU2_EULER_UUID
         self.loop = loop
         self.notifying = False
         self.euler_notifying = False
         self.log_dialog = None
         self.latest_imu_data = None
         self.latest_euler_data = None
+
+        # Ring buffer readers and the task draining them
+        self.imu_reader = None
+        self.euler_reader = None
+        self._pairer = IMURowPairer()
+        self._consume_task = None
+
+        # View updates are coalesced and rendered at a fixed rate
+        self.stream = "imu1" if self.is_imu1 else "imu2"
+        self.render_scheduler = RenderScheduler()  # Get singleton instance
+        self.render_scheduler.register(self.stream, self._update_view)
+        self.render_scheduler.register(self.stream + "_euler", self._update_euler)
         
         # Initially disable buttons until connection is established
         self.view.set_button_states(False)
@@ -46,10 +63,9 @@ class IMUPresenter:
         if self.notifying:
             await self.stop_notifications()
             
-        result = await self.service.start_notify(
-            self.char_uuid, 
-            self._notification_handler
-        )
+        # Samples are decoded into the service ring buffer and drained by _consume_samples
+        self.imu_reader = self.service.buffers[self.char_uuid].reader()
+        result = await (self.service.start_imu1_notify if self.is_imu1 else self.service.start_imu2_notify)()
         
         if result:
             self.notifying = True
@@ -58,6 +74,9 @@ class IMUPresenter:
             # Optionally start Euler notifications too
             if hasattr(self.view, 'update_euler'):
                 await self.start_euler_notifications()
+
+            if not self._consume_task:
+                self._consume_task = self.loop.create_task(self._consume_samples())
                 
         return result
 
@@ -70,21 +89,20 @@ class IMUPresenter:
         if self.euler_notifying:
             await self.stop_euler_notifications()
 
-        # Get UUIDs from service
-        imu1_char = self.service.IMU1_CHAR_UUID
-        imu2_char = self.service.IMU2_CHAR_UUID
-            
-        if self.char_uuid == imu1_char:
-            result = await self.service.start_imu1_euler_notify(self._euler_notification_handler)
-        else:
-            result = await self.service.start_imu2_euler_notify(self._euler_notification_handler)
-            
+        self.euler_reader = self.service.buffers[self.euler_uuid].reader()
+        self._pairer.reset()
+
+        result = await (self.service.start_imu1_euler_notify if self.is_imu1 else self.service.start_imu2_euler_notify)()
         if result:
             self.euler_notifying = True
         return result
 
     async def stop_notifications(self):
         """Stop notifications"""
+        if self._consume_task:
+            self._consume_task.cancel()
+            self._consume_task = None
+
         if not self.service.is_connected():
             self.view.set_button_states(False)
             return False
@@ -93,7 +111,7 @@ class IMUPresenter:
             
         # Stop main notifications if they're active
         if self.notifying:
-            result = await self.service.stop_notify(self.char_uuid)
+            result = await (self.service.stop_imu1_notify if self.is_imu1 else self.service.stop_imu2_notify)()
             if result:
                 self.notifying = False
                 self.view.set_button_states(False)
@@ -113,19 +131,10 @@ class IMUPresenter:
             return False
 
         try:
-            # Get UUIDs from service
-            imu1_char = self.service.IMU1_CHAR_UUID
-            imu2_char = self.service.IMU2_CHAR_UUID
-            
-            if self.char_uuid == imu1_char:
-                result = await self.service.stop_imu1_euler_notify()
-                self.euler_notifying = False if result else self.euler_notifying
-                return result
-            else:
-                result = await self.service.stop_imu2_euler_notify()
-                self.euler_notifying = False if result else self.euler_notifying
-                return result
-                
+            result = await (self.service.stop_imu1_euler_notify if self.is_imu1 else self.service.stop_imu2_euler_notify)()
+            if result:
+                self.euler_notifying = False
+            return result
         except Exception as e:
             print(f"Error stopping Euler notifications: {e}")
             return False
@@ -137,72 +146,57 @@ class IMUPresenter:
             self.latest_imu_data = None
             self.latest_euler_data = None
 
-    async def _notification_handler(self, sender, data):
-        """Handle incoming notifications"""
-        imu_data = IMUData.from_bytes(data)
-        if imu_data:
-            self.latest_imu_data = imu_data
-            # Use event loop to update UI from notification callback
-            self.loop.create_task(self._update_view_async(imu_data))
-            # Try to log if we have both IMU and Euler data
-            await self._try_log_data()
-
-    async def _euler_notification_handler(self, sender, euler_data):
-        """Handle incoming Euler angle notifications"""
-        if euler_data and isinstance(euler_data, IMUEulerData):
-            self.latest_euler_data = euler_data
-            # Use event loop to update UI from notification callback
-            self.loop.create_task(self._update_euler_async(euler_data))
-            # Try to log if we have both IMU and Euler data
-            await self._try_log_data()
+    async def _consume_samples(self):
+        """Drain the IMU and Euler ring buffers at a fixed pace"""
+        while True:
+            await asyncio.sleep(self.config.SAMPLE_CONSUME_INTERVAL)
+            try:
+                imu_rows = self.imu_reader.read()
+                euler_rows = self.euler_reader.read() if self.euler_reader else imu_rows[:0]
+                self._log_rows(imu_rows, euler_rows)
+
+                if len(euler_rows):
+                    self.latest_euler_data = IMUEulerData._make(euler_rows[-1].item()[1:])
+                    self.render_scheduler.submit(self.stream + "_euler", self.latest_euler_data, len(euler_rows))
+                if len(imu_rows):
+                    self.latest_imu_data = IMUData._make(imu_rows[-1].item()[1:])
+                    self.render_scheduler.submit(self.stream, self.latest_imu_data, len(imu_rows))
+            except Exception as e:
+                print(f"Error consuming IMU samples: {e}")
             
-    async def _try_log_data(self):
-        """Try to log data if both IMU and Euler data are available"""
-        if self.log_dialog and self.latest_imu_data and self.latest_euler_data:
-            # Get UUIDs from service
-            imu1_char = self.service.IMU1_CHAR_UUID
-            imu1_euler = self.service.IMU1_EULER_UUID
-            imu2_char = self.service.IMU2_CHAR_UUID
-            imu2_euler = self.service.IMU2_EULER_UUID
-
-            # Determine IMU number from characteristic UUID
-            if self.char_uuid in [imu1_char, imu1_euler]:
-                imu_number = 1
-            else:
-                imu_number = 2
-            self.log_dialog.log_imu_data(imu_number, self.latest_imu_data, self.latest_euler_data)
+    def _log_rows(self, imu_rows, euler_rows):
+        """Log every IMU sample paired with the latest Euler sample received before it"""
+        imu_rows, euler_rows, timestamps = self._pairer.pair(imu_rows, euler_rows)
+        if self.log_dialog and len(imu_rows):
+            self.log_dialog.log_imu_batch(1 if self.is_imu1 else 2, imu_rows, euler_rows, timestamps)
 
-    async def _update_euler_async(self, euler_data):
-        """Update view with Euler angles and calibration status asynchronously"""
+    def _update_euler(self, euler_data):
+        """Update view with Euler angles and calibration status"""
         if hasattr(self.view, 'update_euler'):
             self.view.update_euler(
-                euler_data.euler['pitch'],
-                euler_data.euler['roll'],
-                euler_data.euler['yaw']
+                euler_data.pitch,
+                euler_data.roll,
+                euler_data.yaw
             )
             if hasattr(self.view, 'update_calib_status'):
                 self.view.update_calib_status(euler_data.calib_status)
             
-    async def _update_view_async(self, imu_data):
-        """Update view asynchronously (safe for callbacks)"""
-        self._update_view(imu_data)
-        
     def _update_view(self, imu_data):
         """Update view with IMU data"""
         self.view.update_accel(
-            imu_data.accel['x'], 
-            imu_data.accel['y'], 
-            imu_data.accel['z']
+            imu_data.accel_x,
+            imu_data.accel_y,
+            imu_data.accel_z
         )
         self.view.update_gyro(
-            imu_data.gyro['x'], 
-            imu_data.gyro['y'], 
-            imu_data.gyro['z']
+            imu_data.gyro_x,
+            imu_data.gyro_y,
+            imu_data.gyro_z
         )
         self.view.update_magn(
-            imu_data.mag['x'], 
-            imu_data.mag['y'], 
-            imu_data.mag['z']
+            imu_data.mag_x,
+            imu_data.mag_y,
+            imu_data.mag_z
         )
         
     def is_notifying(self):
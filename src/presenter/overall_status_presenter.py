@@ -1,4 +1,5 @@
 from src.model.overall_status import OverallStatus
+from src.presenter.render_scheduler import RenderScheduler
 import asyncio
 
 class OverallStatusPresenter:
@@ -15,6 +16,10 @@ class OverallStatusPresenter:
         self.esp32_service = esp32_service
         self._current_status = None
 
+        # View updates are coalesced and rendered at a fixed rate
+        self.render_scheduler = RenderScheduler()  # Get singleton instance
+        self.render_scheduler.register("overall_status", self._render_status)
+
     async def start_notifications(self):
         """Start overall status notifications with retry logic"""
         if not self.esp32_service:
@@ -44,14 +49,17 @@ class OverallStatusPresenter:
         """Handle status updates from the BLE service"""
         if status_data and isinstance(status_data, OverallStatus):
             self._current_status = status_data
-            self.view.update_status(
-                status_data.fuelgause == OverallStatus.RUNNING,
-                status_data.imu1 == OverallStatus.RUNNING,
-                status_data.imu2 == OverallStatus.RUNNING
-            )
+            self.render_scheduler.submit("overall_status", status_data)
+
+    def _render_status(self, status_data):
+        """Push the latest status to the view"""
+        self.view.update_status(status_data.fuelgause == OverallStatus.RUNNING,
+                                status_data.imu1 == OverallStatus.RUNNING,
+                                status_data.imu2 == OverallStatus.RUNNING)
 
     def clear_status(self):
         """Clear current status"""
         self._current_status = None
+        self.render_scheduler.discard("overall_status")
         if self.view:
             self.view.update_status(False, False, False)
@@ -0,0 +1,127 @@
+import queue
+import time
+from src.config.app_config import AppConfig
+from src.model.metrics import MetricsRegistry
+
+class RenderScheduler:
+    """Coalesce view updates and push them to the views at a fixed rate
+
+    Presenters submit the latest sample of each stream; once per frame the
+    scheduler hands the newest pending sample of every stream to its render
+    function. Samples replaced before a frame are counted as dropped for
+    display only, logging always sees every sample.
+
+    submit() and discard() may be called from the asyncio thread; they only
+    enqueue, the queue is drained on the Tk side each frame. Samples submitted
+    before start() wait for the first frame, after stop() they are dropped.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.config = AppConfig()  # Get singleton instance
+            self._renderers = {}
+            self._pending = {}
+            self._queue = queue.SimpleQueue()
+            self.dropped = {}  # Samples per stream that never reached the view
+            self.frames = 0
+            self.frame_time = MetricsRegistry().histogram("render frame", first=0.0005, buckets=10)
+            self._widget = None
+            self._after_id = None
+            self._stopped = False
+            self.initialized = True
+
+    def register(self, stream, render):
+        """Register the render function of a stream
+
+        Args:
+            stream: Stream key used when submitting samples
+            render: Callable taking the latest sample, called from the Tk loop
+        """
+        self._renderers[stream] = render
+        self.dropped.setdefault(stream, 0)
+
+    def submit(self, stream, sample, count=1):
+        """Queue the latest sample of a stream for the next frame
+
+        Args:
+            stream: Registered stream key
+            sample: Latest sample, replaces any sample still pending
+            count: Number of received samples this one stands for
+        """
+        if self._stopped:
+            self.dropped[stream] = self.dropped.get(stream, 0) + count
+            return
+
+        self._queue.put((stream, sample, count))
+
+    def discard(self, *streams):
+        """Drop pending samples of streams, e.g. before clearing their views"""
+        for stream in streams:
+            self._queue.put((stream, None, 0))
+
+    def start(self, widget):
+        """Start rendering frames on the Tk loop of widget, keeping samples already queued"""
+        if self._widget is not None and self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+        self._stopped = False
+        self._widget = widget
+        self._after_id = widget.after(self._interval_ms(), self._frame)
+
+    def stop(self):
+        """Stop rendering and discard pending samples"""
+        if self._widget is not None and self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+        self._widget = None
+        self._after_id = None
+        self._stopped = True
+        self._pending.clear()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def _interval_ms(self):
+        return max(1, round(1000 / self.config.RENDER_RATE_HZ))
+
+    def _frame(self):
+        """Render the newest pending sample of every stream"""
+        start = time.perf_counter()
+        self._collect()
+        pending, self._pending = self._pending, {}
+        for stream, (sample, count) in pending.items():
+            self.dropped[stream] = self.dropped.get(stream, 0) + count - 1
+            self._render(stream, sample)
+        self.frames += 1
+        self.frame_time.observe(time.perf_counter() - start)
+        self._after_id = self._widget.after(self._interval_ms(), self._frame)
+
+    def _collect(self):
+        """Move queued submissions into the pending samples"""
+        while True:
+            try:
+                stream, sample, count = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            previous = self._pending.pop(stream, None)
+            if count == 0:
+                # Discarded, the pending sample never reaches the view
+                if previous:
+                    self.dropped[stream] = self.dropped.get(stream, 0) + previous[1]
+                continue
+            if previous:
+                count += previous[1]
+            self._pending[stream] = (sample, count)
+
+    def _render(self, stream, sample):
+        render = self._renderers.get(stream)
+        if not render:
+            return
+        try:
+            render(sample)
+        except Exception as e:
+            print(f"Error rendering {stream}: {e}")
@@ -1,4 +1,7 @@
+import asyncio
+from src.config.app_config import AppConfig
 from src.model.sensor import FlexSensorData, ForceSensorData
+from src.presenter.render_scheduler import RenderScheduler
 
 class SensorPresenter:
     """Presenter for handling sensor data"""
@@ -11,12 +14,24 @@ class SensorPresenter:
             ble_service: Reference to the BLE service
             loop: Event loop for async operations
         """
+        self.config = AppConfig()  # Get singleton instance
         self.view = view
         self.service = ble_service
         self.view.service = ble_service  # Set service for configuration
         self.view.loop = loop  # Set event loop for async operations
+        self.loop = loop
         self._current_flex_data = None
         self._current_force_data = None
+
+        # Ring buffer readers and the task draining them
+        self.flex_reader = None
+        self.force_reader = None
+        self._consume_task = None
+
+        # View updates are coalesced and rendered at a fixed rate
+        self.render_scheduler = RenderScheduler()  # Get singleton instance
+        self.render_scheduler.register("flex", self._handle_flex_update)
+        self.render_scheduler.register("force", self._handle_force_update)
         
         # Initially disable buttons until connection is established
         self.view.set_button_states(False)
@@ -24,50 +39,71 @@ class SensorPresenter:
     async def start_notifications(self):
         """Start sensor notifications"""
         if self.service:
-            flex_success = await self.service.start_flex_sensor_notify(self._handle_flex_update)
-            force_success = await self.service.start_force_sensor_notify(self._handle_force_update)
+            # Samples are decoded into the service ring buffers and drained by _consume_samples
+            self.flex_reader = self.service.buffers[self.service.FLEX_SENSOR_UUID].reader()
+            self.force_reader = self.service.buffers[self.service.FORCE_SENSOR_UUID].reader()
+            flex_success = await self.service.start_flex_sensor_notify()
+            force_success = await self.service.start_force_sensor_notify()
             if flex_success and force_success:
                 self.view.set_button_states(True)
+                if not self._consume_task:
+                    self._consume_task = self.loop.create_task(self._consume_samples())
                 return True
             return False
         return False
 
     async def stop_notifications(self):
         """Stop sensor notifications"""
+        if self._consume_task:
+            self._consume_task.cancel()
+            self._consume_task = None
         if self.service:
             await self.service.stop_flex_sensor_notify()
             await self.service.stop_force_sensor_notify()
             self.view.set_button_states(False)
 
-    async def _handle_flex_update(self, sender, flex_data):
+    async def _consume_samples(self):
+        """Drain the flex and force ring buffers at a fixed pace"""
+        while True:
+            await asyncio.sleep(self.config.SAMPLE_CONSUME_INTERVAL)
+            try:
+                flex_rows = self.flex_reader.read()
+                if len(flex_rows):
+                    flex_data = FlexSensorData._make(flex_rows[-1].item()[1:])
+                    self.render_scheduler.submit("flex", flex_data, len(flex_rows))
+                force_rows = self.force_reader.read()
+                if len(force_rows):
+                    force_data = ForceSensorData._make(force_rows[-1].item()[1:])
+                    self.render_scheduler.submit("force", force_data, len(force_rows))
+            except Exception as e:
+                print(f"Error consuming sensor samples: {e}")
+
+    def _handle_flex_update(self, flex_data):
         """Handle flex sensor data updates
         
         Args:
-            sender: The characteristic that sent the notification
-            flex_data: FlexSensorData object containing sensor data
+            flex_data: FlexSensorData object containing the latest sensor data
         """
-        if flex_data and isinstance(flex_data, FlexSensorData):
-            self._current_flex_data = flex_data
-            # Update view with new values
-            for i, value in enumerate(flex_data.values, 1):
-                self.view.update_flex_sensor(i, value)
+        self._current_flex_data = flex_data
+        # Update view with new values
+        for i, value in enumerate(flex_data.values, 1):
+            self.view.update_flex_sensor(i, value)
 
-    async def _handle_force_update(self, sender, force_data):
+    def _handle_force_update(self, force_data):
         """Handle force sensor data updates
         
         Args:
-            sender: The characteristic that sent the notification
-            force_data: ForceSensorData object containing sensor data
+            force_data: ForceSensorData object containing the latest sensor data
         """
-        if force_data and isinstance(force_data, ForceSensorData):
-            self._current_force_data = force_data
-            # Update view with new value
-            self.view.update_force_sensor(force_data.value)
+        self._current_force_data = force_data
+        # Update view with new value
+        self.view.update_force_sensor(force_data.value)
 
     def clear_values(self):
         """Clear current sensor values"""
         self._current_flex_data = None
         self._current_force_data = None
+        self.render_scheduler.discard("flex", "force")
         
         # Clear flex sensor values
         for i in range(1, 6):
@@ -0,0 +1,104 @@
+import customtkinter as ctk
+from src.config.app_config import AppConfig
+from src.view.button_component import ButtonComponent
+
+class ConnectionTimelineDialog(ctk.CTkToplevel):
+    """Dialog showing the phases of the last connection as a timeline"""
+
+    ROW_HEIGHT = 22
+    LABEL_WIDTH = 230
+    DURATION_WIDTH = 80
+    BAR_WIDTH = 420
+    INDENT = 14
+
+    def __init__(self, parent, trace):
+        """Initialize dialog
+
+        Args:
+            parent: Parent widget
+            trace: ConnectionTrace to show, or None if nothing was recorded yet
+        """
+        super().__init__(parent)
+        self.parent = parent
+        self.config = AppConfig()  # Get singleton instance
+        self.trace = trace
+
+        self._setup_window()
+        self._create_layout()
+
+    def _setup_window(self):
+        """Configure dialog window"""
+        self.title("Connection Timeline")
+        self.configure(fg_color="#1F1F1F")  # Dark background
+        width = self.LABEL_WIDTH + self.BAR_WIDTH + self.DURATION_WIDTH + 80
+        self.geometry(f"{width}x560")
+        self.protocol("WM_DELETE_WINDOW", self.destroy)  # Handle window close button
+        self.transient(self.parent)
+
+    def _create_layout(self):
+        """Create dialog layout"""
+        main_frame = ctk.CTkFrame(self, fg_color=self.config.PANEL_COLOR, corner_radius=8)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        summary = ctk.CTkLabel(
+            main_frame,
+            text=self._summary_text(),
+            font=self.config.TEXT_FONT,
+            text_color=self.config.TEXT_COLOR,
+            justify="left"
+        )
+        summary.pack(anchor="w", padx=12, pady=(12, 6))
+
+        if self.trace and self.trace.phases:
+            scroll = ctk.CTkScrollableFrame(main_frame, fg_color="transparent")
+            scroll.pack(fill="both", expand=True, padx=6, pady=6)
+            self._draw_timeline(scroll)
+
+        close_button = ButtonComponent(main_frame, "Close", command=self.destroy, width=100)
+        close_button.pack(pady=(6, 12))
+
+    def _summary_text(self):
+        """One-line description of the trace"""
+        if self.trace is None:
+            return "No connection recorded yet"
+        if self.trace.success is None:
+            state = "in progress"
+        else:
+            state = "connected" if self.trace.success else "failed"
+        total = self.trace.total if self.trace.total is not None else 0.0
+        return f"{self.trace.address or 'No device'}  ·  {state}  ·  {total:.2f} s  ·  {len(self.trace.phases)} phases"
+
+    def _draw_timeline(self, container):
+        """Draw one row per phase: name, bar on a shared time axis, duration"""
+        phases = self.trace.ordered_phases()
+        span = max((phase.start + (phase.duration or 0.0) for phase in phases), default=0.0) or 1.0
+        scale = self.BAR_WIDTH / span
+        width = self.LABEL_WIDTH + self.BAR_WIDTH + self.DURATION_WIDTH
+        canvas = ctk.CTkCanvas(
+            container,
+            width=width,
+            height=self.ROW_HEIGHT * len(phases) + 4,
+            bg=self.config.PANEL_COLOR,
+            highlightthickness=0
+        )
+        canvas.pack(anchor="w")
+
+        for row, phase in enumerate(phases):
+            y = row * self.ROW_HEIGHT + 2
+            middle = y + self.ROW_HEIGHT / 2
+            label = phase.name
+            if 'characteristic' in phase.details:
+                label = f"{label} {phase.details['characteristic']}"
+            if 'attempt' in phase.details:
+                label = f"{label} #{phase.details['attempt']}"
+            canvas.create_text(phase.depth * self.INDENT + 4, middle, text=label, anchor="w",
+                               fill=self.config.LABEL_COLOR, font=self.config.LABEL_FONT)
+
+            x0 = self.LABEL_WIDTH + phase.start * scale
+            x1 = x0 + max(1.0, (phase.duration or 0.0) * scale)
+            color = self.config.BUTTON_COLOR if phase.ok else self.config.DISCONNECT_COLOR
+            canvas.create_rectangle(x0, y + 4, x1, y + self.ROW_HEIGHT - 4, fill=color, outline="")
+
+            duration = "…" if phase.duration is None else f"{phase.duration * 1000:.0f} ms"
+            canvas.create_text(width - 4, middle, text=duration, anchor="e",
+                               fill=self.config.TEXT_COLOR, font=self.config.LABEL_FONT)
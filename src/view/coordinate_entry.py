@@ -36,10 +36,13 @@ class CoordinateEntry(ctk.CTkFrame):
 
     def set_value(self, value: float, keep_editable=False):
         """Update the coordinate value"""
+        text = f"{value:.2f}"
+        if not keep_editable and self.entry.get() == text:
+            return  # Unchanged, skip the redraw
         current_state = self.entry.cget("state")
         self.entry.configure(state="normal")
         self.entry.delete(0, "end")
-        self.entry.insert(0, f"{value:.2f}")
+        self.entry.insert(0, text)
         self.entry.configure(state=current_state if keep_editable else "readonly")
 
     def get_value(self) -> float:
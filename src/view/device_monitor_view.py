@@ -6,10 +6,13 @@ from src.view.button_component import ButtonComponent
 from src.view.connection_status_dialog import ConnectionStatusDialog
 from src.view.view_interfaces import ConnectionViewInterface
 from src.view.imu_log_dialog import IMULogDialog
+from src.view.connection_timeline_dialog import ConnectionTimelineDialog
+from src.model.connection_profiler import ConnectionProfiler
 from src.model.imu_logger import IMULogger
+from src.model.session_recorder import SessionRecorder
+from src.model.raw_capture import RawCaptureWriter
 import os
 import datetime
-import time
 
 class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
     """View class for monitoring device information"""
@@ -29,38 +32,46 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
         self.imu2_presenter = None
         self.selected_folder = None
         self.imu_logger = None
-        self.last_battery_notification = None
+        self.session_recorder = None
+        self.raw_capture = None
         self.reconnect_button = None
-        self.notification_check_timer = None
         self.current_device_address = None  # Store address for reconnection
+        self.presets = None  # ConfigPresetManager, set by presenter
+        self.preset_command = None  # Coroutine function applying a preset by name
+        self.preset_box = None
         
         self._create_layout()
         # Initially hide log button
         self.show_log_button(False)
 
-    async def update_battery(self, level):
+    def update_battery(self, level):
         """Update battery level"""
         self.update_value("battery", f"{level}%")
 
-    async def update_charging(self, state):
+    def update_charging(self, state):
         """Update charging state"""
-        # Update last notification time
-        self.last_battery_notification = time.time()
-        # Start timer if not already running
-        if not self.notification_check_timer:
-            self.notification_check_timer = self.after(3000, self._check_notification_timeout)
         self.update_value("charging", state)
 
-    def _check_notification_timeout(self):
-        """Check if battery notification timeout occurred"""
-        if self.is_connected and self.last_battery_notification:
-            current_time = time.time()
-            if current_time - self.last_battery_notification > 3:
-                # Show reconnect UI
-                self.device_button.configure(fg_color="red")
-                self.reconnect_button.grid()
-            # Schedule next check
-            self.notification_check_timer = self.after(3000, self._check_notification_timeout)
+    def update_link_state(self, state, message=""):
+        """Show the LinkSupervisor state
+
+        While the link is restored the session (and any running log) is kept;
+        the reconnect button is only offered once the supervisor gave up.
+        """
+        if not self.is_connected:
+            return
+        if state == "connected":
+            self.device_button.configure(fg_color="darkred")
+            self.reconnect_button.grid_remove()
+            self.update_value("status", "Connected")
+        elif state in ("reconnecting", "resubscribing"):
+            self.device_button.configure(fg_color="red")
+            self.reconnect_button.grid_remove()
+            self.update_value("status", message or "Reconnecting...")
+        elif state == "failed":
+            self.device_button.configure(fg_color="red")
+            self.reconnect_button.grid()
+            self.update_value("status", message or "Link lost")
 
     def _handle_reconnect(self):
         """Handle reconnect button click"""
@@ -114,7 +125,41 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
             font=self.config.HEADER_FONT,
             text_color=self.config.TEXT_COLOR
         )
-        info_label.pack(anchor="w", padx=12, pady=7)
+        info_label.pack(side="left", anchor="w", padx=12, pady=7)
+
+        # Config preset selector, filled by set_preset_handler
+        self.preset_box = ctk.CTkComboBox(
+            left_section,
+            width=220,
+            values=[],
+            command=self._handle_preset,
+            fg_color="#444444",
+            border_color="#444",
+            button_color="#444",
+            dropdown_fg_color="#444444",
+            dropdown_text_color="white",
+            dropdown_hover_color="#333",
+            state="disabled"
+        )
+        self.preset_box.pack(side="right", padx=12, pady=7)
+
+    def set_preset_handler(self, names, preset_command):
+        """Set the preset names offered and the coroutine function applying one"""
+        self.preset_command = preset_command
+        self.preset_box.configure(values=list(names))
+
+    def _handle_preset(self, name):
+        """Handle preset selection"""
+        if self.preset_command and self.loop:
+            self.preset_box.configure(state="disabled")
+            self.loop.create_task(self.preset_command(name))
+
+    def update_preset(self, name):
+        """Show the active preset, None for a custom configuration"""
+        if not self.is_connected:
+            return
+        self.preset_box.configure(state="readonly")
+        self.preset_box.set(name or "Custom")
 
     def _create_add_button(self):
         """Create the Add Device/Disconnect button"""
@@ -148,6 +193,17 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
             command=self._on_log
         )
         self.log_button.grid(row=2, column=1, columnspan=2, padx=12, pady=(12, 0))
+
+        self.timeline_button = ButtonComponent(
+            button_container,
+            "Timeline",
+            command=self._show_timeline
+        )
+        self.timeline_button.grid(row=2, column=0, padx=(12, 12), pady=(12, 0))
+
+    def _show_timeline(self):
+        """Show the phase timeline of the latest connection"""
+        ConnectionTimelineDialog(self.winfo_toplevel(), ConnectionProfiler().latest())
         
     def _create_info_fields(self):
         """Create the information fields grid"""
@@ -275,14 +331,29 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
             full_path = os.path.join(self.selected_folder, subfolder_name)
             os.makedirs(full_path, exist_ok=True)
             
+            # Active preset and device config go into every log header
+            metadata = self.presets.session_metadata() if self.presets else None
+
             # Create logger
-            self.imu_logger = IMULogger(full_path)
+            self.imu_logger = IMULogger(full_path, metadata=metadata)
             if self.imu_logger.start_logging():
                 # Update button
                 self.log_button.configure(text="Stop Log", fg_color="darkred", hover_color="#8B0000")
                 # Connect presenters
                 self.imu1_presenter.set_log_dialog(self)
                 self.imu2_presenter.set_log_dialog(self)
+
+                # Record the other streams alongside the IMU logs
+                if self.config.RECORD_ALL_STREAMS and self.loop:
+                    self.session_recorder = SessionRecorder(self.imu1_presenter.service, full_path, metadata)
+                    self.loop.create_task(self.session_recorder.start())
+
+                # Record raw notification payloads for replay
+                if self.config.RECORD_RAW_NOTIFICATIONS:
+                    self.raw_capture = RawCaptureWriter(
+                        self.imu1_presenter.service, os.path.join(full_path, "notifications.raw"), metadata)
+                    if not self.raw_capture.start():
+                        self.raw_capture = None
             else:
                 self.imu_logger = None
                 
@@ -296,6 +367,12 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
             self.imu_logger = None
             self.imu1_presenter.set_log_dialog(None)
             self.imu2_presenter.set_log_dialog(None)
+            if self.session_recorder:
+                self.loop.create_task(self.session_recorder.stop())
+                self.session_recorder = None
+            if self.raw_capture:
+                self.raw_capture.stop()
+                self.raw_capture = None
             self.selected_folder = None  # Reset folder selection
             self.log_button.configure(text="Log", fg_color=self.config.BUTTON_COLOR, hover_color=self.config.BUTTON_HOVER_COLOR)
 
@@ -304,6 +381,11 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
         if self.imu_logger and self.imu_logger.is_logging:
             self.imu_logger.log_imu_data(imu_number, imu_data, euler_data)
 
+    def log_imu_batch(self, imu_number, imu_batch, euler_batch, timestamps=None):
+        """Log a batch of IMU rows with their paired Euler rows to CSV files"""
+        if self.imu_logger and self.imu_logger.is_logging:
+            self.imu_logger.log_imu_batch(imu_number, imu_batch, euler_batch, timestamps)
+
     def show_log_button(self, show: bool):
         """Show or hide the log button"""
         if show:
@@ -314,12 +396,6 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
     def update_connection_status(self, connected, device_info=None, message=""):
         """Update connection status display (required by ConnectionViewInterface)"""
         self.is_connected = connected
-        
-        # Reset notification tracking
-        self.last_battery_notification = None
-        if self.notification_check_timer:
-            self.after_cancel(self.notification_check_timer)
-            self.notification_check_timer = None
         self.reconnect_button.grid_remove()
         
         if connected:
@@ -368,6 +444,9 @@ class DeviceMonitorView(ctk.CTkFrame, ConnectionViewInterface):
             for field_id in self.value_labels:
                 self.update_value(field_id, "--")
             self.show_log_button(False)  # Hide log button when disconnected
+            self.preset_box.configure(state="readonly")
+            self.preset_box.set("")
+            self.preset_box.configure(state="disabled")
 
     def show_connection_status(self, result, device_info=None, message=""):
         """Show connection status (required by ConnectionPresenter)"""
@@ -0,0 +1,110 @@
+import customtkinter as ctk
+from src.config.app_config import AppConfig
+
+class DiagnosticsView(ctk.CTkFrame):
+    """Live pipeline metrics: one row per notifying characteristic plus queue gauges"""
+
+    COLUMNS = ("Stream", "Rate/s", "Δt ms", "p95 ms", "Errors", "Lost")
+
+    def __init__(self, parent):
+        self.config = AppConfig()  # Get singleton instance
+        super().__init__(
+            parent,
+            fg_color=self.config.PANEL_COLOR,
+            border_color=self.config.BORDER_COLOR,
+            border_width=self.config.BORDER_WIDTH,
+            corner_radius=self.config.CORNER_RADIUS
+        )
+        # Configure base grid
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Row labels per stream key, created when the stream first shows up
+        self.rows = {}
+
+        # Create UI Components
+        self.create_header()
+        self.create_table()
+
+    def create_header(self):
+        """Create the header section"""
+        header_label = ctk.CTkLabel(
+            self,
+            text="DIAGNOSTICS",
+            font=self.config.HEADER_FONT,
+            text_color=self.config.TEXT_COLOR
+        )
+        header_label.grid(row=0, column=0, sticky="nw", padx=12, pady=(12, 0))
+
+    def create_table(self):
+        """Create the metrics table and the gauge line"""
+        self.table = ctk.CTkFrame(self, fg_color="transparent")
+        self.table.grid(row=1, column=0, sticky="nsew", padx=12, pady=(4, 0))
+        self.table.grid_columnconfigure(0, weight=1)
+
+        for column, text in enumerate(self.COLUMNS):
+            label = ctk.CTkLabel(
+                self.table,
+                text=text,
+                font=self.config.LABEL_FONT,
+                text_color=self.config.TEXT_COLOR,
+            )
+            label.grid(row=0, column=column, sticky="w" if column == 0 else "e", padx=(0, 10))
+
+        self.gauge_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=self.config.TEXT_FONT,
+            text_color=self.config.TEXT_COLOR,
+            justify="left",
+            anchor="w"
+        )
+        self.gauge_label.grid(row=2, column=0, sticky="ew", padx=12, pady=(4, 12))
+
+    def _row(self, key, name):
+        """Labels of one stream row, created on first use"""
+        labels = self.rows.get(key)
+        if labels is None:
+            row = len(self.rows) + 1
+            labels = []
+            for column in range(len(self.COLUMNS)):
+                label = ctk.CTkLabel(
+                    self.table,
+                    text=name if column == 0 else "-",
+                    font=self.config.TEXT_FONT,
+                    text_color=self.config.TEXT_COLOR,
+                )
+                label.grid(row=row, column=column, sticky="w" if column == 0 else "e", padx=(0, 10))
+                labels.append(label)
+            self.rows[key] = labels
+        return labels
+
+    def update_metrics(self, snapshot):
+        """Show a MetricsRegistry snapshot
+
+        Args:
+            snapshot: dict returned by MetricsRegistry.snapshot()
+        """
+        devices = {stream['device'] for stream in snapshot['streams']}
+        for stream in snapshot['streams']:
+            if not stream['notifications']:
+                continue
+            # Only name the device when several are connected
+            name = f"{stream['device']} {stream['name']}" if len(devices) > 1 else stream['name']
+            labels = self._row((stream['device'], stream['name']), name)
+            interarrival = stream['interarrival']
+            values = (
+                f"{stream['rate']:.1f}",
+                f"{interarrival['mean'] * 1000:.1f}" if interarrival['mean'] is not None else "-",
+                f"{interarrival['p95'] * 1000:.0f}" if interarrival['p95'] is not None else "-",
+                str(stream['decode_errors']),
+                str(stream['lost']),
+            )
+            for label, value in zip(labels[1:], values):
+                label.configure(text=value)
+            labels[4].configure(text_color="red" if stream['decode_errors'] else self.config.TEXT_COLOR)
+            labels[5].configure(text_color="red" if stream['lost'] else self.config.TEXT_COLOR)
+
+        gauges = snapshot['gauges']
+        self.gauge_label.configure(
+            text="  ".join(f"{name}: {value}" for name, value in sorted(gauges.items())) if gauges else "")
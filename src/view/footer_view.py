@@ -2,7 +2,7 @@ import customtkinter as ctk
 from src.config.app_config import AppConfig
 import time
 from datetime import datetime
-from bleak import BleakScanner
+from src.model.transport import scanner_class
 
 class FooterComponent(ctk.CTkFrame):
     def __init__(self, parent):
@@ -59,7 +59,7 @@ class FooterComponent(ctk.CTkFrame):
     async def _check_ble_status_async(self):
         """Check BLE adapter status asynchronously"""
         try:
-            scanner = BleakScanner()
+            scanner = scanner_class()()
             await scanner.discover(timeout=0.1)
             self.ble_status.configure(text="BLE ON", text_color=self.config.TEXT_COLOR)
         except Exception as e:
@@ -8,37 +8,31 @@ class IMU1View(BaseIMUView):
 
     async def _on_config(self):
         """Handle IMU1 configuration button click"""
-        # Read current config
-        data = await self.imu_service.read_config()
+        # Current config from the service's shadow, no device read once it is known
+        config = await self.imu_service.get_config()
         dialog = IMUConfigDialog(self, "IMU1")
         
-        if data:
-            # Set dialog values from IMU1 config bytes
-            dialog.accel_gyro_rate_item.set(self.imu_service.ACCEL_GYRO_FREQ_MAP[data[1]])  # IMU1 accel/gyro freq
-            dialog.mag_rate_item.set(self.imu_service.MAG_FREQ_MAP[data[2]])  # IMU1 mag freq
-            dialog.accel_range_item.set(self.imu_service.ACCEL_RANGE_MAP[data[5]])  # IMU1 accel range
-            dialog.gyro_range_item.set(self.imu_service.GYRO_RANGE_MAP[data[6]])  # IMU1 gyro range
-            dialog.mag_range_item.set(self.imu_service.MAG_RANGE_MAP[data[7]])  # IMU1 mag range
+        if config:
+            # Set dialog values from the IMU1 fields
+            dialog.accel_gyro_rate_item.set(config.ACCEL_GYRO_FREQ_MAP[config.imu1_accel_gyro_freq])
+            dialog.mag_rate_item.set(config.MAG_FREQ_MAP[config.imu1_mag_freq])
+            dialog.accel_range_item.set(config.ACCEL_RANGE_MAP[config.imu1_accel_range])
+            dialog.gyro_range_item.set(config.GYRO_RANGE_MAP[config.imu1_gyro_range])
+            dialog.mag_range_item.set(config.MAG_RANGE_MAP[config.imu1_mag_range])
 
         dialog.set_cancel_callback(dialog.destroy)
         dialog.set_apply_callback(lambda config: self.loop.create_task(self._handle_config_apply(dialog, config)))
 
     async def _handle_config_apply(self, dialog, config):
         """Handle IMU1 configuration dialog apply button click"""
-        # Read current config to preserve other bytes
-        data = await self.imu_service.read_config()
-        if data:
-            # Create new config array with current config
-            new_config = bytearray(data)
-            # Update IMU1 config bytes (1,2,5,6,7)
-            new_config[1] = self.imu_service.ACCEL_GYRO_FREQ_REV_MAP[config['accel_gyro_rate']]
-            new_config[2] = self.imu_service.MAG_FREQ_REV_MAP[config['mag_rate']]  
-            new_config[5] = self.imu_service.ACCEL_RANGE_REV_MAP[config['accel_range']]
-            new_config[6] = self.imu_service.GYRO_RANGE_REV_MAP[config['gyro_range']]
-            new_config[7] = self.imu_service.MAG_RANGE_REV_MAP[config['mag_range']]
-
-            # Write updated config 
-            await self.imu_service.write_config(new_config)
+        # Patch the IMU1 fields, the service writes them in one go without reading first
+        await self.imu_service.update_config(
+            imu1_accel_gyro_freq=self.imu_service.ACCEL_GYRO_FREQ_REV_MAP[config['accel_gyro_rate']],
+            imu1_mag_freq=self.imu_service.MAG_FREQ_REV_MAP[config['mag_rate']],
+            imu1_accel_range=self.imu_service.ACCEL_RANGE_REV_MAP[config['accel_range']],
+            imu1_gyro_range=self.imu_service.GYRO_RANGE_REV_MAP[config['gyro_range']],
+            imu1_mag_range=self.imu_service.MAG_RANGE_REV_MAP[config['mag_range']],
+        )
 
         # Destroy dialog after writing config
         dialog.destroy()
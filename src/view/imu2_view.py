@@ -8,37 +8,31 @@ class IMU2View(BaseIMUView):
 
     async def _on_config(self):
         """Handle IMU2 configuration button click"""
-        # Read current config
-        data = await self.imu_service.read_config()
+        # Current config from the service's shadow, no device read once it is known
+        config = await self.imu_service.get_config()
         dialog = IMUConfigDialog(self, "IMU2")
         
-        if data:
-            # Set dialog values from IMU2 config bytes
-            dialog.accel_gyro_rate_item.set(self.imu_service.ACCEL_GYRO_FREQ_MAP[data[3]])  # IMU2 accel/gyro freq
-            dialog.mag_rate_item.set(self.imu_service.MAG_FREQ_MAP[data[4]])  # IMU2 mag freq
-            dialog.accel_range_item.set(self.imu_service.ACCEL_RANGE_MAP[data[8]])  # IMU2 accel range
-            dialog.gyro_range_item.set(self.imu_service.GYRO_RANGE_MAP[data[9]])  # IMU2 gyro range
-            dialog.mag_range_item.set(self.imu_service.MAG_RANGE_MAP[data[10]])  # IMU2 mag range
-            
+        if config:
+            # Set dialog values from the IMU2 fields
+            dialog.accel_gyro_rate_item.set(config.ACCEL_GYRO_FREQ_MAP[config.imu2_accel_gyro_freq])
+            dialog.mag_rate_item.set(config.MAG_FREQ_MAP[config.imu2_mag_freq])
+            dialog.accel_range_item.set(config.ACCEL_RANGE_MAP[config.imu2_accel_range])
+            dialog.gyro_range_item.set(config.GYRO_RANGE_MAP[config.imu2_gyro_range])
+            dialog.mag_range_item.set(config.MAG_RANGE_MAP[config.imu2_mag_range])
+
         dialog.set_cancel_callback(dialog.destroy)
         dialog.set_apply_callback(lambda config: self.loop.create_task(self._handle_config_apply(dialog, config)))
 
     async def _handle_config_apply(self, dialog, config):
         """Handle IMU2 configuration dialog apply button click"""
-        # Read current config to preserve other bytes
-        data = await self.imu_service.read_config()
-        if data:
-            # Create new config array with current config
-            new_config = bytearray(data)
-            # Update IMU2 config bytes (3,4,8,9,10)
-            new_config[3] = self.imu_service.ACCEL_GYRO_FREQ_REV_MAP[config['accel_gyro_rate']]
-            new_config[4] = self.imu_service.MAG_FREQ_REV_MAP[config['mag_rate']]  
-            new_config[8] = self.imu_service.ACCEL_RANGE_REV_MAP[config['accel_range']]
-            new_config[9] = self.imu_service.GYRO_RANGE_REV_MAP[config['gyro_range']]
-            new_config[10] = self.imu_service.MAG_RANGE_REV_MAP[config['mag_range']]
-
-            # Write updated config 
-            await self.imu_service.write_config(new_config)
+        # Patch the IMU2 fields, the service writes them in one go without reading first
+        await self.imu_service.update_config(
+            imu2_accel_gyro_freq=self.imu_service.ACCEL_GYRO_FREQ_REV_MAP[config['accel_gyro_rate']],
+            imu2_mag_freq=self.imu_service.MAG_FREQ_REV_MAP[config['mag_rate']],
+            imu2_accel_range=self.imu_service.ACCEL_RANGE_REV_MAP[config['accel_range']],
+            imu2_gyro_range=self.imu_service.GYRO_RANGE_REV_MAP[config['gyro_range']],
+            imu2_mag_range=self.imu_service.MAG_RANGE_REV_MAP[config['mag_range']],
+        )
 
         # Destroy dialog after writing config
         dialog.destroy()
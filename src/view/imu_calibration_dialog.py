@@ -1,5 +1,6 @@
 import customtkinter as ctk
 from src.config.app_config import AppConfig
+from src.model.device_config import DeviceConfig
 from src.view.button_component import ButtonComponent
 import subprocess
 
@@ -15,8 +16,10 @@ class IMUCalibrationDialog(ctk.CTkToplevel):
         self._setup_window(parent)
         self._create_main_layout(imu_label)
         self.open_tool_button = None
-        # Start debug updates
-        self._start_debug_updates()
+        # Show the command from the service's shadow config, updated on every config change
+        self.imu_service.add_config_listener(self._on_config_changed)
+        self._on_config_changed(self.imu_service.device_config)
+        self._poll_config()
 
     def _setup_window(self, parent):
         self.title("IMU Calibration")
@@ -145,12 +148,7 @@ class IMUCalibrationDialog(ctk.CTkToplevel):
     async def _write_cmd(self, cmd_value):
         """Write command value to config while preserving other settings"""
         try:
-            data = await self.imu_service.read_config()
-            if data:
-                new_config = bytearray(data)
-                new_config[0] = cmd_value
-                await self.imu_service.write_config(new_config)
-                return True
+            return await self.imu_service.update_config(cmd=cmd_value)
         except Exception as e:
             print(f"[ERROR] Cannot write command: {e}")
             return False
@@ -158,7 +156,7 @@ class IMUCalibrationDialog(ctk.CTkToplevel):
     def _launch_tool(self):
         try:
             # Write appropriate CMD value based on IMU label
-            cmd_value = 2 if self.imu_label == "IMU1" else 3
+            cmd_value = DeviceConfig.CMD_CALIBRATE_IMU1 if self.imu_label == "IMU1" else DeviceConfig.CMD_CALIBRATE_IMU2
             if hasattr(self, 'imu_service'):
                 self.imu_service.loop.create_task(self._write_cmd(cmd_value))
             # Launch MotionCal
@@ -218,9 +216,9 @@ class IMUCalibrationDialog(ctk.CTkToplevel):
         if self.status_label.cget("text") != "OPEN TOOL":
             self.status_label.configure(text="")
         
-        # Set CMD to RUN (1) before closing
+        # Set CMD to RUN before closing
         if hasattr(self, 'imu_service'):
-            self.imu_service.loop.create_task(self._write_cmd(1))
+            self.imu_service.loop.create_task(self._write_cmd(DeviceConfig.CMD_RUN))
         self.destroy()
 
     def set_cancel_callback(self, callback):
@@ -229,30 +227,34 @@ class IMUCalibrationDialog(ctk.CTkToplevel):
     def set_start_callback(self, callback):
         self._start_callback = callback  # Store for use after countdown
 
-    async def _update_debug_label(self):
-        """Read and update CMD value in debug label"""
-        try:
-            data = await self.imu_service.read_config()
-            if data:
-                cmd_value = data[0]
-                cmd_text = {
-                    0: "IDLE",
-                    1: "RUN",
-                    2: "IMU1 CALIB",
-                    3: "IMU2 CALIB"
-                }.get(cmd_value, f"Unknown ({cmd_value})")
-                self.debug_label.configure(text=f"CMD: {cmd_text}")
-        except Exception as e:
-            self.debug_label.configure(text=f"CMD: Error ({str(e)})")
+    def _on_config_changed(self, config):
+        """Config listener: show the CMD value in the debug label"""
+        if not config:
+            return
+        cmd_text = config.CMD_NAMES.get(config.cmd, f"Unknown ({config.cmd})")
 
-    def _start_debug_updates(self):
-        """Start periodic debug label updates"""
-        if hasattr(self, 'imu_service'):
-            self.imu_service.loop.create_task(self._update_debug_label())
+        def update():
             if not self._destroyed:
-                self.after(3000, self._start_debug_updates)  # Update every 3 seconds
+                self.debug_label.configure(text=f"CMD: {cmd_text}")
+        self._call_in_ui(update)
+
+    def _poll_config(self):
+        """Read the config every 3 seconds if the device does not notify config changes"""
+        if self._destroyed or self.imu_service.config_notifying:
+            return
+        self.imu_service.loop.create_task(self.imu_service.read_config())
+        self.after(3000, self._poll_config)
+
+    def _call_in_ui(self, callback):
+        """Run callback on the Tk thread, listeners may be called from the asyncio thread"""
+        loop = getattr(self.imu_service, 'loop', None)
+        if hasattr(loop, 'call_in_ui'):
+            loop.call_in_ui(callback)
+        else:
+            callback()
 
     def destroy(self):
         self._countdown_running = False
         self._destroyed = True
+        self.imu_service.remove_config_listener(self._on_config_changed)
         super().destroy()
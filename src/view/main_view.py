@@ -4,6 +4,7 @@ from src.config.app_config import AppConfig
 from src.view.device_monitor_view import DeviceMonitorView
 from src.view.gamepad_view import GamepadView
 from src.view.overall_status_view import OverallStatusView
+from src.view.diagnostics_view import DiagnosticsView
 from src.view.imu1_view import IMU1View
 from src.view.imu2_view import IMU2View
 from src.view.sensor_view import SensorView
@@ -66,9 +67,17 @@ class MainView:
         right_container.grid_rowconfigure(2, weight=1)
         right_container.grid_rowconfigure(3, weight=0)
 
-        self.overall_status_view = OverallStatusView(right_container)
-        self.overall_status_view.grid(
-            row=0, column=0, sticky="nsew", padx=(10, 0), pady=(0, 10))
+        status_frame = ctk.CTkFrame(right_container, fg_color="transparent")
+        status_frame.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=(0, 10))
+        status_frame.grid_columnconfigure(0, weight=1)
+        status_frame.grid_columnconfigure(1, weight=1)
+        status_frame.grid_rowconfigure(0, weight=1)
+
+        self.overall_status_view = OverallStatusView(status_frame)
+        self.overall_status_view.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
+
+        self.diagnostics_view = DiagnosticsView(status_frame)
+        self.diagnostics_view.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
 
         imu_frame = ctk.CTkFrame(right_container, fg_color="transparent")
         imu_frame.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=10)
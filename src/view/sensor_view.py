@@ -87,14 +87,12 @@ class SensorView(ctk.CTkFrame):
 
     async def _on_config(self):
         """Handle configuration button click"""
-        # Read current config
-        data = await self.service.read_config()
+        # Current config from the service's shadow, no device read once it is known
+        config = await self.service.get_config()
         dialog = OtherConfigDialog(self)
         
-        if data:
-            # Get sensor update interval from bytes 11-12 (little endian)
-            interval = int.from_bytes(data[11:13], 'little')
-            dialog.rate_entry.set_value(interval, keep_editable=True)
+        if config:
+            dialog.rate_entry.set_value(config.sensor_interval, keep_editable=True)
             
         dialog.set_cancel_callback(dialog.destroy)
         dialog.set_apply_callback(lambda: self.loop.create_task(self._handle_config_apply(dialog)))
@@ -103,15 +101,12 @@ class SensorView(ctk.CTkFrame):
         """Handle configuration apply button click"""
         rate = dialog.get_rate_value()
         
-        # Read current config to preserve other bytes
-        data = await self.service.read_config()
-        if data:
-            # Create new 15-byte array with current config
-            new_config = bytearray(data)
-            # Update bytes 11-12 with new rate (little endian)
-            new_config[11:13] = rate.to_bytes(2, 'little')
-            # Write updated config
-            await self.service.write_config(new_config)
+        # Patch the sensor interval, the service writes it without reading first
+        try:
+            await self.service.update_config(sensor_interval=rate)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
             
         dialog.destroy()
     def _handle_config_click(self):
@@ -0,0 +1,12 @@
+import pytest
+from src.config.app_config import AppConfig
+
+
+@pytest.fixture
+def simulated(monkeypatch):
+    """Simulated gloves, no cache or connection log files outside tmp_path"""
+    config = AppConfig()
+    for name, value in dict(BLE_BACKEND="simulated", DEVICE_CACHE_FILE="", CONNECTION_LOG_FILE="",
+                            METRICS_PORT=None, SIM_DEVICE_COUNT=1).items():
+        monkeypatch.setattr(config, name, value)
+    return config
@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+from src.model.battery import BatteryLevelData, BatteryStateData
+from src.model.esp32_service import ESP32BLEService
+
+
+@pytest.mark.parametrize("payload", [b'\x55', b'\x55\x00', b'\x55\x01\x02\x03'])
+def test_battery_level_ignores_trailing_bytes(payload):
+    service = ESP32BLEService.create_session()
+    decoder = service.DECODERS[service.BATTERY_LEVEL_UUID.lower()]
+    assert decoder.decode(payload) == BatteryLevelData(85)
+    assert BatteryLevelData.from_bytes(payload).level == 85
+
+
+def test_battery_state_ignores_trailing_bytes():
+    service = ESP32BLEService.create_session()
+    decoder = service.DECODERS[service.BATTERY_CHARGING_UUID.lower()]
+    assert decoder.decode(b'\x01\xff').state_text == "Charging"
+    assert BatteryStateData.from_bytes(b'\x02\x00').state_text == "Fully Charged"
+
+
+def test_battery_handler_buffers_long_payloads():
+    service = ESP32BLEService.create_session()
+    uuid = service.BATTERY_LEVEL_UUID
+    reader = service.buffers[uuid].reader()
+    handler = service._make_notification_handler(service.DECODERS[uuid.lower()], None)
+    handler(None, b'\x40\x00')
+    handler(None, b'')  # Logged and skipped
+    assert reader.read()['level'].tolist() == [64]
+
+
+def test_battery_view_updates_go_through_call_in_ui():
+    class Bridge:
+        def __init__(self):
+            self.calls = []
+
+        def call_in_ui(self, callback, *args):
+            self.calls.append((callback, args))
+
+    class View:
+        def update_battery(self, level):
+            raise AssertionError("Updated off the Tk thread")
+
+    service = ESP32BLEService.create_session()
+    service.set_loop(Bridge())
+    view = View()
+    uuid = service.BATTERY_LEVEL_UUID
+    handler = service._make_notification_handler(service.DECODERS[uuid.lower()], service._ui_callback(view.update_battery))
+    asyncio.run(handler(None, b'\x40'))
+    assert service.loop.calls == [(view.update_battery, (64,))]
@@ -0,0 +1,37 @@
+import json
+import os
+import pytest
+from src import capture
+
+
+@pytest.fixture
+def fast_status(simulated, monkeypatch):
+    """Status lines and metrics exports every half second"""
+    monkeypatch.setattr(capture.HeadlessCapture, "STATUS_INTERVAL", 0.5)
+    monkeypatch.setattr(capture.PoolCapture, "STATUS_INTERVAL", 0.5)
+
+
+def metrics_lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_capture_runs_past_status_interval(fast_status, tmp_path, capsys):
+    metrics = str(tmp_path / "metrics.jsonl")
+    assert capture.main(["--simulate", "--duration", "1.2", "--out", str(tmp_path), "--metrics", metrics]) == 0
+    out = capsys.readouterr().out
+    assert "IMU1" in out and "Hz" in out
+    assert len(metrics_lines(metrics)) >= 2  # Status ticks plus the final export
+    session, = [name for name in os.listdir(tmp_path) if name.endswith("_vr_glove")]
+    assert os.path.exists(tmp_path / session / "imu1.csv")
+
+
+def test_pool_capture_runs_past_status_interval(fast_status, tmp_path, capsys):
+    metrics = str(tmp_path / "metrics.jsonl")
+    assert capture.main(["--simulate", "--devices", "2", "--duration", "1.2", "--out", str(tmp_path),
+                         "--metrics", metrics]) == 0
+    out = capsys.readouterr().out
+    assert out.count("IMU1") >= 2
+    assert len(metrics_lines(metrics)) >= 2
+    session, = [name for name in os.listdir(tmp_path) if name.endswith("_vr_glove")]
+    assert len(os.listdir(tmp_path / session)) == 2  # One folder per glove
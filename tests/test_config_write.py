@@ -0,0 +1,62 @@
+import asyncio
+from src.model.device_config import DeviceConfig
+from src.model.esp32_service import ESP32BLEService
+
+
+class ConfigDevice:
+    """Stands in for the link: serves the config characteristic and records writes"""
+
+    def __init__(self, service, config):
+        self.value = config.raw_data
+        self.writes = []
+        service.is_connected = lambda: True
+        service.read_characteristic = self.read
+        service.write_characteristic = self.write
+
+    async def read(self, uuid):
+        return self.value
+
+    async def write(self, uuid, data):
+        self.writes.append(DeviceConfig.from_bytes(data))
+        self.value = bytes(data)
+
+
+def with_code(config, name, code):
+    """Copy of config with a raw code DeviceConfig may not know, e.g. from newer firmware"""
+    data = bytearray(config.raw_data)
+    data[DeviceConfig.FIELDS.index(name)] = code
+    return DeviceConfig.from_bytes(data)
+
+
+def device_config():
+    config = DeviceConfig(cmd=DeviceConfig.CMD_RUN, imu1_accel_gyro_freq=5, sensor_interval=20)
+    return with_code(config, 'imu2_mag_range', 7)
+
+
+def test_update_config_validates_only_patched_fields():
+    async def run():
+        service = ESP32BLEService.create_session()
+        device = ConfigDevice(service, device_config())
+        assert await service.update_config(imu1_accel_gyro_freq=6)
+        return device.writes
+
+    writes = asyncio.run(run())
+    assert len(writes) == 1
+    assert writes[0].imu1_accel_gyro_freq == 6
+    assert writes[0].imu2_mag_range == 7
+
+
+def test_write_config_validates_changed_fields():
+    async def run():
+        service = ESP32BLEService.create_session()
+        device = ConfigDevice(service, device_config())
+        await service.read_config()
+        shadow = service.device_config
+        unchanged_ok = await service.write_config(shadow.replace(sensor_interval=50))
+        bad_ok = await service.write_config(with_code(shadow, 'imu1_accel_gyro_freq', 9))
+        return unchanged_ok, bad_ok, device.writes
+
+    unchanged_ok, bad_ok, writes = asyncio.run(run())
+    assert unchanged_ok
+    assert not bad_ok
+    assert [config.sensor_interval for config in writes] == [50]
@@ -0,0 +1,25 @@
+import asyncio
+from src.model.config_presets import ConfigPresetManager
+from src.model.connection_pool import ConnectionPool
+from src.model.connection_profiler import ConnectionProfiler
+from src.model.simulator import SimulatedDevice
+
+
+def test_failed_preset_finishes_connection_trace(simulated, monkeypatch):
+    async def refuse(self, name):
+        return False
+
+    monkeypatch.setattr(ConfigPresetManager, "apply", refuse)
+    profiler = ConnectionProfiler()
+    address = SimulatedDevice.advertised()[0].address
+
+    async def run():
+        pool = ConnectionPool()
+        session = await pool.add(address, preset=ConfigPresetManager.PRESETS[0].name)
+        return session, len(pool)
+
+    session, sessions = asyncio.run(run())
+    assert session is None and sessions == 0
+    assert profiler.current is None
+    assert profiler.history[-1].address == address.upper()
+    assert profiler.history[-1].success is False
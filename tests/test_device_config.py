@@ -0,0 +1,89 @@
+import pytest
+from src.model.device_config import DeviceConfig
+
+
+def running_config():
+    return DeviceConfig(cmd=DeviceConfig.CMD_RUN, imu1_accel_gyro_freq=5, imu1_mag_freq=6,
+                        imu2_accel_gyro_freq=4, imu2_mag_freq=5, imu1_accel_range=1, imu1_gyro_range=2,
+                        imu1_mag_range=3, imu2_accel_range=2, imu2_gyro_range=4, imu2_mag_range=0,
+                        sensor_interval=20, reserved=0xBEEF)
+
+
+def test_pack_unpack_round_trip():
+    config = running_config()
+    data = config.raw_data
+    assert len(data) == DeviceConfig.SIZE == 15
+    assert DeviceConfig.from_bytes(data) == config
+    assert DeviceConfig.from_bytes(bytes(data)).to_dict() == config.to_dict()
+
+
+def test_encode_into_matches_raw_data():
+    config = running_config()
+    buffer = bytearray(DeviceConfig.SIZE + 2)
+    config.encode_into(buffer, 2)
+    assert bytes(buffer[2:]) == config.raw_data
+
+
+def test_from_bytes_rejects_short_payload():
+    assert DeviceConfig.from_bytes(running_config().raw_data[:-1]) is None
+    assert DeviceConfig.from_bytes(b"") is None
+
+
+def test_from_bytes_ignores_trailing_bytes():
+    config = running_config()
+    assert DeviceConfig.from_bytes(config.raw_data + b"\x00") == config
+
+
+def test_diff():
+    config = running_config()
+    assert config.diff(config) == {}
+    changed = config.replace(cmd=DeviceConfig.CMD_IDLE, sensor_interval=50)
+    assert config.diff(changed) == {'cmd': DeviceConfig.CMD_IDLE, 'sensor_interval': 50}
+    assert changed.diff(config) == {'cmd': DeviceConfig.CMD_RUN, 'sensor_interval': 20}
+
+
+def test_replace_keeps_other_fields():
+    config = running_config()
+    changed = config.replace(imu2_gyro_range=1)
+    assert changed.imu2_gyro_range == 1
+    assert config.imu2_gyro_range == 4
+    assert set(config.diff(changed)) == {'imu2_gyro_range'}
+
+
+def test_replace_rejects_unknown_field():
+    with pytest.raises(KeyError):
+        running_config().replace(imu3_accel_range=1)
+
+
+@pytest.mark.parametrize("fields", [
+    {'cmd': 7},
+    {'imu1_accel_gyro_freq': 7},
+    {'imu2_mag_range': 4},
+    {'sensor_interval': 0},
+    {'sensor_interval': 0x10000},
+])
+def test_replace_rejects_out_of_range_values(fields):
+    with pytest.raises(ValueError):
+        running_config().replace(**fields)
+
+
+def test_errors_only_checks_requested_fields():
+    # A code the table does not know, e.g. reported by newer firmware
+    data = bytearray(running_config().raw_data)
+    data[DeviceConfig.FIELDS.index('imu1_gyro_range')] = 9
+    config = DeviceConfig.from_bytes(data)
+    assert config.errors() == ["imu1_gyro_range=9 not in [0, 1, 2, 3, 4]"]
+    assert config.errors(['cmd', 'sensor_interval']) == []
+    # Patching another field validates that field only
+    assert config.replace(cmd=DeviceConfig.CMD_IDLE).cmd == DeviceConfig.CMD_IDLE
+    config.validate(['imu2_gyro_range'])
+    with pytest.raises(ValueError):
+        config.validate()
+
+
+def test_rates():
+    config = running_config()
+    assert config.imu_rate_hz(1) == 208.0
+    assert config.imu_rate_hz(2) == 104.0
+    assert config.sensor_rate_hz == 50.0
+    assert config.replace(cmd=DeviceConfig.CMD_IDLE).imu_rate_hz(1) == 0.0
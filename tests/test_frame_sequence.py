@@ -0,0 +1,54 @@
+import numpy as np
+from src.model.esp32_service import ESP32BLEService
+from src.model.sample import FRAME_HEADER, FRAME_MAGIC
+
+
+def flex_handler():
+    service = ESP32BLEService.create_session()
+    decoder = service.DECODERS[service.FLEX_SENSOR_UUID.lower()]
+    handler = service._make_notification_handler(decoder, None)
+    return service, decoder, handler
+
+
+def frame(decoder, sequence, count):
+    sample = bytes(decoder.data_class.STRUCT.size)
+    return FRAME_HEADER.pack(FRAME_MAGIC, count, sequence) + sample * count
+
+
+def feed(sequences, count=2):
+    service, decoder, handler = flex_handler()
+    for sequence in sequences:
+        handler(None, frame(decoder, sequence, count))
+    return service.lost_samples[decoder.uuid]
+
+
+def test_consecutive_frames_lose_nothing():
+    assert feed([0, 2, 4, 6]) == 0
+
+
+def test_gap_counts_missing_samples():
+    assert feed([0, 2, 8]) == 4
+
+
+def test_wraparound_is_not_loss():
+    assert feed([0xFFFC, 0xFFFE, 0, 2]) == 0
+    assert feed([0xFFFE, 4]) == 4
+
+
+def test_duplicate_frame_is_not_loss():
+    assert feed([0, 2, 2, 4]) == 0
+
+
+def test_late_frame_does_not_rewind_expected_sequence():
+    # 2 arrives after 4: the gap is counted once and the late frame adds nothing
+    assert feed([0, 4, 2, 6]) == 2
+
+
+def test_every_frame_is_buffered():
+    service, decoder, handler = flex_handler()
+    reader = service.buffers[decoder.uuid].reader()
+    handler(None, frame(decoder, 10, 3))
+    handler(None, frame(decoder, 10, 3))  # Duplicate
+    rows = reader.read()
+    assert len(rows) == 6
+    assert np.all(rows['t'] > 0)
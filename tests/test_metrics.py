@@ -0,0 +1,81 @@
+import pytest
+from src.model.metrics import Histogram, StreamMetrics
+from src.model.metrics_server import MetricsServer
+
+
+@pytest.mark.parametrize("value, bucket", [
+    (0.0, 0),
+    (0.0009, 0),
+    (0.001, 1),  # Lower bound belongs to the bucket above
+    (0.0019, 1),
+    (0.002, 2),
+    (0.003, 2),
+    (0.004, 3),
+    (0.001 * 2 ** 11, 12),  # Last bucket, unbounded
+    (10.0, 12),
+])
+def test_histogram_bucket_edges(value, bucket):
+    histogram = Histogram(first=0.001, buckets=12)
+    histogram.observe(value)
+    assert histogram.counts.index(1) == bucket
+    assert histogram.count == 1
+
+
+def test_histogram_quantile():
+    histogram = Histogram(first=0.001, buckets=4)
+    assert histogram.quantile(0.5) is None
+    for value in (0.0005, 0.0015, 0.0015, 0.003):
+        histogram.observe(value)
+    assert histogram.bounds() == [0.001, 0.002, 0.004, 0.008]
+    assert histogram.quantile(0.25) == 0.001
+    assert histogram.quantile(0.5) == 0.002
+    assert histogram.quantile(0.75) == 0.002
+    assert histogram.quantile(1.0) == 0.004
+    histogram.observe(1.0)
+    assert histogram.quantile(1.0) == 0.008  # Last bucket reports its lower bound
+
+
+def feed(metrics, start, times, consumer=None):
+    """Record notifications at start + times, optionally snapshotting after each one"""
+    for t in times:
+        metrics.record(start + t)
+        if consumer:
+            metrics.snapshot(start + t)
+
+
+def test_snapshot_does_not_reset_the_rate_window():
+    times = [i * 0.01 for i in range(1, 101)] + [1.0 + i * 0.02 for i in range(1, 51)]  # 100 Hz, then 50 Hz
+    alone, shared = StreamMetrics("IMU1"), StreamMetrics("IMU1")
+    shared._window_start = start = alone._window_start
+    feed(alone, start, times)
+    feed(shared, start, times, consumer=True)  # E.g. the diagnostics panel polling between scrapes
+    assert alone.snapshot(start + 2.0)['rate'] == pytest.approx(50.0)
+    assert shared.snapshot(start + 2.0)['rate'] == pytest.approx(50.0)
+    assert alone.snapshot(start + 4.0)['rate'] == 0.0  # Stalled since 2 s
+
+
+def test_render_prometheus_text():
+    snapshot = {
+        'streams': [{
+            'name': "IMU1", 'device': "AA:BB", 'notifications': 3, 'samples': 6, 'rate': 2.5,
+            'decode_errors': 0, 'lost': 1, 'value': None,
+            'interarrival': {'bounds': [0.001, 0.002], 'counts': [1, 1, 0], 'count': 2, 'sum': 0.0025},
+            'decode': {'bounds': [0.001], 'counts': [0, 0], 'count': 0, 'sum': 0.0},
+        }],
+        'gauges': {"imu-logger queue": 4},
+        'counters': [{'name': "connects", 'labels': {'device': 'AA"BB'}, 'value': 2}],
+        'histograms': {},
+    }
+    lines = MetricsServer.render(snapshot).splitlines()
+    assert "# TYPE glove_notifications_total counter" in lines
+    assert 'glove_notifications_total{device="AA:BB",characteristic="IMU1"} 3' in lines
+    assert 'glove_notification_rate{device="AA:BB",characteristic="IMU1"} 2.5' in lines
+    assert 'glove_notification_interarrival_seconds_bucket{device="AA:BB",characteristic="IMU1",le="0.002"} 2' in lines
+    assert 'glove_notification_interarrival_seconds_bucket{device="AA:BB",characteristic="IMU1",le="+Inf"} 2' in lines
+    assert "glove_imu_logger_queue 4" in lines
+    assert 'glove_connects_total{device="AA\\"BB"} 2' in lines
+    assert lines[-1] != "# EOF"
+
+    openmetrics = MetricsServer.render(snapshot, openmetrics=True).splitlines()
+    assert "# TYPE glove_notifications counter" in openmetrics
+    assert openmetrics[-1] == "# EOF"
@@ -0,0 +1,51 @@
+import asyncio
+import time
+import types
+import pytest
+from src.config.app_config import AppConfig
+from src.model import rate_autotune
+from src.model.device_config import DeviceConfig
+from src.model.esp32_service import ESP32BLEService
+from src.model.rate_autotune import RateAutoTuner
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(AppConfig(), "AUTOTUNE_SETTLE_TIME", 0)
+    monkeypatch.setattr(AppConfig(), "AUTOTUNE_WINDOW", 0)
+    clock = iter([0.0, 1.0])  # One second measured
+    monkeypatch.setattr(rate_autotune, "time", types.SimpleNamespace(monotonic=lambda: next(clock), time=time.time))
+    return ESP32BLEService.create_session()
+
+
+def measure(service, tuner, config, delivery):
+    """Measure one window in which every stream delivers delivery(expected) samples"""
+    async def deliver():
+        await asyncio.sleep(0)
+        for uuid in tuner._stream_uuids():
+            service.buffers[uuid].total += delivery(tuner._expected_rate(uuid, config))
+
+    async def run():
+        task = asyncio.create_task(deliver())
+        step = await tuner._measure(config, 4)
+        await task
+        return step
+
+    return asyncio.run(run())
+
+
+def config_104hz():
+    return DeviceConfig(cmd=DeviceConfig.CMD_RUN, imu1_accel_gyro_freq=4, imu2_accel_gyro_freq=4, sensor_interval=20)
+
+
+@pytest.mark.parametrize("delivered, ok", [(100, False), (101, True), (104, True)])
+def test_ok_agrees_with_ratio(service, delivered, ok):
+    tuner = RateAutoTuner(service, target=0.98)
+    step = measure(service, tuner, config_104hz(), lambda expected: delivered if expected == 104 else round(expected))
+    assert step.ok is ok
+    assert (step.ratio >= tuner.target) is ok
+
+
+def test_zero_target_is_kept(service):
+    assert RateAutoTuner(service, target=0).target == 0
+    assert RateAutoTuner(service).target == AppConfig().AUTOTUNE_TARGET_RATIO
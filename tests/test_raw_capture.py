@@ -0,0 +1,21 @@
+from src.config.app_config import AppConfig
+from src.model.esp32_service import ESP32BLEService
+from src.model.raw_capture import RawCaptureWriter, RawCaptureReader, CHUNK_RECORDS
+
+
+def test_capture_keeps_payloads_beyond_the_log_queue_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(AppConfig(), "LOG_QUEUE_MAX_ROWS", CHUNK_RECORDS)
+    monkeypatch.setattr(AppConfig(), "LOG_FLUSH_ROWS", 10 * CHUNK_RECORDS)  # Writer thread stays idle
+    monkeypatch.setattr(AppConfig(), "LOG_FLUSH_INTERVAL", 60.0)
+    service = ESP32BLEService.create_session()
+    path = str(tmp_path / "notifications.raw")
+    writer = RawCaptureWriter(service, path)
+    assert writer.start()
+    count = 4 * CHUNK_RECORDS
+    for i in range(count):
+        writer.record(service.FLEX_SENSOR_UUID, i.to_bytes(2, 'little'))
+    writer.stop()
+
+    assert writer.get_stats()['dropped'] == 0
+    payloads = [payload for _, _, payload in RawCaptureReader(path)]
+    assert [int.from_bytes(payload, 'little') for payload in payloads] == list(range(count))
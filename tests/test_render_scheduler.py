@@ -0,0 +1,55 @@
+import threading
+import pytest
+from src.presenter.render_scheduler import RenderScheduler
+
+
+class FakeWidget:
+    """Tk widget stand-in, frames run when the test calls tick()"""
+
+    def __init__(self):
+        self.callback = None
+
+    def after(self, ms, callback):
+        self.callback = callback
+        return "after"
+
+    def after_cancel(self, after_id):
+        self.callback = None
+
+    def tick(self):
+        self.callback()
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RenderScheduler()
+    scheduler.stop()
+    scheduler._stopped = False  # As before the first start()
+    yield scheduler
+    scheduler.stop()
+    scheduler._renderers.clear()
+
+
+def test_submit_before_start_waits_for_the_tk_thread(scheduler):
+    rendered = []
+    scheduler.register("imu1", lambda sample: rendered.append((sample, threading.current_thread())))
+    worker = threading.Thread(target=scheduler.submit, args=("imu1", "sample"))
+    worker.start()
+    worker.join()
+    assert rendered == []
+
+    widget = FakeWidget()
+    scheduler.start(widget)
+    widget.tick()
+    assert rendered == [("sample", threading.current_thread())]
+
+
+def test_submit_after_stop_is_dropped(scheduler):
+    rendered = []
+    scheduler.register("imu1", rendered.append)
+    scheduler.start(FakeWidget())
+    scheduler.stop()
+    dropped = scheduler.dropped["imu1"]
+    scheduler.submit("imu1", "sample", count=3)
+    assert rendered == []
+    assert scheduler.dropped["imu1"] == dropped + 3
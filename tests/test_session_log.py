@@ -0,0 +1,101 @@
+import csv
+import numpy as np
+import pytest
+from src.model.imu import IMUData
+from src.model.session_log import (SessionWriter, SessionReader, open_session, export_session_csv,
+                                   ALIGNMENT, EXTENSION)
+
+DTYPE = np.dtype([('t', '<f8'), ('x', '<i2'), ('y', '<f4')])
+
+
+def records(count, start=0):
+    rows = np.zeros(count, dtype=DTYPE)
+    rows['t'] = np.arange(start, start + count) * 0.01
+    rows['x'] = np.arange(start, start + count)
+    rows['y'] = np.arange(start, start + count) * 0.5
+    return rows
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / ("imu1" + EXTENSION)
+    metadata = {'preset': "208 Hz capture", 'config': {'cmd': 1}}
+    writer = SessionWriter(str(path), "imu1", DTYPE, metadata=metadata)
+    writer.append(records(3))
+    writer.append(records(0))
+    writer.append(records(2, start=3))
+    writer.close()
+    assert writer.records == 5
+
+    reader = SessionReader(str(path))
+    assert reader.stream == "imu1"
+    assert reader.metadata == metadata
+    assert reader.columns == ['t', 'x', 'y']
+    assert reader.dtype == DTYPE
+    assert reader.data_offset % ALIGNMENT == 0
+    assert len(reader) == 5
+    np.testing.assert_array_equal(reader.records, records(5))
+
+
+def test_reader_slices_without_copying(tmp_path):
+    path = tmp_path / ("imu1" + EXTENSION)
+    writer = SessionWriter(str(path), "imu1", DTYPE)
+    writer.append(records(10))
+    writer.close()
+    reader = SessionReader(str(path))
+    assert isinstance(reader.records, np.memmap)
+    window = reader[2:5]
+    assert np.shares_memory(window, reader.records)
+    np.testing.assert_array_equal(window['x'], [2, 3, 4])
+
+
+def test_append_converts_dtype(tmp_path):
+    path = tmp_path / ("imu1" + EXTENSION)
+    writer = SessionWriter(str(path), "imu1", DTYPE)
+    wide = np.zeros(2, dtype=[('y', '<f8'), ('x', '<i8'), ('t', '<f8'), ('extra', '<i4')])
+    wide['x'] = [7, 8]
+    wide['y'] = [1.5, 2.5]
+    writer.append(wide)
+    writer.close()
+    reader = SessionReader(str(path))
+    assert reader[1]['x'] == 8
+    assert reader[1]['y'] == 2.5
+
+
+def test_partial_record_is_ignored(tmp_path):
+    path = tmp_path / ("imu1" + EXTENSION)
+    writer = SessionWriter(str(path), "imu1", DTYPE)
+    writer.append(records(4))
+    writer.close()
+    with open(path, 'ab') as f:
+        f.write(b'\x01\x02\x03')  # Interrupted write
+    assert len(SessionReader(str(path))) == 4
+
+
+def test_empty_stream(tmp_path):
+    path = tmp_path / ("imu1" + EXTENSION)
+    SessionWriter(str(path), "imu1", DTYPE).close()
+    assert len(SessionReader(str(path))) == 0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "imu1.csv"
+    path.write_text("t,x,y\n")
+    with pytest.raises(ValueError):
+        SessionReader(str(path))
+
+
+def test_sample_dtype_and_csv_export(tmp_path):
+    rows = np.zeros(2, dtype=IMUData.DTYPE)
+    rows['ax'] = [5, -10]
+    writer = SessionWriter(str(tmp_path / ("imu1" + EXTENSION)), "imu1", IMUData.DTYPE,
+                           columns=[f"col_{name}" for name in IMUData.DTYPE.names])
+    writer.append(rows)
+    writer.close()
+    SessionWriter(str(tmp_path / ("imu2" + EXTENSION)), "imu2", IMUData.DTYPE).close()
+
+    assert set(open_session(str(tmp_path))) == {"imu1", "imu2"}
+    written = export_session_csv(str(tmp_path))
+    assert written == {str(tmp_path / "imu1.csv"): 2, str(tmp_path / "imu2.csv"): 0}
+    with open(tmp_path / "imu1.csv", newline='') as f:
+        table = list(csv.DictReader(f))
+    assert [int(row['col_ax']) for row in table] == [5, -10]
@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+from src.config.app_config import AppConfig
+from src.model.esp32_service import ESP32BLEService
+from src.model.session_recorder import SessionRecorder
+
+
+class FakeClient:
+    """BleakClient stand-in that tracks notify handlers"""
+
+    def __init__(self):
+        self.handlers = {}
+        self.stopped = []
+
+    async def start_notify(self, uuid, handler):
+        self.handlers[uuid] = handler
+
+    async def stop_notify(self, uuid):
+        self.handlers.pop(uuid, None)
+        self.stopped.append(uuid)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(AppConfig(), "SUBSCRIBE_MODE", "concurrent")  # No settle delays
+    service = ESP32BLEService.create_session()
+    service.client = FakeClient()
+    service.is_connected = lambda: True
+    return service
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_recording_keeps_a_presenter_stream(service, tmp_path):
+    async def scenario():
+        recorder = SessionRecorder(service, str(tmp_path))
+        assert await recorder.start()
+        assert await service.start_imu1_notify()  # Presenter, buffer-only like IMUPresenter
+        await recorder.stop()
+
+    run(scenario())
+    assert service.IMU1_CHAR_UUID in service.notifying
+    assert service.IMU1_CHAR_UUID not in service.client.stopped
+    assert service.FLEX_SENSOR_UUID not in service.notifying  # Only held by the recorder
+
+
+def test_presenter_stop_keeps_a_recorded_stream(service, tmp_path):
+    async def scenario():
+        assert await service.start_flex_sensor_notify()
+        recorder = SessionRecorder(service, str(tmp_path))
+        assert await recorder.start()
+        assert await service.stop_flex_sensor_notify()
+        still_notifying = service.FLEX_SENSOR_UUID in service.notifying
+        await recorder.stop()
+        return still_notifying
+
+    assert run(scenario())
+    assert service.FLEX_SENSOR_UUID not in service.notifying
+    assert service.client.stopped.count(service.FLEX_SENSOR_UUID) == 1
+
+
+def test_shared_stream_subscribes_once(service, tmp_path):
+    async def scenario():
+        assert await service.start_imu1_notify()
+        handler = service.client.handlers[service.IMU1_CHAR_UUID]
+        recorder = SessionRecorder(service, str(tmp_path))
+        assert await recorder.start()
+        return handler
+
+    handler = run(scenario())
+    assert service.client.handlers[service.IMU1_CHAR_UUID] is handler
+
+
+def test_callback_of_a_released_owner_is_dropped(service, tmp_path):
+    calls = []
+
+    async def callback(sender, sample):
+        calls.append(sample)
+
+    async def scenario():
+        recorder = SessionRecorder(service, str(tmp_path))
+        assert await recorder.start()
+        assert await service.start_stream_notify(service.FORCE_SENSOR_UUID, callback, owner="debug")
+        await service.stop_stream_notify(service.FORCE_SENSOR_UUID, owner="debug")
+        payload = bytes(service.DECODERS[service.FORCE_SENSOR_UUID.lower()].data_class.STRUCT.size)
+        result = service.client.handlers[service.FORCE_SENSOR_UUID](None, payload)
+        if asyncio.iscoroutine(result):
+            await result
+        await recorder.stop()
+
+    run(scenario())
+    assert calls == []
+    assert service.FORCE_SENSOR_UUID not in service.notifying